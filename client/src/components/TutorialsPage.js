@@ -4,9 +4,16 @@ import '../styles/TutorialsPage.css';
 const TutorialsPage = () => {
   const [tutorials, setTutorials] = useState([]);
   const [selectedTutorial, setSelectedTutorial] = useState(null);
+  const [liked, setLiked] = useState(false);
   const [loading, setLoading] = useState(true);
+  const [nextCursor, setNextCursor] = useState(null);
+  const [facets, setFacets] = useState(null);
   const [filter, setFilter] = useState('all');
   const [searchTerm, setSearchTerm] = useState('');
+  const [searchResults, setSearchResults] = useState(null);
+  const [searchFacets, setSearchFacets] = useState(null);
+  const [searchPage, setSearchPage] = useState(1);
+  const [searchPages, setSearchPages] = useState(0);
   const [showQueryForm, setShowQueryForm] = useState(false);
   const [queryForm, setQueryForm] = useState({
     title: '',
@@ -17,14 +24,38 @@ const TutorialsPage = () => {
 
   useEffect(() => {
     fetchTutorials();
-  }, []);
+  }, [filter]);
 
-  const fetchTutorials = async () => {
+  // Search runs on the server; debounce keystrokes before querying
+  useEffect(() => {
+    if (!searchTerm.trim()) {
+      setSearchResults(null);
+      setSearchFacets(null);
+      return;
+    }
+    const timer = setTimeout(() => searchTutorials(1), 300);
+    return () => clearTimeout(timer);
+  }, [searchTerm, filter]);
+
+  const fetchTutorials = async (cursor = null) => {
     try {
-      const response = await fetch('http://localhost:5000/trainer/public/tutorials');
+      const params = new URLSearchParams();
+      if (cursor) {
+        params.set('cursor', cursor);
+      } else if (!facets) {
+        params.set('include', 'facets');
+      }
+      if (filter !== 'all') {
+        params.set('category', filter);
+      }
+      const response = await fetch(`http://localhost:5000/trainer/public/tutorials?${params}`);
       if (response.ok) {
         const data = await response.json();
-        setTutorials(data.tutorials);
+        setTutorials(prev => cursor ? [...prev, ...data.tutorials] : data.tutorials);
+        setNextCursor(data.next_cursor || null);
+        if (data.facets) {
+          setFacets(data.facets);
+        }
       }
       setLoading(false);
     } catch (error) {
@@ -33,18 +64,78 @@ const TutorialsPage = () => {
     }
   };
 
+  const searchTutorials = async (page) => {
+    try {
+      const params = new URLSearchParams({ q: searchTerm.trim(), page });
+      if (filter !== 'all') {
+        params.set('category', filter);
+      }
+      const response = await fetch(`http://localhost:5000/trainer/public/tutorials/search?${params}`);
+      if (response.ok) {
+        const data = await response.json();
+        setSearchResults(prev => page > 1 && prev ? [...prev, ...data.tutorials] : data.tutorials);
+        setSearchFacets(data.facets);
+        setSearchPage(data.page);
+        setSearchPages(data.pages);
+      }
+    } catch (error) {
+      console.error('Error searching tutorials:', error);
+    }
+  };
+
   const fetchTutorialDetails = async (tutorialId) => {
     try {
       const response = await fetch(`http://localhost:5000/trainer/public/tutorials/${tutorialId}`);
       if (response.ok) {
         const data = await response.json();
         setSelectedTutorial(data.tutorial);
+        setLiked(false);
+        fetchLikeState(tutorialId);
       }
     } catch (error) {
       console.error('Error fetching tutorial details:', error);
     }
   };
 
+  const fetchLikeState = async (tutorialId) => {
+    const token = localStorage.getItem('token');
+    if (!token) {
+      return;
+    }
+    try {
+      const response = await fetch(`http://localhost:5000/trainer/public/tutorials/${tutorialId}/like`, {
+        headers: { 'Authorization': `Bearer ${token}` }
+      });
+      if (response.ok) {
+        const data = await response.json();
+        setLiked(data.liked);
+      }
+    } catch (error) {
+      console.error('Error fetching like state:', error);
+    }
+  };
+
+  const toggleLike = async () => {
+    const token = localStorage.getItem('token');
+    if (!token) {
+      alert('Please login to like tutorials');
+      return;
+    }
+    try {
+      const response = await fetch(`http://localhost:5000/trainer/public/tutorials/${selectedTutorial.id}/like`, {
+        method: liked ? 'DELETE' : 'POST',
+        headers: { 'Authorization': `Bearer ${token}` }
+      });
+      if (response.ok) {
+        const data = await response.json();
+        setLiked(data.liked);
+        setSelectedTutorial(prev => ({ ...prev, likes: data.likes }));
+      }
+    } catch (error) {
+      console.error('Error updating like:', error);
+    }
+  };
+
   const handleSubmitQuery = async (e) => {
     e.preventDefault();
     try {
@@ -88,15 +179,11 @@ const TutorialsPage = () => {
     }
   };
 
-  const filteredTutorials = tutorials.filter(tutorial => {
-    const matchesFilter = filter === 'all' || tutorial.category === filter;
-    const matchesSearch = tutorial.title.toLowerCase().includes(searchTerm.toLowerCase()) ||
-                         tutorial.description.toLowerCase().includes(searchTerm.toLowerCase()) ||
-                         tutorial.tags.some(tag => tag.toLowerCase().includes(searchTerm.toLowerCase()));
-    return matchesFilter && matchesSearch;
-  });
+  const filteredTutorials = searchResults !== null ? searchResults : tutorials;
 
-  const categories = ['all', ...new Set(tutorials.map(t => t.category))];
+  // Category counts come from the server-side facets, for search results or the whole catalogue
+  const categoryCounts = (searchFacets || facets)?.category || {};
+  const categories = ['all', ...new Set([...Object.keys(categoryCounts), ...(filter !== 'all' ? [filter] : [])])];
 
   if (loading) {
     return <div className="loading">Loading tutorials...</div>;
@@ -133,6 +220,7 @@ const TutorialsPage = () => {
               onClick={() => setFilter(category)}
             >
               {category.charAt(0).toUpperCase() + category.slice(1)}
+              {categoryCounts[category] !== undefined && ` (${categoryCounts[category]})`}
             </button>
           ))}
         </div>
@@ -178,6 +266,28 @@ const TutorialsPage = () => {
         )}
       </div>
 
+      {searchResults !== null && searchPage < searchPages && (
+        <div className="load-more">
+          <button
+            className="view-tutorial-btn"
+            onClick={() => searchTutorials(searchPage + 1)}
+          >
+            Load More Results
+          </button>
+        </div>
+      )}
+
+      {searchResults === null && nextCursor && (
+        <div className="load-more">
+          <button
+            className="view-tutorial-btn"
+            onClick={() => fetchTutorials(nextCursor)}
+          >
+            Load More Tutorials
+          </button>
+        </div>
+      )}
+
       {/* Tutorial Modal */}
       {selectedTutorial && (
         <div className="tutorial-modal" onClick={() => setSelectedTutorial(null)}>
@@ -229,6 +339,9 @@ const TutorialsPage = () => {
                 <div className="tutorial-stats">
                   <span>👁️ {selectedTutorial.views} views</span>
                   <span>❤️ {selectedTutorial.likes} likes</span>
+                  <button className="view-tutorial-btn" onClick={toggleLike}>
+                    {liked ? 'Unlike' : 'Like'}
+                  </button>
                 </div>
                 <div className="trainer-info">
                   <span>By: {selectedTutorial.trainer_name}</span>
@@ -12,6 +12,9 @@ const AdminHomePage = () => {
   const [showTrainerForm, setShowTrainerForm] = useState(false);
   const [trainerApplications, setTrainerApplications] = useState([]);
   const [applicationsLoading, setApplicationsLoading] = useState(false);
+  const [applicationStatus, setApplicationStatus] = useState('pending');
+  const [applicationCounts, setApplicationCounts] = useState({});
+  const [applicationsCursor, setApplicationsCursor] = useState(null);
   const [trainerForm, setTrainerForm] = useState({
     firstName: '',
     lastName: '',
@@ -81,19 +84,29 @@ const AdminHomePage = () => {
     navigate('/');
   };
 
-  const fetchTrainerApplications = async () => {
+  // First page for the selected status, or the next page when a cursor is given
+  const fetchTrainerApplications = async (status = applicationStatus, cursor = null) => {
     setApplicationsLoading(true);
     try {
-      const response = await axios.get('http://localhost:5000/trainer/applications');
-      setTrainerApplications(response.data.applications || []);
+      const params = { status: status === 'all' ? undefined : status, cursor: cursor || undefined };
+      const response = await axios.get('http://localhost:5000/trainer/applications', { params });
+      const page = response.data.applications || [];
+      setTrainerApplications(previous => (cursor ? [...previous, ...page] : page));
+      setApplicationsCursor(response.data.next_cursor || null);
+      setApplicationCounts(response.data.counts || {});
     } catch (error) {
       console.error('Error fetching trainer applications:', error);
-      setTrainerApplications([]);
+      if (!cursor) setTrainerApplications([]);
     } finally {
       setApplicationsLoading(false);
     }
   };
 
+  const handleApplicationStatusChange = (status) => {
+    setApplicationStatus(status);
+    fetchTrainerApplications(status);
+  };
+
   const handleApproveApplication = async (applicationId) => {
     try {
       const response = await axios.post(`http://localhost:5000/trainer/applications/${applicationId}/approve`, {
@@ -103,7 +116,7 @@ const AdminHomePage = () => {
       
       if (response.data.success) {
         alert('Trainer application approved successfully!');
-        fetchTrainerApplications(); // Refresh the list
+        fetchTrainerApplications(); // Refresh the current view
         
         // Also refresh users list to show new trainer
         const usersResponse = await axios.get('http://localhost:5000/users');
@@ -129,7 +142,7 @@ const AdminHomePage = () => {
       
       if (response.data.success) {
         alert('Trainer application rejected.');
-        fetchTrainerApplications(); // Refresh the list
+        fetchTrainerApplications(); // Refresh the current view
       } else {
         alert('Error rejecting application: ' + response.data.message);
       }
@@ -139,6 +152,34 @@ const AdminHomePage = () => {
     }
   };
 
+  const handleApproveAllPending = async () => {
+    const pendingIds = trainerApplications
+      .filter(application => application.status === 'pending')
+      .map(application => application.id);
+    if (pendingIds.length === 0) return;
+    if (!window.confirm(`Approve all ${pendingIds.length} pending applications?`)) return;
+
+    try {
+      const response = await axios.post('http://localhost:5000/trainer/applications/review', {
+        action: 'approve',
+        application_ids: pendingIds,
+        admin_email: 'admin@fithub.com',
+        admin_notes: 'Approved through admin dashboard'
+      });
+      
+      const failures = response.data.results.filter(result => !result.success);
+      alert(`Approved ${response.data.succeeded} applications.` +
+        (failures.length ? `\n${failures.length} not approved: ${failures.map(result => result.message).join(', ')}` : ''));
+      fetchTrainerApplications(); // Refresh the current view
+      
+      const usersResponse = await axios.get('http://localhost:5000/users');
+      setUsers(usersResponse.data.users || []);
+    } catch (error) {
+      console.error('Error approving applications:', error);
+      alert('Error approving applications: ' + (error.response?.data?.message || 'Unknown error'));
+    }
+  };
+
   const handleCreateTrainer = async (e) => {
     e.preventDefault();
     try {
@@ -600,13 +641,30 @@ const AdminHomePage = () => {
         <h2>Trainer Applications</h2>
         <div className="header-actions">
           <input type="search" placeholder="Search applications..." className="search-input" />
+          <select
+            className="filter-select"
+            value={applicationStatus}
+            onChange={(e) => handleApplicationStatusChange(e.target.value)}
+          >
+            <option value="pending">⏳ Pending ({applicationCounts.pending || 0})</option>
+            <option value="approved">✅ Approved ({applicationCounts.approved || 0})</option>
+            <option value="rejected">❌ Rejected ({applicationCounts.rejected || 0})</option>
+            <option value="all">All</option>
+          </select>
           <button 
             className="btn-secondary"
-            onClick={fetchTrainerApplications}
+            onClick={() => fetchTrainerApplications()}
             disabled={applicationsLoading}
           >
             {applicationsLoading ? '🔄 Loading...' : '🔄 Refresh'}
           </button>
+          <button 
+            className="btn-primary"
+            onClick={handleApproveAllPending}
+            disabled={applicationsLoading || !trainerApplications.some(application => application.status === 'pending')}
+          >
+            ✅ Approve All Pending
+          </button>
         </div>
       </div>
       
@@ -741,6 +799,18 @@ const AdminHomePage = () => {
           ))}
         </div>
       )}
+      
+      {applicationsCursor && (
+        <div className="load-more">
+          <button
+            className="btn-secondary"
+            onClick={() => fetchTrainerApplications(applicationStatus, applicationsCursor)}
+            disabled={applicationsLoading}
+          >
+            {applicationsLoading ? '🔄 Loading...' : 'Load More'}
+          </button>
+        </div>
+      )}
     </div>
   );
 
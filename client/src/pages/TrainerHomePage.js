@@ -58,13 +58,18 @@ const TrainerHomePage = () => {
         setTutorials(tutorialsData.tutorials);
       }
 
-      // Fetch queries
-      const queriesResponse = await fetch('http://localhost:5000/trainer/queries', {
-        headers: { 'Authorization': `Bearer ${token}` }
-      });
-      if (queriesResponse.ok) {
-        const queriesData = await queriesResponse.json();
-        setQueries(queriesData.queries);
+      // Fetch queries: my inbox and the unassigned pool (first page of each)
+      const [mineResponse, unassignedResponse] = await Promise.all(
+        ['mine', 'unassigned'].map(view =>
+          fetch(`http://localhost:5000/trainer/queries?view=${view}`, {
+            headers: { 'Authorization': `Bearer ${token}` }
+          })
+        )
+      );
+      if (mineResponse.ok && unassignedResponse.ok) {
+        const mineData = await mineResponse.json();
+        const unassignedData = await unassignedResponse.json();
+        setQueries([...mineData.queries, ...unassignedData.queries]);
       }
 
       setLoading(false);
@@ -127,17 +132,42 @@ const TrainerHomePage = () => {
 
       if (response.ok) {
         alert('Query assigned successfully!');
-        fetchTrainerData(); // Refresh data
       } else {
         const error = await response.json();
         alert('Error assigning query: ' + error.msg);
       }
+      fetchTrainerData(); // Refresh data (another trainer may have claimed it)
     } catch (error) {
       console.error('Error assigning query:', error);
       alert('Error assigning query');
     }
   };
 
+  const handleClaimNext = async (count) => {
+    try {
+      const token = localStorage.getItem('token');
+      const response = await fetch('http://localhost:5000/trainer/queries/claim', {
+        method: 'POST',
+        headers: {
+          'Content-Type': 'application/json',
+          'Authorization': `Bearer ${token}`
+        },
+        body: JSON.stringify({ count })
+      });
+
+      const data = await response.json();
+      if (response.ok) {
+        alert(data.queries.length ? `Claimed ${data.queries.length} queries` : 'No open queries to claim');
+        fetchTrainerData(); // Refresh data
+      } else {
+        alert('Error claiming queries: ' + data.msg);
+      }
+    } catch (error) {
+      console.error('Error claiming queries:', error);
+      alert('Error claiming queries');
+    }
+  };
+
   const handleRespondToQuery = async (e) => {
     e.preventDefault();
     try {
@@ -397,6 +427,9 @@ const TrainerHomePage = () => {
         {activeTab === 'queries' && (
           <div className="queries-section">
             <h2>User Queries</h2>
+            <button onClick={() => handleClaimNext(5)} className="assign-btn">
+              Claim Next 5
+            </button>
             <div className="queries-list">
               {queries.length === 0 ? (
                 <p>No queries available.</p>
@@ -0,0 +1,282 @@
+from models import users_collection, trainer_applications_collection, stats_collection
+from index_specs import APPLICATIONS_INDEX
+from pymongo.errors import DuplicateKeyError
+from datetime import datetime, timedelta
+import os
+import threading
+
+# Single materialized document holding the admin dashboard user counters:
+# {
+#   _id: 'users',
+#   total: 120,
+#   active: 45,                  # signed in within ACTIVE_USER_DAYS, as of rebuilt_at
+#   by_role: {admin: 2, user: 100, trainer: 18},
+#   signups: {'2024-01-15': 4, '2024-01-16': 7, ...},   # last NEW_SIGNUP_DAYS days only
+#   rebuilt_at: ISODate(...)
+# }
+#
+# Inserts made by the app and the admin scripts are counted as they happen
+# (record_user_created). Anything else (deletes, role changes, edits made
+# directly in the database) is only picked up by a rebuild. Reads never wait
+# for one unless the document has never been built: once it is older than
+# USER_STATS_MAX_AGE the current document is served and one worker (whoever
+# takes the rebuild lease) recomputes it on a background thread, so counts
+# lag by at most USER_STATS_MAX_AGE plus one rebuild. An increment landing
+# while a rebuild runs can be overwritten by it; the next rebuild restores it.
+USER_STATS_ID = 'users'
+NEW_SIGNUP_DAYS = 7
+USER_STATS_MAX_AGE = float(os.getenv('USER_STATS_MAX_AGE', '300'))
+ACTIVE_USER_DAYS = int(os.getenv('ACTIVE_USER_DAYS', '30'))
+# A rebuild lease outlives a crashed rebuilder by at most this long
+STATS_REBUILD_LEASE = float(os.getenv('STATS_REBUILD_LEASE', '120'))
+
+
+def _day(value):
+    """Return the YYYY-MM-DD bucket for a datetime or ISO string"""
+    if isinstance(value, datetime):
+        return value.strftime('%Y-%m-%d')
+    return str(value)[:10]
+
+
+def user_created_increments(role, created_at=None, count=1):
+    """$inc document counting `count` newly inserted users"""
+    created_at = created_at or datetime.utcnow()
+    return {
+        'total': count,
+        f'by_role.{role}': count,
+        f'signups.{_day(created_at)}': count
+    }
+
+
+def record_user_created(role, created_at=None, count=1):
+    """Write hook: count newly inserted users in the stats document"""
+    increments = user_created_increments(role, created_at, count)
+    try:
+        stats_collection.update_one({'_id': USER_STATS_ID}, {'$inc': increments}, upsert=True)
+    except Exception as e:
+        # Stats are advisory; never fail the write that triggered them
+        print(f"⚠️  Could not update user stats: {str(e)}")
+
+
+def login_update(now=None):
+    """$set document marking a successful sign-in (feeds the active user count)"""
+    return {'$set': {'lastLoginAt': now or datetime.utcnow()}}
+
+
+def record_user_login(user_id):
+    """Write hook: remember when a user last signed in"""
+    try:
+        users_collection.update_one({'_id': user_id}, login_update())
+    except Exception as e:
+        print(f"⚠️  Could not record sign-in: {str(e)}")
+
+
+def signups_since(now=None):
+    """First day kept in the per-day signups map"""
+    return _day((now or datetime.utcnow()) - timedelta(days=NEW_SIGNUP_DAYS - 1))
+
+
+def user_stats_pipeline(now=None):
+    """One pass over users for role counts, recently active users and signups per day"""
+    now = now or datetime.utcnow()
+    return [
+        {'$facet': {
+            'by_role': [
+                {'$group': {'_id': {'$ifNull': ['$role', 'user']}, 'count': {'$sum': 1}}}
+            ],
+            'active': [
+                {'$match': {'lastLoginAt': {'$gte': now - timedelta(days=ACTIVE_USER_DAYS)}}},
+                {'$count': 'count'}
+            ],
+            'signups': [
+                {'$match': {'createdAt': {'$ne': None}}},
+                {'$group': {
+                    '_id': {'$substrCP': [{'$toString': '$createdAt'}, 0, 10]},
+                    'count': {'$sum': 1}
+                }},
+                # Only the days count_new_signups reports; YYYY-MM-DD compares as a string
+                {'$match': {'_id': {'$gte': signups_since(now)}}}
+            ]
+        }}
+    ]
+
+
+def stats_from_facet(result):
+    """Turn the user_stats_pipeline() result into a stats document"""
+    by_role = {row['_id']: row['count'] for row in result['by_role']}
+    stats = {
+        'total': sum(by_role.values()),
+        'active': result['active'][0]['count'] if result['active'] else 0,
+        'by_role': by_role,
+        'signups': {row['_id']: row['count'] for row in result['signups']},
+        'rebuilt_at': datetime.utcnow()
+    }
+    return stats
+
+
+def stats_are_stale(stats, now=None, max_age=USER_STATS_MAX_AGE):
+    """True when a stats document is missing, was never rebuilt, or is older than max_age seconds"""
+    if not stats or 'rebuilt_at' not in stats:
+        return True
+    return (now or datetime.utcnow()) - stats['rebuilt_at'] > timedelta(seconds=max_age)
+
+
+def claim_rebuild(stats_id, now=None):
+    """Take the fleet-wide lease on rebuilding one stats document; False while another worker holds it"""
+    now = now or datetime.utcnow()
+    try:
+        stats_collection.update_one(
+            {'_id': f'{stats_id}:rebuild_lease', 'expires_at': {'$lte': now}},
+            {'$set': {'expires_at': now + timedelta(seconds=STATS_REBUILD_LEASE), 'pid': os.getpid()}},
+            upsert=True
+        )
+        return True
+    except DuplicateKeyError:
+        # The lease document exists and has not expired
+        return False
+
+
+_rebuilding = {}  # stats id -> pid of the process running its background rebuild
+_rebuilding_lock = threading.Lock()
+
+
+def rebuild_in_background(stats_id, rebuild):
+    """Run `rebuild` on a daemon thread, unless this process is already rebuilding
+    `stats_id` or another worker holds its lease; returns True if a thread started"""
+    with _rebuilding_lock:
+        if _rebuilding.get(stats_id) == os.getpid():
+            return False
+        _rebuilding[stats_id] = os.getpid()
+
+    def run():
+        try:
+            if claim_rebuild(stats_id):
+                rebuild()
+        except Exception as e:
+            print(f"❌ Error rebuilding {stats_id} stats: {str(e)}")
+        finally:
+            with _rebuilding_lock:
+                _rebuilding.pop(stats_id, None)
+
+    threading.Thread(target=run, name=f'{stats_id}-stats-rebuild', daemon=True).start()
+    return True
+
+
+def serve_stats(stats, stats_id, rebuild, max_age):
+    """The stats document to answer with: `stats`, with a background rebuild started
+    when it is stale, or None if it has never been built (the caller rebuilds inline)"""
+    if not stats or 'rebuilt_at' not in stats:
+        return None
+    if stats_are_stale(stats, max_age=max_age):
+        rebuild_in_background(stats_id, rebuild)
+    return stats
+
+
+def rebuild_user_stats():
+    """Recompute the stats document from the users collection in one aggregation"""
+    stats = stats_from_facet(list(users_collection.aggregate(user_stats_pipeline()))[0])
+    stats_collection.replace_one({'_id': USER_STATS_ID}, stats, upsert=True)
+    stats['_id'] = USER_STATS_ID
+    return stats
+
+
+def get_user_stats():
+    """Read the stats document (one small read); built inline only the first time"""
+    stats = stats_collection.find_one({'_id': USER_STATS_ID})
+    return serve_stats(stats, USER_STATS_ID, rebuild_user_stats, USER_STATS_MAX_AGE) or rebuild_user_stats()
+
+
+# Trainer application counts per status, for the admin applications listing:
+# { _id: 'trainer_applications', pending: 3, approved: 12, rejected: 4, rebuilt_at: ISODate(...) }
+#
+# Same scheme as the user stats: submissions and reviews adjust the counters
+# as they happen, and the document is rebuilt from trainer_applications in the
+# background once it is older than APPLICATION_STATS_MAX_AGE, which also picks
+# up anything written outside those hooks (e.g. setup_sample_applications.py).
+APPLICATION_STATS_ID = 'trainer_applications'
+APPLICATION_STATUSES = ['pending', 'approved', 'rejected']
+APPLICATION_STATS_MAX_AGE = float(os.getenv('APPLICATION_STATS_MAX_AGE', '300'))
+APPLICATION_COUNTS_PIPELINE = [
+    {'$match': {'status': {'$in': APPLICATION_STATUSES}}},
+    {'$group': {'_id': '$status', 'count': {'$sum': 1}}}
+]
+
+
+def application_counts(rows):
+    """APPLICATION_COUNTS_PIPELINE rows -> {status: count} for every status"""
+    counts = dict.fromkeys(APPLICATION_STATUSES, 0)
+    counts.update({row['_id']: row['count'] for row in rows})
+    return counts
+
+
+def application_increments(status, previous=None, count=1):
+    """$inc document moving `count` applications into `status` (from `previous`, if any)"""
+    increments = {status: count}
+    if previous:
+        increments[previous] = -count
+    return increments
+
+
+def _record_applications(increments):
+    try:
+        stats_collection.update_one({'_id': APPLICATION_STATS_ID}, {'$inc': increments}, upsert=True)
+    except Exception as e:
+        # Stats are advisory; never fail the write that triggered them
+        print(f"⚠️  Could not update application stats: {str(e)}")
+
+
+def record_application_submitted():
+    """Write hook: count a new pending trainer application"""
+    _record_applications(application_increments('pending'))
+
+
+def record_applications_reviewed(status, count=1):
+    """Write hook: count `count` pending applications moved to 'approved' or 'rejected'"""
+    _record_applications(application_increments(status, 'pending', count))
+
+
+def application_stats_document(rows):
+    """Stats document for the APPLICATION_COUNTS_PIPELINE rows"""
+    return dict(application_counts(rows), rebuilt_at=datetime.utcnow())
+
+
+def rebuild_application_stats():
+    """Recompute the application counts from trainer_applications"""
+    stats = application_stats_document(
+        trainer_applications_collection.aggregate(APPLICATION_COUNTS_PIPELINE, hint=dict(APPLICATIONS_INDEX)))
+    stats_collection.replace_one({'_id': APPLICATION_STATS_ID}, stats, upsert=True)
+    return stats
+
+
+def application_counts_from_stats(stats):
+    """{status: count} for every application status from the counters document"""
+    # A review racing a rebuild can leave a counter briefly one below zero
+    return {status: max(stats.get(status, 0), 0) for status in APPLICATION_STATUSES}
+
+
+def get_application_counts():
+    """{status: count} for every application status; built inline only the first time"""
+    stats = serve_stats(stats_collection.find_one({'_id': APPLICATION_STATS_ID}), APPLICATION_STATS_ID,
+                        rebuild_application_stats, APPLICATION_STATS_MAX_AGE) or rebuild_application_stats()
+    return application_counts_from_stats(stats)
+
+
+def count_new_signups(stats, days=NEW_SIGNUP_DAYS, today=None):
+    """Sum the per-day signup counters over the last `days` days"""
+    today = today or datetime.utcnow()
+    signups = stats.get('signups', {})
+    return sum(signups.get(_day(today - timedelta(days=offset)), 0) for offset in range(days))
+
+
+if __name__ == '__main__':
+    import sys
+
+    if len(sys.argv) > 1 and sys.argv[1] == '--rebuild':
+        stats = rebuild_user_stats()
+        print(f"✅ User stats rebuilt: {stats['total']} users, {stats['active']} active")
+        print(f"   By role: {stats['by_role']}")
+    else:
+        stats = get_user_stats()
+        print(f"📊 Users: {stats.get('total', 0)} total, {stats.get('active', 0)} active")
+        print(f"   By role: {stats.get('by_role', {})}")
+        print(f"   New signups (last {NEW_SIGNUP_DAYS} days): {count_new_signups(stats)}")
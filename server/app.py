@@ -1,22 +1,90 @@
-from flask import Flask
+from flask import Flask, jsonify
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 from flask_jwt_extended import JWTManager
+from config import Config
 from auth import auth_bp
-from trainer import trainer_bp
-from dotenv import load_dotenv
-import os
+from trainer import trainer_bp, tutorial_counters
+from mongo_connection import get_metrics, ping, close_client
+from serializers import FastJSONMixin
+from ensure_indexes import missing_required_indexes, missing_indexes_error
+import password_hashing
+import rankings
+import threading
 
-load_dotenv()
+# Cleared once shutdown starts so load balancers stop routing new requests here
+_accepting_requests = threading.Event()
+_accepting_requests.set()
+# Set once GET /ready has seen every required index
+_indexes_checked = threading.Event()
 
-app = Flask(__name__)
-CORS(app)
 
-app.config['JWT_SECRET_KEY'] = os.getenv('JWT_SECRET')
-app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', 'your-secret-key-here')
-jwt = JWTManager(app)
+class JSONProvider(FastJSONMixin, DefaultJSONProvider):
+    """jsonify() via serializers.dumps (orjson when installed)"""
+
+
+def create_app(config_overrides=None):
+    """Application factory.
+
+    Building the app never touches MongoDB: collections connect lazily on first
+    use, so workers boot quickly and each forked worker gets its own client.
+    The one exception is the opt-in CHECK_INDEXES=1 check for the required
+    unique indexes, which GET /ready otherwise reports.
+    """
+    app = Flask(__name__)
+    app.json = JSONProvider(app)
+    CORS(app)
+
+    app.config.from_object(Config)
+    if config_overrides:
+        app.config.update(config_overrides)
+    JWTManager(app)
+
+    if app.config.get('CHECK_INDEXES'):
+        missing = missing_required_indexes()
+        if missing:
+            raise missing_indexes_error(missing)
+
+    app.register_blueprint(auth_bp)
+    app.register_blueprint(trainer_bp, url_prefix='/trainer')
+
+    @app.route('/metrics/mongo', methods=['GET'])
+    def mongo_metrics():
+        """Connection pool checkout waits and per-command latencies"""
+        metrics = get_metrics()
+        return jsonify(metrics), 200 if metrics['healthy'] else 503
+
+    @app.route('/health', methods=['GET'])
+    def health():
+        """Liveness: the process is up and serving"""
+        return jsonify({'status': 'ok'}), 200
+
+    @app.route('/ready', methods=['GET'])
+    def ready():
+        """Readiness: not shutting down, MongoDB is reachable and has the required indexes"""
+        if not _accepting_requests.is_set():
+            return jsonify({'status': 'shutting_down'}), 503
+        ok, latency_ms = ping()
+        if not ok:
+            return jsonify({'status': 'unavailable', 'mongo_ping_ms': latency_ms}), 503
+        missing = [] if _indexes_checked.is_set() else missing_required_indexes()
+        if missing:
+            return jsonify({'status': 'missing_indexes', 'missing_indexes': missing, 'mongo_ping_ms': latency_ms}), 503
+        # Indexes are not dropped in normal operation; check once per worker
+        _indexes_checked.set()
+        return jsonify({'status': 'ready', 'mongo_ping_ms': latency_ms}), 200
+
+    return app
+
+
+def shutdown():
+    """Graceful shutdown: stop reporting ready, flush buffered work, release resources"""
+    _accepting_requests.clear()
+    tutorial_counters.stop()  # flush buffered view counts
+    rankings.stop()  # flush buffered activity buckets
+    password_hashing.shutdown()
+    close_client()
 
-app.register_blueprint(auth_bp)
-app.register_blueprint(trainer_bp, url_prefix='/trainer')
 
 if __name__ == '__main__':
-    app.run(debug=True)
+    create_app().run(debug=True)
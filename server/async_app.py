@@ -0,0 +1,84 @@
+from quart import Quart, jsonify
+from quart.json.provider import DefaultJSONProvider
+from quart_cors import cors
+from config import Config
+from async_auth import auth_bp
+from async_trainer import trainer_bp
+from async_models import ping_async, close_async_client, get_async_database
+from trainer import tutorial_counters
+from serializers import FastJSONMixin
+from ensure_indexes import missing_required_indexes_async, missing_indexes_error
+import asyncio
+import password_hashing
+import rankings
+
+
+class JSONProvider(FastJSONMixin, DefaultJSONProvider):
+    """jsonify() via serializers.dumps (orjson when installed)"""
+
+
+def create_async_app(config_overrides=None):
+    """Application factory for the asyncio serving path.
+
+    Exposes the same routes as app.create_app(), served by Quart on an event
+    loop with Motor for MongoDB, so one process can hold thousands of requests
+    in flight instead of one per thread. Run it with an ASGI server, e.g.
+
+        REDIS_URL=redis://... hypercorn "async_app:create_async_app()" --workers 4 --bind 0.0.0.0:5000
+    """
+    app = cors(Quart(__name__))
+    app.json = JSONProvider(app)
+
+    app.config.from_object(Config)
+    if config_overrides:
+        app.config.update(config_overrides)
+
+    app.register_blueprint(auth_bp)
+    app.register_blueprint(trainer_bp, url_prefix='/trainer')
+
+    @app.route('/health', methods=['GET'])
+    async def health():
+        """Liveness: the process is up and serving"""
+        return jsonify({'status': 'ok'}), 200
+
+    indexes_checked = False
+
+    @app.route('/ready', methods=['GET'])
+    async def ready():
+        """Readiness: MongoDB is reachable and has the required indexes"""
+        nonlocal indexes_checked
+        ok, latency_ms = await ping_async()
+        if not ok:
+            return jsonify({'status': 'unavailable', 'mongo_ping_ms': latency_ms}), 503
+        missing = [] if indexes_checked else await missing_required_indexes_async(get_async_database())
+        if missing:
+            return jsonify({'status': 'missing_indexes', 'missing_indexes': missing, 'mongo_ping_ms': latency_ms}), 503
+        # Indexes are not dropped in normal operation; check once per worker
+        indexes_checked = True
+        return jsonify({'status': 'ready', 'mongo_ping_ms': latency_ms}), 200
+
+    @app.before_serving
+    async def warm_up_hashing():
+        # Boot the password hashing processes before the first request needs them
+        await asyncio.to_thread(password_hashing.warm_up)
+
+    @app.before_serving
+    async def check_indexes():
+        # Same opt-in startup check as app.create_app(), run once the event loop is up
+        if app.config.get('CHECK_INDEXES'):
+            missing = await missing_required_indexes_async(get_async_database())
+            if missing:
+                raise missing_indexes_error(missing)
+
+    @app.after_serving
+    async def shutdown():
+        tutorial_counters.stop()  # flush buffered view counts
+        rankings.stop()  # flush buffered activity buckets
+        password_hashing.shutdown()
+        close_async_client()
+
+    return app
+
+
+if __name__ == '__main__':
+    create_async_app().run(port=5000)
@@ -0,0 +1,235 @@
+from quart import Blueprint, request, jsonify
+from async_jwt import create_access_token
+from async_models import users_collection, trainer_applications_collection, stats_collection
+from admin_stats import (
+    USER_STATS_ID, USER_STATS_MAX_AGE, APPLICATION_STATS_ID, user_created_increments, application_increments,
+    login_update, serve_stats, rebuild_user_stats
+)
+from pagination import parse_limit, parse_page
+from password_hashing import hash_password_async, check_password_async, needs_rehash, HashingPoolSaturated
+from auth import (
+    build_trainer_application, build_user, build_google_user, format_login_user,
+    format_google_user, format_admin_user, build_user_filter, users_page_pipeline,
+    build_admin_stats, existing_account_pipeline, signup_conflict
+)
+from pymongo.errors import DuplicateKeyError
+import asyncio
+
+# asyncio twin of auth.py: same URLs and payloads, backed by Motor. Document
+# builders and formatters are shared with auth.py.
+auth_bp = Blueprint('auth', __name__)
+
+def busy_response():
+    """503 returned when the password hashing queue is full"""
+    response = jsonify({'msg': 'Server is busy, please try again shortly'})
+    response.headers['Retry-After'] = '1'
+    return response, 503
+
+async def record_user_created(role, created_at=None):
+    """Write hook: count a newly inserted user in the stats document"""
+    try:
+        await stats_collection.update_one(
+            {'_id': USER_STATS_ID},
+            {'$inc': user_created_increments(role, created_at)},
+            upsert=True
+        )
+    except Exception as e:
+        # Stats are advisory; never fail the write that triggered them
+        print(f"⚠️  Could not update user stats: {str(e)}")
+
+async def record_application_submitted():
+    """Write hook: count a new pending trainer application"""
+    try:
+        await stats_collection.update_one(
+            {'_id': APPLICATION_STATS_ID},
+            {'$inc': application_increments('pending')},
+            upsert=True
+        )
+    except Exception as e:
+        print(f"⚠️  Could not update application stats: {str(e)}")
+
+async def record_user_login(user_id):
+    """Write hook: remember when a user last signed in"""
+    try:
+        await users_collection.update_one({'_id': user_id}, login_update())
+    except Exception as e:
+        print(f"⚠️  Could not record sign-in: {str(e)}")
+
+async def get_user_stats():
+    """Read the stats document; stale documents are rebuilt in the background
+    (admin_stats.serve_stats) and only a never-built one is built before answering"""
+    stats = await stats_collection.find_one({'_id': USER_STATS_ID})
+    return (serve_stats(stats, USER_STATS_ID, rebuild_user_stats, USER_STATS_MAX_AGE)
+            or await asyncio.to_thread(rebuild_user_stats))
+
+@auth_bp.route('/signup', methods=['POST'])
+async def signup():
+    data = await request.get_json()
+    
+    # Required fields
+    email = data.get('email')
+    password = data.get('password')
+    role = data.get('role', 'user')  # Default to user if not specified
+    
+    # Validate required fields
+    if not email or not password:
+        return jsonify({'msg': 'Email and password are required'}), 400
+
+    # Same cheap existence checks as auth.signup, before paying for a hash
+    try:
+        if role == 'trainer':
+            existing = await users_collection.aggregate(existing_account_pipeline(email)).to_list(length=2)
+            conflict = signup_conflict(existing)
+        else:
+            conflict = 'User already exists' if await users_collection.find_one({'email': email}, {'_id': 1}) else None
+    except Exception as e:
+        print(f"❌ Error checking existing accounts: {str(e)}")
+        return jsonify({'msg': 'Error checking existing accounts'}), 500
+    if conflict:
+        return jsonify({'msg': conflict}), 409
+    
+    try:
+        hashed_pw = await hash_password_async(password)
+    except HashingPoolSaturated:
+        return busy_response()
+    
+    # Special handling for trainer registration
+    if role == 'trainer':
+        print(f"🏋️ TRAINER SIGNUP: {email} - Creating pending application")
+        application = build_trainer_application(data, email, hashed_pw)
+        
+        try:
+            # Insert application instead of user
+            await trainer_applications_collection.insert_one(application)
+            await record_application_submitted()
+            return jsonify({'msg': 'Trainer application submitted! Please wait for admin approval.'}), 201
+        except DuplicateKeyError:
+            # A concurrent submission won the unique pending-application index
+            return jsonify({'msg': 'Trainer application already exists'}), 409
+        except Exception as e:
+            print(f"❌ Error creating trainer application: {str(e)}")
+            return jsonify({'msg': 'Failed to submit trainer application'}), 500
+
+    # Create user document with all provided fields
+    user_doc = build_user(data, email, hashed_pw, role)
+    
+    try:
+        await users_collection.insert_one(user_doc)
+    except DuplicateKeyError:
+        return jsonify({'msg': 'User already exists'}), 409
+    await record_user_created(role, user_doc['createdAt'])
+    return jsonify({'msg': 'Signup successful'}), 201
+
+@auth_bp.route('/login', methods=['POST'])
+async def login():
+    data = await request.get_json()
+    email = data.get('email')
+    password = data.get('password')
+    role = data.get('role')
+
+    user = await users_collection.find_one({'email': email, 'role': role})
+    
+    if not user:
+        return jsonify({'msg': 'Invalid credentials'}), 401
+    
+    try:
+        password_valid = await check_password_async(user['password'], password)
+    except HashingPoolSaturated:
+        return busy_response()
+    
+    if not password_valid:
+        return jsonify({'msg': 'Invalid credentials'}), 401
+
+    # Transparently upgrade hashes written under an older/weaker policy
+    if needs_rehash(user['password']):
+        try:
+            await users_collection.update_one(
+                {'_id': user['_id'], 'password': user['password']},
+                {'$set': {'password': await hash_password_async(password)}}
+            )
+        except Exception as e:
+            print(f"   ⚠️  Password rehash skipped: {str(e)}")
+
+    await record_user_login(user['_id'])
+    token = create_access_token(identity={'email': user['email'], 'role': user['role']})
+    
+    return jsonify({
+        'token': token,
+        'user': format_login_user(user),
+        'msg': 'Login successful'
+    }), 200
+
+@auth_bp.route('/users', methods=['GET'])
+async def get_all_users():
+    """Get users (admin only), filtered and paginated in Mongo"""
+    try:
+        limit = parse_limit(request.args.get('limit'))
+        page = parse_page(request.args.get('page'))
+        
+        query = build_user_filter(request.args)
+        
+        # One round trip for both the requested page and the total match count
+        result = (await users_collection.aggregate(users_page_pipeline(query, page, limit)).to_list(length=1))[0]
+        total = result['total'][0]['count'] if result['total'] else 0
+        
+        return jsonify({
+            'users': [format_admin_user(user) for user in result['users']],
+            'total': total,
+            'page': page,
+            'limit': limit,
+            'pages': (total + limit - 1) // limit
+        }), 200
+        
+    except ValueError as e:
+        return jsonify({'msg': str(e)}), 400
+    except Exception as e:
+        print(f"❌ Error fetching users: {str(e)}")
+        return jsonify({'msg': 'Error fetching users'}), 500
+
+@auth_bp.route('/stats', methods=['GET'])
+async def get_admin_stats():
+    """Get admin dashboard statistics"""
+    try:
+        stats = build_admin_stats(await get_user_stats())
+        return jsonify({'stats': stats}), 200
+        
+    except Exception as e:
+        print(f"❌ Error fetching stats: {str(e)}")
+        return jsonify({'msg': 'Error fetching statistics'}), 500
+
+@auth_bp.route('/google-login', methods=['POST'])
+async def google_login():
+    """Handle Google Sign-in"""
+    try:
+        data = await request.get_json()
+        email = data.get('email')
+        
+        if not email:
+            return jsonify({'msg': 'Email is required'}), 400
+        
+        user = await users_collection.find_one({'email': email})
+        
+        if not user:
+            # Create new user from Google data
+            user = build_google_user(email, data.get('name'), data.get('photoURL'))
+            try:
+                result = await users_collection.insert_one(user)
+            except DuplicateKeyError:
+                # A concurrent first sign-in with the same account inserted it first
+                user = await users_collection.find_one({'email': email})
+            else:
+                user['_id'] = result.inserted_id
+                await record_user_created('user', user['createdAt'])
+        await record_user_login(user['_id'])
+        
+        token = create_access_token(identity={'email': user['email'], 'role': user.get('role', 'user')})
+        
+        return jsonify({
+            'token': token,
+            'user': format_google_user(user),
+            'msg': 'Google login successful'
+        }), 200
+        
+    except Exception as e:
+        print(f"❌ Google login error: {str(e)}")
+        return jsonify({'msg': 'Google login failed'}), 500
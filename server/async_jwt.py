@@ -0,0 +1,54 @@
+from quart import current_app, g, jsonify, request
+from datetime import datetime, timedelta, timezone
+from functools import wraps
+import jwt
+import uuid
+
+# Tokens are minted and checked exactly like flask_jwt_extended's defaults, so
+# a token issued by either serving path is accepted by the other.
+ACCESS_TOKEN_EXPIRES = timedelta(minutes=15)
+ALGORITHM = 'HS256'
+
+
+def create_access_token(identity):
+    """Issue an access token for `identity`"""
+    now = datetime.now(timezone.utc)
+    claims = {
+        'fresh': False,
+        'iat': now,
+        'jti': str(uuid.uuid4()),
+        'type': 'access',
+        'sub': identity,
+        'nbf': now,
+        'exp': now + current_app.config.get('JWT_ACCESS_TOKEN_EXPIRES', ACCESS_TOKEN_EXPIRES)
+    }
+    return jwt.encode(claims, current_app.config['JWT_SECRET_KEY'], algorithm=ALGORITHM)
+
+
+def get_jwt_identity():
+    """Identity of the current request's token (inside jwt_required routes)"""
+    return g.get('jwt_identity')
+
+
+def jwt_required():
+    """Decorator requiring a valid Bearer access token"""
+    def decorator(fn):
+        @wraps(fn)
+        async def wrapper(*args, **kwargs):
+            header = request.headers.get('Authorization', '')
+            if not header.startswith('Bearer '):
+                return jsonify({'msg': 'Missing Authorization Header'}), 401
+            try:
+                # Identities are dicts ({'email', 'role'}), not strings
+                claims = jwt.decode(header[len('Bearer '):], current_app.config['JWT_SECRET_KEY'],
+                                    algorithms=[ALGORITHM], options={'verify_sub': False})
+            except jwt.ExpiredSignatureError:
+                return jsonify({'msg': 'Token has expired'}), 401
+            except jwt.InvalidTokenError as e:
+                return jsonify({'msg': str(e)}), 422
+            if claims.get('type') != 'access':
+                return jsonify({'msg': 'Only access tokens are allowed'}), 422
+            g.jwt_identity = claims['sub']
+            return await fn(*args, **kwargs)
+        return wrapper
+    return decorator
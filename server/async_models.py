@@ -0,0 +1,72 @@
+from motor.motor_asyncio import AsyncIOMotorClient
+from models import LazyCollection
+import mongo_connection
+import os
+import time
+
+_client = None
+_client_pid = None
+
+
+def get_async_client():
+    """Return the process-wide Motor client, creating it on first use.
+
+    Uses the same pool settings as the synchronous client in mongo_connection.py.
+    """
+    global _client, _client_pid
+    if _client is None or _client_pid != os.getpid():
+        _client = AsyncIOMotorClient(
+            mongo_connection.MONGO_URI,
+            maxPoolSize=mongo_connection.MAX_POOL_SIZE,
+            minPoolSize=mongo_connection.MIN_POOL_SIZE,
+            waitQueueTimeoutMS=mongo_connection.WAIT_QUEUE_TIMEOUT_MS,
+            serverSelectionTimeoutMS=mongo_connection.SERVER_SELECTION_TIMEOUT_MS,
+            connectTimeoutMS=mongo_connection.CONNECT_TIMEOUT_MS,
+            socketTimeoutMS=mongo_connection.SOCKET_TIMEOUT_MS,
+            readPreference=mongo_connection.READ_PREFERENCE,
+            appname='fithub-server-async',
+            event_listeners=[mongo_connection.CommandMetricsListener(),
+                             mongo_connection.PoolMetricsListener()]
+        )
+        _client_pid = os.getpid()
+    return _client
+
+
+def get_async_database(name=None):
+    """Return the application database from the Motor client"""
+    return get_async_client()[name or mongo_connection.MONGO_DB_NAME]
+
+
+async def ping_async():
+    """Async health check: (ok, latency_ms)"""
+    start = time.perf_counter()
+    try:
+        await get_async_client().admin.command('ping')
+        return True, round((time.perf_counter() - start) * 1000.0, 3)
+    except Exception as e:
+        print(f"❌ MongoDB ping failed: {str(e)}")
+        return False, None
+
+
+def close_async_client():
+    """Close the Motor client (e.g. after serving)"""
+    global _client
+    if _client is not None and _client_pid == os.getpid():
+        _client.close()
+    _client = None
+
+
+class AsyncLazyCollection(LazyCollection):
+    """LazyCollection resolving against the Motor client"""
+
+    def _resolve(self):
+        database = get_async_database()
+        return database if self._name is None else database[self._name]
+
+
+users_collection = AsyncLazyCollection('users')
+tutorials_collection = AsyncLazyCollection('tutorials')
+queries_collection = AsyncLazyCollection('queries')
+trainer_applications_collection = AsyncLazyCollection('trainer_applications')
+stats_collection = AsyncLazyCollection('stats')
+tutorial_likes_collection = AsyncLazyCollection('tutorial_likes')
@@ -0,0 +1,723 @@
+from quart import Blueprint, Response, request, jsonify
+from async_jwt import jwt_required, get_jwt_identity
+from async_models import (
+    tutorials_collection, queries_collection, trainer_applications_collection, tutorial_likes_collection,
+    stats_collection
+)
+from pagination import paginate_async, parse_limit, parse_page
+from rankings import get_ranking_page
+from tutorial_likes import add_like_async, remove_like_async, has_liked_async
+from admin_stats import (
+    APPLICATION_STATS_ID, APPLICATION_STATS_MAX_AGE, serve_stats, rebuild_application_stats,
+    application_counts_from_stats
+)
+from response_cache import request_cache_key, compute_etag, RESPONSE_CACHE_MAX_AGE
+from serializers import http_dates
+from trainer import (
+    trainer_stats_cache,
+    public_cache, invalidate_public_tutorials, TUTORIAL_LIST_GROUP, TUTORIAL_DETAIL_GROUP, tutorial_search,
+    PUBLIC_TUTORIAL_SUMMARY_FIELDS, TRAINER_TUTORIAL_SUMMARY_FIELDS,
+    parse_fields, tutorial_projection, tutorial_formatter, format_tutorial_details,
+    build_catalogue_filter, catalogue_facets_pipeline, build_catalogue_facets, live_likes,
+    ranked_tutorials_filter, format_ranked_tutorials, format_search_results, count_view, count_like,
+    build_tutorial, build_tutorial_update, build_query, format_query, format_application,
+    tutorial_stats_pipeline, query_stats_pipeline, build_trainer_stats,
+    inbox_page, claim_filter, claim_update, claim_candidates_filter, parse_claim_count,
+    QUERY_PRIORITIES, QUERY_CLAIM_INDEX, CLAIM_SPREAD, CLAIM_ROUNDS,
+    APPLICATION_STATUSES, parse_statuses, applications_page
+)
+from datetime import datetime
+from bson import ObjectId
+from pymongo import ReturnDocument
+import asyncio
+import random
+
+# asyncio twin of trainer.py: same URLs and payloads, backed by Motor so a
+# single process can keep many requests in flight. Document builders,
+# formatters, the view-count buffer, the stats cache and the public response
+# cache are shared with trainer.py.
+trainer_bp = Blueprint('trainer', __name__)
+
+def etag_response(payload, etag, status=200):
+    """Quart counterpart of response_cache.etag_response"""
+    if request.if_none_match.contains(etag):
+        response = Response('', status=304)
+    else:
+        response = jsonify(payload)
+        response.status_code = status
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = f'public, max-age={RESPONSE_CACHE_MAX_AGE}, must-revalidate'
+    return response
+
+# Helper function to verify trainer role
+def verify_trainer():
+    current_user = get_jwt_identity()
+    if not current_user or current_user.get('role') != 'trainer':
+        return False
+    return current_user
+
+# TUTORIAL MANAGEMENT ROUTES
+
+@trainer_bp.route('/tutorials', methods=['POST'])
+@jwt_required()
+async def create_tutorial():
+    """Create a new tutorial"""
+    current_user = verify_trainer()
+    if not current_user:
+        return jsonify({'msg': 'Access denied. Trainer role required.'}), 403
+    
+    try:
+        data = await request.get_json()
+        
+        # Validate required fields
+        required_fields = ['title', 'description', 'category', 'content']
+        for field in required_fields:
+            if not data.get(field):
+                return jsonify({'msg': f'{field} is required'}), 400
+        
+        tutorial = build_tutorial(data, current_user)
+        result = await tutorials_collection.insert_one(tutorial)
+        tutorial['_id'] = str(result.inserted_id)
+        trainer_stats_cache.delete(current_user['email'])
+        invalidate_public_tutorials()
+        
+        return jsonify({
+            'msg': 'Tutorial created successfully',
+            'tutorial': http_dates(tutorial)
+        }), 201
+        
+    except Exception as e:
+        print(f"❌ Error creating tutorial: {str(e)}")
+        return jsonify({'msg': 'Error creating tutorial'}), 500
+
+@trainer_bp.route('/tutorials', methods=['GET'])
+@jwt_required()
+async def get_trainer_tutorials():
+    """Get all tutorials by current trainer"""
+    current_user = verify_trainer()
+    if not current_user:
+        return jsonify({'msg': 'Access denied. Trainer role required.'}), 403
+    
+    try:
+        fields = parse_fields(request.args.get('fields'), TRAINER_TUTORIAL_SUMMARY_FIELDS)
+        tutorials = tutorials_collection.find(
+            {'trainer_email': current_user['email']},
+            tutorial_projection(fields)
+        )
+        
+        formatted_tutorials = tutorial_formatter(tuple(fields)).many(await tutorials.to_list(length=None))
+        
+        return jsonify({'tutorials': formatted_tutorials}), 200
+        
+    except ValueError as e:
+        return jsonify({'msg': str(e)}), 400
+    except Exception as e:
+        print(f"❌ Error fetching tutorials: {str(e)}")
+        return jsonify({'msg': 'Error fetching tutorials'}), 500
+
+@trainer_bp.route('/tutorials/<tutorial_id>', methods=['PUT'])
+@jwt_required()
+async def update_tutorial(tutorial_id):
+    """Update a tutorial"""
+    current_user = verify_trainer()
+    if not current_user:
+        return jsonify({'msg': 'Access denied. Trainer role required.'}), 403
+    
+    try:
+        update_data = build_tutorial_update(await request.get_json())
+        
+        # Ownership check and update in one round trip
+        result = await tutorials_collection.update_one(
+            {'_id': ObjectId(tutorial_id), 'trainer_email': current_user['email']},
+            {'$set': update_data}
+        )
+        
+        if result.matched_count == 0:
+            return jsonify({'msg': 'Tutorial not found or access denied'}), 404
+        
+        trainer_stats_cache.delete(current_user['email'])
+        invalidate_public_tutorials(tutorial_id)
+        return jsonify({'msg': 'Tutorial updated successfully'}), 200
+        
+    except Exception as e:
+        print(f"❌ Error updating tutorial: {str(e)}")
+        return jsonify({'msg': 'Error updating tutorial'}), 500
+
+@trainer_bp.route('/tutorials/<tutorial_id>', methods=['DELETE'])
+@jwt_required()
+async def delete_tutorial(tutorial_id):
+    """Delete a tutorial"""
+    current_user = verify_trainer()
+    if not current_user:
+        return jsonify({'msg': 'Access denied. Trainer role required.'}), 403
+    
+    try:
+        result = await tutorials_collection.delete_one({
+            '_id': ObjectId(tutorial_id),
+            'trainer_email': current_user['email']
+        })
+        
+        if result.deleted_count == 0:
+            return jsonify({'msg': 'Tutorial not found or access denied'}), 404
+        
+        trainer_stats_cache.delete(current_user['email'])
+        invalidate_public_tutorials(tutorial_id)
+        return jsonify({'msg': 'Tutorial deleted successfully'}), 200
+        
+    except Exception as e:
+        print(f"❌ Error deleting tutorial: {str(e)}")
+        return jsonify({'msg': 'Error deleting tutorial'}), 500
+
+# USER QUERY MANAGEMENT ROUTES
+
+@trainer_bp.route('/queries', methods=['GET'])
+@jwt_required()
+async def get_trainer_queries():
+    """Trainer inbox: queries assigned to me (view=mine) or the unassigned pool
+    (view=unassigned), newest first, one page at a time"""
+    current_user = verify_trainer()
+    if not current_user:
+        return jsonify({'msg': 'Access denied. Trainer role required.'}), 403
+    
+    try:
+        view = request.args.get('view', 'mine')
+        page = inbox_page(view, current_user['email'], request.args)
+        queries, next_cursor = await paginate_async(queries_collection, **page)
+        
+        formatted_queries = format_query.many(queries)
+        
+        return jsonify({
+            'queries': formatted_queries,
+            'view': view,
+            'next_cursor': next_cursor,
+            'limit': page['limit']
+        }), 200
+        
+    except ValueError as e:
+        return jsonify({'msg': str(e)}), 400
+    except Exception as e:
+        print(f"❌ Error fetching queries: {str(e)}")
+        return jsonify({'msg': 'Error fetching queries'}), 500
+
+@trainer_bp.route('/queries/<query_id>/assign', methods=['POST'])
+@jwt_required()
+async def assign_query(query_id):
+    """Assign a query to current trainer"""
+    current_user = verify_trainer()
+    if not current_user:
+        return jsonify({'msg': 'Access denied. Trainer role required.'}), 403
+    
+    try:
+        query = await claim_query(ObjectId(query_id), current_user['email'])
+        
+        if not query:
+            # Not claimable: missing, already ours (a retried request), or someone else's
+            query = await queries_collection.find_one({'_id': ObjectId(query_id)})
+            if not query:
+                return jsonify({'msg': 'Query not found'}), 404
+            if query.get('assigned_trainer') != current_user['email']:
+                return jsonify({'msg': 'Query already claimed by another trainer'}), 409
+        
+        trainer_stats_cache.delete(current_user['email'])
+        return jsonify({'msg': 'Query assigned successfully', 'query': format_query(query)}), 200
+        
+    except Exception as e:
+        print(f"❌ Error assigning query: {str(e)}")
+        return jsonify({'msg': 'Error assigning query'}), 500
+
+async def claim_query(query_id, trainer_email):
+    """Claim one query; returns the updated document, or None if it was not claimable"""
+    return await queries_collection.find_one_and_update(
+        claim_filter(query_id),
+        claim_update(trainer_email),
+        return_document=ReturnDocument.AFTER
+    )
+
+async def claim_next_queries(trainer_email, count):
+    """Motor version of trainer.claim_next_queries (same candidate window and order)"""
+    claimed = []
+    for priority in QUERY_PRIORITIES:
+        for _ in range(CLAIM_ROUNDS):
+            wanted = count - len(claimed)
+            if wanted <= 0:
+                return claimed
+            candidates = [query['_id'] async for query in queries_collection.find(
+                claim_candidates_filter(priority), {'_id': 1}
+            ).sort('created_at', 1).limit(wanted * CLAIM_SPREAD).hint(QUERY_CLAIM_INDEX)]
+            if not candidates:
+                break
+            random.shuffle(candidates)
+            for query_id in candidates:
+                query = await claim_query(query_id, trainer_email)
+                if query:
+                    claimed.append(query)
+                    if len(claimed) == count:
+                        return claimed
+    return claimed
+
+@trainer_bp.route('/queries/claim', methods=['POST'])
+@jwt_required()
+async def claim_queries():
+    """Claim the next N open queries (highest priority first, roughly oldest first)"""
+    current_user = verify_trainer()
+    if not current_user:
+        return jsonify({'msg': 'Access denied. Trainer role required.'}), 403
+    
+    try:
+        count = parse_claim_count(await request.get_json(silent=True) or {})
+        
+        claimed = await claim_next_queries(current_user['email'], count)
+        
+        if claimed:
+            trainer_stats_cache.delete(current_user['email'])
+        return jsonify({
+            'msg': f'Claimed {len(claimed)} queries',
+            'queries': format_query.many(claimed)
+        }), 200
+        
+    except ValueError as e:
+        return jsonify({'msg': str(e)}), 400
+    except Exception as e:
+        print(f"❌ Error claiming queries: {str(e)}")
+        return jsonify({'msg': 'Error claiming queries'}), 500
+
+@trainer_bp.route('/queries/<query_id>/respond', methods=['POST'])
+@jwt_required()
+async def respond_to_query(query_id):
+    """Respond to a user query"""
+    current_user = verify_trainer()
+    if not current_user:
+        return jsonify({'msg': 'Access denied. Trainer role required.'}), 403
+    
+    try:
+        data = await request.get_json()
+        response = data.get('response')
+        
+        if not response:
+            return jsonify({'msg': 'Response is required'}), 400
+        
+        # Only succeeds if the query is assigned to current trainer
+        result = await queries_collection.update_one(
+            {'_id': ObjectId(query_id), 'assigned_trainer': current_user['email']},
+            {
+                '$set': {
+                    'response': response,
+                    'status': 'resolved',
+                    'responded_at': datetime.utcnow(),
+                    'updated_at': datetime.utcnow()
+                }
+            }
+        )
+        
+        if result.matched_count == 0:
+            return jsonify({'msg': 'Query not found or not assigned to you'}), 404
+        
+        trainer_stats_cache.delete(current_user['email'])
+        return jsonify({'msg': 'Response submitted successfully'}), 200
+        
+    except Exception as e:
+        print(f"❌ Error responding to query: {str(e)}")
+        return jsonify({'msg': 'Error responding to query'}), 500
+
+# DASHBOARD STATS
+
+@trainer_bp.route('/stats', methods=['GET'])
+@jwt_required()
+async def get_trainer_stats():
+    """Get trainer dashboard statistics"""
+    current_user = verify_trainer()
+    if not current_user:
+        return jsonify({'msg': 'Access denied. Trainer role required.'}), 403
+    
+    try:
+        cached_stats = trainer_stats_cache.get(current_user['email'])
+        if cached_stats is not None:
+            return jsonify({'stats': cached_stats}), 200
+        
+        # Tutorial and query aggregations run concurrently
+        tutorial_stats, query_stats = await asyncio.gather(
+            tutorials_collection.aggregate(tutorial_stats_pipeline(current_user['email'])).to_list(length=1),
+            queries_collection.aggregate(query_stats_pipeline(current_user['email'])).to_list(length=1)
+        )
+        stats = build_trainer_stats(tutorial_stats, query_stats)
+        
+        trainer_stats_cache.set(current_user['email'], stats)
+        return jsonify({'stats': stats}), 200
+        
+    except Exception as e:
+        print(f"❌ Error fetching trainer stats: {str(e)}")
+        return jsonify({'msg': 'Error fetching statistics'}), 500
+
+# PUBLIC ROUTES (for users to view tutorials and submit queries)
+
+@trainer_bp.route('/public/tutorials', methods=['GET'])
+async def get_public_tutorials():
+    """Get published tutorials (public access), newest first, one page at a time,
+    optionally filtered by category, difficulty, tag or trainer"""
+    try:
+        cache_key = request_cache_key(request.args)
+        cached = public_cache.get(TUTORIAL_LIST_GROUP, cache_key)
+        if cached:
+            etag, payload = cached
+            return etag_response(payload, etag)
+        
+        limit = parse_limit(request.args.get('limit'))
+        fields = parse_fields(request.args.get('fields'), PUBLIC_TUTORIAL_SUMMARY_FIELDS)
+        cursor = request.args.get('cursor')
+        tutorials, next_cursor = await paginate_async(
+            tutorials_collection,
+            build_catalogue_filter(request.args),
+            cursor=cursor,
+            limit=limit,
+            projection=tutorial_projection(fields)
+        )
+        
+        formatted_tutorials = tutorial_formatter(tuple(fields)).many(tutorials)
+        
+        payload = {
+            'tutorials': formatted_tutorials,
+            'next_cursor': next_cursor,
+            'limit': limit
+        }
+        # ?include=facets: filter sidebar counts with the first page, no extra request
+        if request.args.get('include') == 'facets' and not cursor:
+            payload['facets'] = (await get_catalogue_facets())[1]['facets']
+        etag = public_cache.set(TUTORIAL_LIST_GROUP, cache_key, payload)
+        return etag_response(payload, etag)
+        
+    except ValueError as e:
+        return jsonify({'msg': str(e)}), 400
+    except Exception as e:
+        print(f"❌ Error fetching public tutorials: {str(e)}")
+        return jsonify({'msg': 'Error fetching tutorials'}), 500
+
+async def get_catalogue_facets():
+    """Facet counts for the public catalogue, cached until the next tutorial write"""
+    cached = public_cache.get(TUTORIAL_LIST_GROUP, 'facets')
+    if cached:
+        return cached
+    result = await tutorials_collection.aggregate(catalogue_facets_pipeline()).to_list(length=1)
+    payload = build_catalogue_facets(result[0])
+    return public_cache.set(TUTORIAL_LIST_GROUP, 'facets', payload), payload
+
+@trainer_bp.route('/public/tutorials/facets', methods=['GET'])
+async def get_public_tutorial_facets():
+    """Counts of published tutorials per category, difficulty, tag and trainer"""
+    try:
+        etag, payload = await get_catalogue_facets()
+        return etag_response(payload, etag)
+        
+    except Exception as e:
+        print(f"❌ Error fetching tutorial facets: {str(e)}")
+        return jsonify({'msg': 'Error fetching tutorial facets'}), 500
+
+@trainer_bp.route('/public/tutorials/trending', methods=['GET'])
+async def get_trending_tutorials():
+    """Trending (time-decayed) or most popular this week, read from the precomputed rankings"""
+    try:
+        cache_key = 'trending:' + request_cache_key(request.args)
+        cached = public_cache.get(TUTORIAL_LIST_GROUP, cache_key)
+        if cached:
+            etag, payload = cached
+            return etag_response(payload, etag)
+        
+        ranking = request.args.get('ranking', 'trending')
+        limit = parse_limit(request.args.get('limit'))
+        page = parse_page(request.args.get('page'))
+        fields = parse_fields(request.args.get('fields'), PUBLIC_TUTORIAL_SUMMARY_FIELDS)
+        # The rankings store (and its first-use rebuild) is synchronous; run it off the loop
+        items, total, computed_at = await asyncio.to_thread(get_ranking_page, ranking, page, limit)
+        
+        tutorials = await tutorials_collection.find(
+            ranked_tutorials_filter(items), tutorial_projection(fields)).to_list(length=None)
+        
+        payload = {
+            'tutorials': format_ranked_tutorials(items, tutorials, fields),
+            'ranking': ranking,
+            'total': total,
+            'page': page,
+            'limit': limit,
+            'pages': (total + limit - 1) // limit,
+            'computed_at': computed_at
+        }
+        etag = public_cache.set(TUTORIAL_LIST_GROUP, cache_key, payload)
+        return etag_response(payload, etag)
+        
+    except ValueError as e:
+        return jsonify({'msg': str(e)}), 400
+    except Exception as e:
+        print(f"❌ Error fetching trending tutorials: {str(e)}")
+        return jsonify({'msg': 'Error fetching trending tutorials'}), 500
+
+@trainer_bp.route('/public/tutorials/search', methods=['GET'])
+async def search_public_tutorials():
+    """Full-text search over published tutorials, ranked by relevance, with facets"""
+    try:
+        text = (request.args.get('q') or '').strip()
+        if not text:
+            return jsonify({'msg': 'q is required'}), 400
+        
+        cache_key = 'search:' + request_cache_key(request.args)
+        cached = public_cache.get(TUTORIAL_LIST_GROUP, cache_key)
+        if cached:
+            etag, payload = cached
+            return etag_response(payload, etag)
+        
+        limit = parse_limit(request.args.get('limit'))
+        page = parse_page(request.args.get('page'))
+        fields = parse_fields(request.args.get('fields'), PUBLIC_TUTORIAL_SUMMARY_FIELDS)
+        # The search engine (text index or in-process fallback) is synchronous; run it off the loop
+        tutorials, total, facets = await asyncio.to_thread(
+            tutorial_search.search,
+            text,
+            category=request.args.get('category'),
+            difficulty=request.args.get('difficulty'),
+            page=page,
+            limit=limit,
+            projection=tutorial_projection(fields)
+        )
+        
+        payload = {
+            'tutorials': format_search_results(tutorials, fields),
+            'total': total,
+            'page': page,
+            'limit': limit,
+            'pages': (total + limit - 1) // limit,
+            'facets': facets
+        }
+        etag = public_cache.set(TUTORIAL_LIST_GROUP, cache_key, payload)
+        return etag_response(payload, etag)
+        
+    except ValueError as e:
+        return jsonify({'msg': str(e)}), 400
+    except Exception as e:
+        print(f"❌ Error searching tutorials: {str(e)}")
+        return jsonify({'msg': 'Error searching tutorials'}), 500
+
+@trainer_bp.route('/public/tutorials/<tutorial_id>', methods=['GET'])
+async def get_tutorial_details(tutorial_id):
+    """Get tutorial details and increment view count"""
+    try:
+        object_id = ObjectId(tutorial_id)
+        cached = public_cache.get(TUTORIAL_DETAIL_GROUP, tutorial_id)
+        if cached:
+            payload = cached[1]
+        else:
+            tutorial = await tutorials_collection.find_one({'_id': object_id, 'status': 'published'})
+            
+            if not tutorial:
+                return jsonify({'msg': 'Tutorial not found'}), 404
+            
+            # Cached with the stored counts; pending views/likes are added per request
+            payload = {'tutorial': format_tutorial_details(tutorial, tutorial.get('views', 0))}
+            public_cache.set(TUTORIAL_DETAIL_GROUP, tutorial_id, payload)
+        
+        # Buffered in memory only; the CounterBuffer thread does the writes
+        payload = count_view(object_id, payload)
+        # The ETag must cover the live counts actually sent, not the cached body
+        return etag_response(payload, compute_etag(payload))
+        
+    except Exception as e:
+        print(f"❌ Error fetching tutorial details: {str(e)}")
+        return jsonify({'msg': 'Error fetching tutorial'}), 500
+
+@trainer_bp.route('/public/tutorials/<tutorial_id>/like', methods=['GET'])
+@jwt_required()
+async def get_tutorial_like(tutorial_id):
+    """Whether the current user likes a tutorial"""
+    try:
+        tutorial = await tutorials_collection.find_one({'_id': ObjectId(tutorial_id), 'status': 'published'}, {'likes': 1})
+        if not tutorial:
+            return jsonify({'msg': 'Tutorial not found'}), 404
+        
+        liked = await has_liked_async(tutorial_likes_collection, get_jwt_identity()['email'], tutorial['_id'])
+        return jsonify({'liked': liked, 'likes': live_likes(tutorial)}), 200
+        
+    except Exception as e:
+        print(f"❌ Error fetching like: {str(e)}")
+        return jsonify({'msg': 'Error fetching like'}), 500
+
+@trainer_bp.route('/public/tutorials/<tutorial_id>/like', methods=['POST'])
+@jwt_required()
+async def like_tutorial(tutorial_id):
+    """Like a tutorial (idempotent: liking twice counts once)"""
+    try:
+        tutorial = await tutorials_collection.find_one({'_id': ObjectId(tutorial_id), 'status': 'published'}, {'likes': 1})
+        if not tutorial:
+            return jsonify({'msg': 'Tutorial not found'}), 404
+        
+        # Only the request whose insert wins the unique index changes the count
+        if await add_like_async(tutorial_likes_collection, get_jwt_identity()['email'], tutorial['_id']):
+            count_like(tutorial['_id'])
+        
+        return jsonify({'liked': True, 'likes': live_likes(tutorial)}), 200
+        
+    except Exception as e:
+        print(f"❌ Error liking tutorial: {str(e)}")
+        return jsonify({'msg': 'Error liking tutorial'}), 500
+
+@trainer_bp.route('/public/tutorials/<tutorial_id>/like', methods=['DELETE'])
+@jwt_required()
+async def unlike_tutorial(tutorial_id):
+    """Remove the current user's like (idempotent)"""
+    try:
+        tutorial = await tutorials_collection.find_one({'_id': ObjectId(tutorial_id), 'status': 'published'}, {'likes': 1})
+        if not tutorial:
+            return jsonify({'msg': 'Tutorial not found'}), 404
+        
+        if await remove_like_async(tutorial_likes_collection, get_jwt_identity()['email'], tutorial['_id']):
+            count_like(tutorial['_id'], -1)
+        
+        return jsonify({'liked': False, 'likes': live_likes(tutorial)}), 200
+        
+    except Exception as e:
+        print(f"❌ Error unliking tutorial: {str(e)}")
+        return jsonify({'msg': 'Error unliking tutorial'}), 500
+
+@trainer_bp.route('/public/queries', methods=['POST'])
+@jwt_required()
+async def submit_query():
+    """Submit a query to trainers"""
+    try:
+        current_user = get_jwt_identity()
+        data = await request.get_json()
+        
+        # Validate required fields
+        if not data.get('title') or not data.get('description'):
+            return jsonify({'msg': 'Title and description are required'}), 400
+        
+        query = build_query(data, current_user)
+        result = await queries_collection.insert_one(query)
+        query['_id'] = str(result.inserted_id)
+        
+        return jsonify({
+            'msg': 'Query submitted successfully',
+            'query': http_dates(query)
+        }), 201
+        
+    except Exception as e:
+        print(f"❌ Error submitting query: {str(e)}")
+        return jsonify({'msg': 'Error submitting query'}), 500
+
+# TRAINER APPLICATION MANAGEMENT ROUTES (Admin only)
+
+async def get_application_counts():
+    """Motor read of admin_stats.get_application_counts; rebuilds reuse the sync (hinted) code"""
+    stats = await stats_collection.find_one({'_id': APPLICATION_STATS_ID})
+    stats = (serve_stats(stats, APPLICATION_STATS_ID, rebuild_application_stats, APPLICATION_STATS_MAX_AGE)
+             or await asyncio.to_thread(rebuild_application_stats))
+    return application_counts_from_stats(stats)
+
+@trainer_bp.route('/applications', methods=['GET'])
+async def get_trainer_applications():
+    """Trainer applications for the admin dashboard, filtered by ?status=,
+    newest first, one page at a time, with per-status counts"""
+    try:
+        statuses = parse_statuses(request.args.get('status'), APPLICATION_STATUSES)
+        page = applications_page(statuses, request.args)
+        (applications, next_cursor), counts = await asyncio.gather(
+            paginate_async(trainer_applications_collection, **page),
+            get_application_counts()
+        )
+        
+        return jsonify({
+            'success': True,
+            'applications': format_application.many(applications),
+            'next_cursor': next_cursor,
+            'limit': page['limit'],
+            'counts': counts,
+            'total': sum(counts[status] for status in statuses)
+        }), 200
+        
+    except ValueError as e:
+        return jsonify({'success': False, 'message': str(e)}), 400
+    except Exception as e:
+        print(f"❌ Error fetching trainer applications: {str(e)}")
+        return jsonify({
+            'success': False,
+            'message': 'Error fetching applications'
+        }), 500
+
+# Approval/rejection are rare admin actions; they reuse the synchronous
+# trainer_application workflow on a worker thread rather than duplicating it.
+
+@trainer_bp.route('/applications/review', methods=['POST'])
+async def review_trainer_applications():
+    """Approve or reject a batch of trainer applications in one transaction"""
+    from trainer_application import review_trainer_applications as review_func, review_request_error
+    
+    data = await request.get_json() or {}
+    error = review_request_error(data)
+    if error:
+        return jsonify({'success': False, 'message': error}), 400
+    
+    try:
+        result = await asyncio.to_thread(
+            review_func,
+            data['application_ids'],
+            data['action'],
+            data.get('admin_email', 'admin@fithub.com'),
+            admin_notes=data.get('admin_notes', ''),
+            rejection_reason=data.get('rejection_reason', 'No reason provided')
+        )
+        
+        if result['success']:
+            return jsonify(result), 200
+        else:
+            print(f"❌ Error reviewing applications: {result['message']}")
+            return jsonify(result), 500
+            
+    except Exception as e:
+        print(f"❌ Error reviewing applications: {str(e)}")
+        return jsonify({
+            'success': False,
+            'message': 'Error reviewing applications'
+        }), 500
+
+@trainer_bp.route('/applications/<application_id>/approve', methods=['POST'])
+async def approve_trainer_application(application_id):
+    """Approve a trainer application"""
+    try:
+        data = await request.get_json()
+        admin_email = data.get('admin_email', 'admin@fithub.com')
+        admin_notes = data.get('admin_notes', '')
+        
+        from trainer_application import approve_trainer_application as approve_func
+        
+        result = await asyncio.to_thread(approve_func, application_id, admin_email, admin_notes)
+        
+        if result['success']:
+            return jsonify(result), 200
+        else:
+            return jsonify(result), 400
+            
+    except Exception as e:
+        print(f"❌ Error approving application: {str(e)}")
+        return jsonify({
+            'success': False,
+            'message': 'Error approving application'
+        }), 500
+
+@trainer_bp.route('/applications/<application_id>/reject', methods=['POST'])
+async def reject_trainer_application(application_id):
+    """Reject a trainer application"""
+    try:
+        data = await request.get_json()
+        admin_email = data.get('admin_email', 'admin@fithub.com')
+        rejection_reason = data.get('rejection_reason', 'No reason provided')
+        
+        from trainer_application import reject_trainer_application as reject_func
+        
+        result = await asyncio.to_thread(reject_func, application_id, admin_email, rejection_reason)
+        
+        if result['success']:
+            return jsonify(result), 200
+        else:
+            return jsonify(result), 400
+            
+    except Exception as e:
+        print(f"❌ Error rejecting application: {str(e)}")
+        return jsonify({
+            'success': False,
+            'message': 'Error rejecting application'
+        }), 500
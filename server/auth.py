@@ -1,24 +1,167 @@
 from flask import Blueprint, request, jsonify
 from models import users_collection
-from flask_bcrypt import Bcrypt
+from admin_stats import (
+    record_user_created, record_user_login, record_application_submitted, get_user_stats, count_new_signups
+)
+from pagination import parse_limit, parse_page
+from password_hashing import hash_password, check_password, needs_rehash, HashingPoolSaturated
+from serializers import format_login_user, format_google_user, format_admin_user
 from flask_jwt_extended import create_access_token
-from dotenv import load_dotenv
+from pymongo.errors import DuplicateKeyError
 from datetime import datetime
 import os
-
-load_dotenv()
-bcrypt = Bcrypt()
+import re
 
 # ✅ THIS LINE DEFINES THE BLUEPRINT
 auth_bp = Blueprint('auth', __name__)
 
+def busy_response():
+    """503 returned when the password hashing queue is full"""
+    response = jsonify({'msg': 'Server is busy, please try again shortly'})
+    response.headers['Retry-After'] = '1'
+    return response, 503
+
+# Document builders and formatters below are shared with the asyncio serving
+# path (async_auth.py), so both expose exactly the same API.
+
+USER_OPTIONAL_FIELDS = ['firstName', 'lastName', 'phone', 'dateOfBirth', 'gender', 'subscribeNewsletter']
+
+def build_trainer_application(data, email, hashed_pw):
+    """Build a pending trainer application document from signup data"""
+    return {
+        'email': email,
+        'password': hashed_pw,  # Already hashed
+        'firstName': data.get('firstName', ''),
+        'lastName': data.get('lastName', ''),
+        'phone': data.get('phone', ''),
+        'dateOfBirth': data.get('dateOfBirth', ''),
+        'gender': data.get('gender', ''),
+        
+        # Trainer professional info from signup
+        'experience': data.get('experience', ''),
+        'certifications': data.get('certifications', ''),
+        'specializations': data.get('specializations', ''),
+        'bio': data.get('bio', ''),
+        'motivation': data.get('motivation', ''),
+        
+        # Application metadata
+        'status': 'pending',
+        'applied_at': datetime.utcnow(),
+        'reviewed_at': None,
+        'reviewed_by': None,
+        'admin_notes': '',
+        'rejection_reason': ''
+    }
+
+def build_user(data, email, hashed_pw, role):
+    """Build a user document with all provided optional fields"""
+    user_doc = {
+        'email': email,
+        'password': hashed_pw,
+        'role': role,
+        'createdAt': datetime.utcnow().isoformat()
+    }
+    for field in USER_OPTIONAL_FIELDS:
+        if field in data and data[field]:
+            user_doc[field] = data[field]
+    return user_doc
+
+def build_google_user(email, name, photo_url):
+    """Build a user document for a first-time Google sign-in"""
+    return {
+        'email': email,
+        'firstName': name.split(' ')[0] if name else '',
+        'lastName': ' '.join(name.split(' ')[1:]) if name and len(name.split(' ')) > 1 else '',
+        'role': 'user',
+        'authProvider': 'google',
+        'photoURL': photo_url,
+        'createdAt': datetime.utcnow().isoformat(),
+        'password': None  # No password for Google users
+    }
+
+def existing_account_pipeline(email):
+    """One round trip: whether `email` has a user account and/or a trainer application"""
+    return [
+        {'$match': {'email': email}},
+        {'$limit': 1},
+        {'$project': {'_id': 0, 'source': {'$literal': 'user'}}},
+        {'$unionWith': {'coll': 'trainer_applications', 'pipeline': [
+            {'$match': {'email': email}},
+            {'$limit': 1},
+            {'$project': {'_id': 0, 'source': {'$literal': 'application'}}}
+        ]}}
+    ]
+
+def signup_conflict(existing):
+    """409 message for the rows returned by existing_account_pipeline, or None"""
+    sources = {row['source'] for row in existing}
+    if 'user' in sources:
+        return 'User already exists'
+    if 'application' in sources:
+        return 'Trainer application already exists'
+    return None
+
+def build_user_filter(args):
+    """Translate role/status/search query parameters into a Mongo filter"""
+    query = {}
+    role = args.get('role')
+    if role:
+        query['role'] = role
+    status = args.get('status')
+    if status == 'active':
+        query['status'] = {'$in': ['active', None]}  # Users without a status are active
+    elif status:
+        query['status'] = status
+    search = args.get('search', '').strip()
+    if search:
+        # Anchored, case-sensitive prefixes so each branch can use its index
+        prefix = {'$regex': '^' + re.escape(search)}
+        query['$or'] = [
+            {'email': {'$regex': '^' + re.escape(search.lower())}},
+            {'firstName': prefix},
+            {'lastName': prefix}
+        ]
+    return query
+
+def users_page_pipeline(query, page, limit):
+    """One aggregation returning both the requested page and the total match count"""
+    return [
+        {'$match': query},
+        {'$sort': {'createdAt': -1, '_id': -1}},
+        {'$facet': {
+            'users': [
+                {'$skip': (page - 1) * limit},
+                {'$limit': limit},
+                {'$project': {'password': 0}}  # Exclude passwords
+            ],
+            'total': [{'$count': 'count'}]
+        }}
+    ]
+
+def build_admin_stats(user_stats):
+    """Admin dashboard payload from the materialized user stats document"""
+    by_role = user_stats.get('by_role', {})
+    total_users = user_stats.get('total', 0)
+    
+    # Workouts, revenue and session time have no backing data yet and stay mocked
+    return {
+        'totalUsers': total_users,
+        'activeUsers': user_stats.get('active', 0),
+        'adminUsers': by_role.get('admin', 0),
+        'regularUsers': by_role.get('user', 0),
+        'trainerUsers': by_role.get('trainer', 0),
+        'totalWorkouts': total_users * 8,  # Mock workout count
+        'newSignups': count_new_signups(user_stats),
+        'revenue': 15420,  # Mock revenue
+        'avgSessionTime': '24 min'
+    }
+
 
 
 
 @auth_bp.route('/signup', methods=['POST'])
 def signup():
     data = request.json
-    print(f"🔍 SIGNUP ATTEMPT: {data}")  # Debug log
     
     # Required fields
     email = data.get('email')
@@ -29,11 +172,26 @@ def signup():
     if not email or not password:
         return jsonify({'msg': 'Email and password are required'}), 400
 
-    if users_collection.find_one({'email': email}):
-        return jsonify({'msg': 'User already exists'}), 409
+    # Cheap existence checks before paying for a hash. Trainers need the
+    # cross-collection check (an account or any earlier application blocks a
+    # new one); plain signups look the email up, and the unique email index
+    # still settles two signups racing past this check
+    try:
+        if role == 'trainer':
+            conflict = signup_conflict(list(users_collection.aggregate(existing_account_pipeline(email))))
+        else:
+            conflict = 'User already exists' if users_collection.find_one({'email': email}, {'_id': 1}) else None
+    except Exception as e:
+        print(f"❌ Error checking existing accounts: {str(e)}")
+        return jsonify({'msg': 'Error checking existing accounts'}), 500
+    if conflict:
+        return jsonify({'msg': conflict}), 409
     
-    # Hash password
-    hashed_pw = bcrypt.generate_password_hash(password).decode('utf-8')
+    # Hash password (on the hashing pool, so this thread only waits)
+    try:
+        hashed_pw = hash_password(password)
+    except HashingPoolSaturated:
+        return busy_response()
     
     # Special handling for trainer registration
     if role == 'trainer':
@@ -41,62 +199,32 @@ def signup():
         # Create trainer application instead of direct trainer account
         from models import trainer_applications_collection
         
-        # Check if application already exists
-        if trainer_applications_collection.find_one({'email': email}):
-            return jsonify({'msg': 'Trainer application already exists'}), 409
-        
-        # Create application document
-        application = {
-            'email': email,
-            'password': hashed_pw,  # Already hashed
-            'firstName': data.get('firstName', ''),
-            'lastName': data.get('lastName', ''),
-            'phone': data.get('phone', ''),
-            'dateOfBirth': data.get('dateOfBirth', ''),
-            'gender': data.get('gender', ''),
-            
-            # Trainer professional info from signup
-            'experience': data.get('experience', ''),
-            'certifications': data.get('certifications', ''),
-            'specializations': data.get('specializations', ''),
-            'bio': data.get('bio', ''),
-            'motivation': data.get('motivation', ''),
-            
-            # Application metadata
-            'status': 'pending',
-            'applied_at': datetime.utcnow(),
-            'reviewed_at': None,
-            'reviewed_by': None,
-            'admin_notes': '',
-            'rejection_reason': ''
-        }
+        application = build_trainer_application(data, email, hashed_pw)
         
         try:
             # Insert application instead of user
             trainer_applications_collection.insert_one(application)
+            record_application_submitted()
             return jsonify({'msg': 'Trainer application submitted! Please wait for admin approval.'}), 201
+        except DuplicateKeyError:
+            # A concurrent submission won the unique pending-application index
+            return jsonify({'msg': 'Trainer application already exists'}), 409
         except Exception as e:
             print(f"❌ Error creating trainer application: {str(e)}")
             return jsonify({'msg': 'Failed to submit trainer application'}), 500
 
     # Create user document with all provided fields
-    user_doc = {
-        'email': email,
-        'password': hashed_pw,
-        'role': role
-    }
-    
-    # Add optional fields if provided
-    optional_fields = ['firstName', 'lastName', 'phone', 'dateOfBirth', 'gender', 'subscribeNewsletter']
-    for field in optional_fields:
-        if field in data and data[field]:
-            user_doc[field] = data[field]
+    user_doc = build_user(data, email, hashed_pw, role)
     
     # Debug log (without password for security)
     debug_doc = {k: v for k, v in user_doc.items() if k != 'password'}
     print(f"🔍 Creating user: {debug_doc}")
     
-    users_collection.insert_one(user_doc)
+    try:
+        users_collection.insert_one(user_doc)
+    except DuplicateKeyError:
+        return jsonify({'msg': 'User already exists'}), 409
+    record_user_created(role, user_doc['createdAt'])
     return jsonify({'msg': 'Signup successful'}), 201
 
 @auth_bp.route('/login', methods=['POST'])
@@ -122,26 +250,33 @@ def login():
             print(f"   ℹ️  User exists with role: {user_any_role.get('role')}")
         return jsonify({'msg': 'Invalid credentials'}), 401
     
-    password_valid = bcrypt.check_password_hash(user['password'], password)
+    try:
+        password_valid = check_password(user['password'], password)
+    except HashingPoolSaturated:
+        return busy_response()
     print(f"   Password valid: {'Yes' if password_valid else 'No'}")
     
     if not password_valid:
         print(f"   ❌ Password verification failed")
         return jsonify({'msg': 'Invalid credentials'}), 401
 
+    # Transparently upgrade hashes written under an older/weaker policy
+    if needs_rehash(user['password']):
+        try:
+            users_collection.update_one(
+                {'_id': user['_id'], 'password': user['password']},
+                {'$set': {'password': hash_password(password)}}
+            )
+            print("   🔐 Password hash upgraded to current policy")
+        except Exception as e:
+            print(f"   ⚠️  Password rehash skipped: {str(e)}")
+
     print(f"   ✅ Login successful for {email}")
+    record_user_login(user['_id'])
     token = create_access_token(identity={'email': user['email'], 'role': user['role']})
     
     # Return user data along with token
-    user_data = {
-        'email': user['email'],
-        'role': user['role'],
-        'name': f"{user.get('firstName', '')} {user.get('lastName', '')}".strip() or user['email'].split('@')[0],
-        'firstName': user.get('firstName', ''),
-        'lastName': user.get('lastName', ''),
-        'phone': user.get('phone', ''),
-        'id': str(user['_id'])
-    }
+    user_data = format_login_user(user)
     
     return jsonify({
         'token': token,
@@ -151,32 +286,32 @@ def login():
 
 @auth_bp.route('/users', methods=['GET'])
 def get_all_users():
-    """Get all users (admin only)"""
+    """Get users (admin only), filtered and paginated in Mongo"""
     try:
         # In a real app, you'd verify JWT token and check if user is admin
-        users = list(users_collection.find({}, {'password': 0}))  # Exclude passwords
+        limit = parse_limit(request.args.get('limit'))
+        page = parse_page(request.args.get('page'))
+        
+        query = build_user_filter(request.args)
+        
+        # One round trip for both the requested page and the total match count
+        result = list(users_collection.aggregate(users_page_pipeline(query, page, limit)))[0]
+        users = result['users']
+        total = result['total'][0]['count'] if result['total'] else 0
         
-        # Convert ObjectId to string and format data
-        formatted_users = []
-        for user in users:
-            formatted_users.append({
-                'id': str(user['_id']),
-                'name': f"{user.get('firstName', '')} {user.get('lastName', '')}".strip() or user['email'].split('@')[0],
-                'email': user['email'],
-                'role': user.get('role', 'user'),
-                'firstName': user.get('firstName', ''),
-                'lastName': user.get('lastName', ''),
-                'phone': user.get('phone', ''),
-                'dateOfBirth': user.get('dateOfBirth', ''),
-                'gender': user.get('gender', ''),
-                'joinDate': user.get('createdAt', '2024-01-01'),
-                'status': 'active',  # You can add logic to determine this
-                'workouts': 0  # You can add logic to count workouts
-            })
+        formatted_users = format_admin_user.many(users)
         
-        print(f"📊 Retrieved {len(formatted_users)} users for admin dashboard")
-        return jsonify({'users': formatted_users}), 200
+        print(f"📊 Retrieved {len(formatted_users)} of {total} users for admin dashboard")
+        return jsonify({
+            'users': formatted_users,
+            'total': total,
+            'page': page,
+            'limit': limit,
+            'pages': (total + limit - 1) // limit
+        }), 200
         
+    except ValueError as e:
+        return jsonify({'msg': str(e)}), 400
     except Exception as e:
         print(f"❌ Error fetching users: {str(e)}")
         return jsonify({'msg': 'Error fetching users'}), 500
@@ -185,23 +320,10 @@ def get_all_users():
 def get_admin_stats():
     """Get admin dashboard statistics"""
     try:
-        total_users = users_collection.count_documents({})
-        admin_users = users_collection.count_documents({'role': 'admin'})
-        regular_users = users_collection.count_documents({'role': 'user'})
-        trainer_users = users_collection.count_documents({'role': 'trainer'})
-        
-        # Mock some additional stats (in real app, you'd calculate these)
-        stats = {
-            'totalUsers': total_users,
-            'activeUsers': max(0, total_users - 2),  # Mock active users
-            'adminUsers': admin_users,
-            'regularUsers': regular_users,
-            'trainerUsers': trainer_users,
-            'totalWorkouts': total_users * 8,  # Mock workout count
-            'newSignups': 5,  # Mock new signups
-            'revenue': 15420,  # Mock revenue
-            'avgSessionTime': '24 min'
-        }
+        # Counters are maintained on every user insert and rebuilt when stale,
+        # so this is usually one small read
+        user_stats = get_user_stats()
+        stats = build_admin_stats(user_stats)
         
         print(f"📊 Admin stats: {stats}")
         return jsonify({'stats': stats}), 200
@@ -232,34 +354,24 @@ def google_login():
         else:
             print(f"   🆕 Creating new user from Google: {email}")
             # Create new user from Google data
-            new_user = {
-                'email': email,
-                'firstName': name.split(' ')[0] if name else '',
-                'lastName': ' '.join(name.split(' ')[1:]) if name and len(name.split(' ')) > 1 else '',
-                'role': 'user',
-                'authProvider': 'google',
-                'photoURL': photo_url,
-                'createdAt': datetime.utcnow().isoformat(),
-                'password': None  # No password for Google users
-            }
+            new_user = build_google_user(email, name, photo_url)
             
-            result = users_collection.insert_one(new_user)
-            new_user['_id'] = result.inserted_id
-            user = new_user
+            try:
+                result = users_collection.insert_one(new_user)
+            except DuplicateKeyError:
+                # A concurrent first sign-in with the same account inserted it first
+                user = users_collection.find_one({'email': email})
+            else:
+                new_user['_id'] = result.inserted_id
+                record_user_created('user', new_user['createdAt'])
+                user = new_user
+        record_user_login(user['_id'])
         
         # Create JWT token
         token = create_access_token(identity={'email': user['email'], 'role': user.get('role', 'user')})
         
         # Prepare user data
-        user_data = {
-            'email': user['email'],
-            'role': user.get('role', 'user'),
-            'name': f"{user.get('firstName', '')} {user.get('lastName', '')}".strip() or user['email'].split('@')[0],
-            'firstName': user.get('firstName', ''),
-            'lastName': user.get('lastName', ''),
-            'photoURL': user.get('photoURL', ''),
-            'id': str(user['_id'])
-        }
+        user_data = format_google_user(user)
         
         print(f"   ✅ Google login successful for {email}")
         return jsonify({
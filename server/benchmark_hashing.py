@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Password Hashing Benchmark
+
+Reports hashes/sec per core and for the whole machine for each hashing
+setting, so BCRYPT_ROUNDS / ARGON2_* can be tuned against login throughput.
+
+Usage:
+    python benchmark_hashing.py                       # default settings
+    python benchmark_hashing.py --rounds 10,12,14     # custom bcrypt costs
+    python benchmark_hashing.py --iterations 20
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from password_hashing import make_policy, _hash_password, PasswordHasher
+import argparse
+import os
+import time
+
+PASSWORD = 'benchmark-password-123'
+
+
+def _time_hashes(policy, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        _hash_password(PASSWORD, policy)
+    return time.perf_counter() - start
+
+
+def describe(policy):
+    if policy['scheme'] == 'bcrypt':
+        return f"bcrypt rounds={policy['rounds']}"
+    return (f"argon2id t={policy['time_cost']} m={policy['memory_cost']}KiB "
+            f"p={policy['parallelism']}")
+
+
+def benchmark(policy, iterations, cores):
+    """Return (per-core hashes/sec, all-cores hashes/sec, ms per hash)"""
+    _hash_password(PASSWORD, policy)  # warm up
+
+    elapsed = _time_hashes(policy, iterations)
+    per_core = iterations / elapsed
+
+    with ProcessPoolExecutor(max_workers=cores) as pool:
+        start = time.perf_counter()
+        list(pool.map(_time_hashes, [policy] * cores, [iterations] * cores))
+        all_cores = (iterations * cores) / (time.perf_counter() - start)
+
+    return per_core, all_cores, elapsed / iterations * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark password hashing settings')
+    parser.add_argument('--rounds', default='10,11,12,13', help='comma-separated bcrypt costs')
+    parser.add_argument('--iterations', type=int, default=10, help='hashes per core per setting')
+    parser.add_argument('--cores', type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    policies = [make_policy('bcrypt', rounds=int(r)) for r in args.rounds.split(',')]
+    if PasswordHasher is not None:
+        policies += [
+            make_policy('argon2id', time_cost=2, memory_cost=19456, parallelism=1),
+            make_policy('argon2id', time_cost=3, memory_cost=65536, parallelism=1),
+        ]
+    else:
+        print("ℹ️  argon2-cffi not installed, skipping argon2id settings")
+
+    print("🔐 PASSWORD HASHING BENCHMARK")
+    print("=" * 72)
+    print(f"Cores: {args.cores}   Iterations per core: {args.iterations}")
+    print("-" * 72)
+    print(f"{'Setting':<40}{'ms/hash':>10}{'per core/s':>11}{'total/s':>11}")
+    print("-" * 72)
+    for policy in policies:
+        per_core, all_cores, ms = benchmark(policy, args.iterations, args.cores)
+        print(f"{describe(policy):<40}{ms:>10.1f}{per_core:>11.1f}{all_cores:>11.1f}")
+    print("=" * 72)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Serialization Microbenchmark
+
+Reports the per-document cost of turning Mongo documents into a JSON response
+body: formatting (serializers.Formatter), then encoding with the stdlib encoder
+the way Flask's default provider does (sort_keys, isoformat via default=) and
+with serializers.dumps (orjson when installed).
+
+Usage:
+    python benchmark_serialization.py                  # lists of 1, 20, 100, 1000 docs
+    python benchmark_serialization.py --sizes 50,500 --repeat 10
+"""
+
+from serializers import (
+    tutorial_formatter, format_query, format_application, format_admin_user,
+    dumps, orjson, _default
+)
+from trainer import PUBLIC_TUTORIAL_SUMMARY_FIELDS
+from bson import ObjectId
+from datetime import datetime, timedelta
+import argparse
+import json
+import time
+
+
+def sample_tutorial(i):
+    return {
+        '_id': ObjectId(), 'title': f'Tutorial {i}', 'description': 'Full body strength routine ' * 4,
+        'category': 'strength', 'difficulty': 'intermediate', 'duration': '45 min',
+        'tags': ['strength', 'full-body', 'gym'], 'videoUrl': 'https://example.com/v.mp4',
+        'imageUrl': 'https://example.com/i.jpg', 'trainer_name': 'Coach Sam',
+        'created_at': datetime.utcnow() - timedelta(minutes=i), 'views': i * 7, 'likes': i
+    }
+
+
+def sample_query(i):
+    return {
+        '_id': ObjectId(), 'title': f'Question {i}', 'description': 'How should I warm up? ' * 5,
+        'category': 'training', 'priority': 'medium', 'status': 'answered',
+        'user_email': f'user{i}@example.com', 'assigned_trainer': 'coach@example.com',
+        'response': 'Start with mobility work. ' * 6, 'created_at': datetime.utcnow(),
+        'updated_at': datetime.utcnow(), 'responded_at': datetime.utcnow()
+    }
+
+
+def sample_application(i):
+    return {
+        '_id': ObjectId(), 'firstName': 'Alex', 'lastName': f'Trainer{i}', 'email': f'alex{i}@example.com',
+        'phone': '555-0100', 'dateOfBirth': '1990-01-01', 'gender': 'other', 'experience': '5 years',
+        'certifications': 'NASM CPT', 'specializations': 'Strength', 'bio': 'Coach. ' * 20,
+        'motivation': 'Help people. ' * 10, 'status': 'pending', 'applied_at': datetime.utcnow()
+    }
+
+
+def sample_user(i):
+    return {
+        '_id': ObjectId(), 'email': f'user{i}@example.com', 'role': 'user', 'firstName': 'Jo',
+        'lastName': f'User{i}', 'phone': '555-0101', 'createdAt': datetime.utcnow().isoformat()
+    }
+
+
+KINDS = [
+    ('tutorials', sample_tutorial, tutorial_formatter(tuple(PUBLIC_TUTORIAL_SUMMARY_FIELDS))),
+    ('queries', sample_query, format_query),
+    ('applications', sample_application, format_application),
+    ('users', sample_user, format_admin_user),
+]
+
+
+def stdlib_dumps(obj):
+    # What jsonify() costs with Flask's DefaultJSONProvider
+    return json.dumps(obj, default=_default, sort_keys=True, ensure_ascii=False).encode('utf-8')
+
+
+def per_doc_us(fn, docs, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(docs)
+        best = min(best, time.perf_counter() - start)
+    return best / len(docs) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark document formatting and JSON encoding')
+    parser.add_argument('--sizes', default='1,20,100,1000', help='comma-separated list lengths')
+    parser.add_argument('--repeat', type=int, default=20, help='runs per measurement (best is kept)')
+    args = parser.parse_args()
+
+    print("🧾 SERIALIZATION BENCHMARK")
+    print("=" * 72)
+    print(f"Encoder: {'orjson ' + orjson.__version__ if orjson else 'stdlib json (orjson not installed)'}")
+    print("Microseconds per document, best of", args.repeat)
+    print("-" * 72)
+    print(f"{'Documents':<14}{'Count':>7}{'format':>10}{'stdlib':>10}{'dumps':>10}{'total':>10}{'speedup':>10}")
+    print("-" * 72)
+    for name, make_doc, formatter in KINDS:
+        for size in [int(s) for s in args.sizes.split(',')]:
+            docs = [make_doc(i) for i in range(size)]
+            formatted = formatter.many(docs)
+            fmt = per_doc_us(formatter.many, docs, args.repeat)
+            slow = per_doc_us(lambda _: stdlib_dumps(formatted), formatted, args.repeat)
+            fast = per_doc_us(lambda _: dumps(formatted), formatted, args.repeat)
+            print(f"{name:<14}{size:>7}{fmt:>10.2f}{slow:>10.2f}{fast:>10.2f}"
+                  f"{fmt + fast:>10.2f}{(fmt + slow) / (fmt + fast):>9.1f}x")
+    print("=" * 72)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Application Startup Benchmark
+
+Measures how long a fresh interpreter takes to import the server and build
+the Flask app with create_app(), and checks that no MongoClient was created
+while doing so (so prefork servers can fork workers safely).
+
+Usage:
+    python benchmark_startup.py
+    python benchmark_startup.py --runs 20
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+PROBE = """
+import json, time
+start = time.perf_counter()
+from app import create_app
+imported = time.perf_counter()
+app = create_app()
+built = time.perf_counter()
+import mongo_connection
+print(json.dumps({
+    'import_ms': (imported - start) * 1000,
+    'create_app_ms': (built - imported) * 1000,
+    'total_ms': (built - start) * 1000,
+    'client_created': mongo_connection._client is not None
+}))
+"""
+
+
+def run_probe():
+    output = subprocess.run([sys.executable, '-c', PROBE], capture_output=True, text=True, check=True)
+    return json.loads(output.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark server startup time')
+    parser.add_argument('--runs', type=int, default=10)
+    args = parser.parse_args()
+
+    print("🚀 STARTUP BENCHMARK")
+    print("=" * 50)
+
+    results = [run_probe() for _ in range(args.runs)]
+    for key in ('import_ms', 'create_app_ms', 'total_ms'):
+        values = [r[key] for r in results]
+        print(f"{key:<15} median {statistics.median(values):8.1f} ms   max {max(values):8.1f} ms")
+
+    if any(r['client_created'] for r in results):
+        print("❌ A MongoClient was created during startup")
+        sys.exit(1)
+    print("✅ No MongoClient created during startup")
+
+
+if __name__ == '__main__':
+    main()
@@ -4,7 +4,7 @@ Quick User Database Check
 """
 
 import os
-from pymongo import MongoClient
+from mongo_connection import get_client, get_database
 from flask_bcrypt import Bcrypt
 from dotenv import load_dotenv
 
@@ -24,8 +24,8 @@ def check_all_users():
             return
         
         print(f"🔗 Connecting to MongoDB...")
-        client = MongoClient(mongo_uri)
-        db = client['fithub']
+        client = get_client()
+        db = get_database()
         users_collection = db['users']
         
         # Test connection
@@ -0,0 +1,15 @@
+from dotenv import load_dotenv
+import os
+
+# The .env file is read exactly once, the first time anything imports config
+load_dotenv()
+
+
+class Config:
+    """Flask settings loaded from the environment"""
+    JWT_SECRET_KEY = os.getenv('JWT_SECRET')
+    SECRET_KEY = os.getenv('SECRET_KEY', 'your-secret-key-here')
+    # Opt-in: refuse to start without the indexes correctness depends on. Off by
+    # default so building the app stays free of MongoDB queries; GET /ready
+    # reports missing required indexes either way
+    CHECK_INDEXES = os.getenv('CHECK_INDEXES', '0') == '1'
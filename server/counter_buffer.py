@@ -0,0 +1,125 @@
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+from collections import defaultdict
+import atexit
+import os
+import threading
+
+
+class CounterBuffer:
+    """Aggregate counter increments in-process and flush them with one bulk_write.
+
+    Hot documents get at most one update per flush interval instead of one
+    write per request. Pending increments are flushed from a background
+    thread every `flush_interval` seconds, sooner once `flush_size` distinct
+    documents are waiting, and once more when the process exits. Writes only
+    ever happen on that thread (or in an explicit flush()/stop()), so
+    increment() never blocks on MongoDB and is safe to call from an event
+    loop. `on_flush`, if
+    given, is called with the ids of the documents written by each flush.
+    With `insert_fields` (a function of the document id), missing documents
+    are upserted with those fields set on insert.
+    """
+
+    def __init__(self, collection, flush_interval=5.0, flush_size=1000, on_flush=None, insert_fields=None):
+        self.collection = collection
+        self.flush_interval = flush_interval
+        self.flush_size = flush_size
+        self.on_flush = on_flush
+        self.insert_fields = insert_fields
+        self._pending = defaultdict(lambda: defaultdict(int))
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._thread = None
+        self._pid = None
+
+    def increment(self, doc_id, field, amount=1):
+        """Record an increment of `field` on document `doc_id`"""
+        self._ensure_started()
+        with self._lock:
+            self._pending[doc_id][field] += amount
+            should_flush = len(self._pending) >= self.flush_size
+        if should_flush:
+            # Hand the write to the flusher thread instead of doing it here
+            self._wake.set()
+
+    def pending(self, doc_id, field):
+        """Return the not-yet-flushed increment for a document field"""
+        with self._lock:
+            if doc_id not in self._pending:
+                return 0
+            return self._pending[doc_id].get(field, 0)
+
+    def flush(self):
+        """Write all pending increments in a single unordered bulk_write"""
+        with self._lock:
+            if not self._pending:
+                return 0
+            pending = self._pending
+            self._pending = defaultdict(lambda: defaultdict(int))
+
+        doc_ids = list(pending)
+        operations = [self._operation(doc_id, pending[doc_id]) for doc_id in doc_ids]
+        failed = doc_ids
+        try:
+            self.collection.bulk_write(operations, ordered=False)
+            failed = []
+        except BulkWriteError as e:
+            # Unordered: every operation not listed in writeErrors was applied
+            # and must not be sent again
+            failed = [doc_ids[error['index']] for error in e.details.get('writeErrors', [])]
+            print(f"❌ Error flushing counters: {len(failed)} of {len(operations)} updates failed")
+        except Exception as e:
+            print(f"❌ Error flushing counters: {str(e)}")
+        if failed:
+            # Put the failed increments back so they go out with the next flush
+            with self._lock:
+                for doc_id in failed:
+                    for field, amount in pending[doc_id].items():
+                        self._pending[doc_id][field] += amount
+        failed = set(failed)
+        written = [doc_id for doc_id in doc_ids if doc_id not in failed]
+        if written and self.on_flush:
+            self.on_flush(written)
+        return len(written)
+
+    def _operation(self, doc_id, fields):
+        if self.insert_fields is None:
+            return UpdateOne({'_id': doc_id}, {'$inc': dict(fields)})
+        return UpdateOne(
+            {'_id': doc_id},
+            {'$inc': dict(fields), '$setOnInsert': self.insert_fields(doc_id)},
+            upsert=True
+        )
+
+    def stop(self):
+        """Stop the background flusher and flush what is left"""
+        self._stop.set()
+        self._wake.set()
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=self.flush_interval + 1)
+        self.flush()
+
+    def _ensure_started(self):
+        # Started lazily (and restarted after fork) so the flusher thread
+        # always belongs to the process that is serving requests.
+        if self._thread is not None and self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._thread is not None and self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            self._stop.clear()
+            self._wake = threading.Event()
+            self._thread = threading.Thread(target=self._run, name='counter-buffer-flush', daemon=True)
+            self._thread.start()
+            atexit.register(self.stop)
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            if self._stop.is_set():
+                break
+            self.flush()
@@ -10,6 +10,8 @@ import getpass
 from pymongo import MongoClient
 from flask_bcrypt import Bcrypt
 from dotenv import load_dotenv
+from admin_stats import record_user_created
+from datetime import datetime
 import re
 
 # Load environment variables
@@ -149,7 +151,8 @@ def create_admin_account():
             'email': email,
             'password': hashed_password,
             'role': 'admin',
-            'subscribeNewsletter': False
+            'subscribeNewsletter': False,
+            'createdAt': datetime.utcnow().isoformat()
         }
         
         # Add optional fields
@@ -164,6 +167,7 @@ def create_admin_account():
         result = users_collection.insert_one(admin_data)
         
         if result.inserted_id:
+            record_user_created('admin', admin_data['createdAt'])
             print("\n🎉 SUCCESS!")
             print("=" * 50)
             print("✅ Admin account created successfully!")
@@ -1,4 +1,5 @@
 from models import users_collection
+from admin_stats import record_user_created
 from flask_bcrypt import Bcrypt
 from datetime import datetime
 
@@ -24,6 +25,7 @@ def create_trainer():
     }
     
     users_collection.insert_one(trainer_data)
+    record_user_created('trainer', trainer_data['createdAt'])
     print("✅ Trainer created successfully!")
     print("📧 Email: trainer@fithub.com")
     print("🔑 Password: trainer123")
@@ -5,7 +5,7 @@ Usage: python debug_admin.py
 """
 
 import os
-from pymongo import MongoClient
+from mongo_connection import get_client, get_database
 from flask_bcrypt import Bcrypt
 from dotenv import load_dotenv
 
@@ -22,8 +22,8 @@ def debug_admin_login():
     
     try:
         # Connect to MongoDB
-        client = MongoClient(os.getenv('MONGO_URI'))
-        db = client['fithub']
+        client = get_client()
+        db = get_database()
         users_collection = db['users']
         
         print("✅ Connected to MongoDB successfully")
@@ -119,8 +119,8 @@ def check_database_connection():
         
         print(f"🔗 MongoDB URI: {mongo_uri[:20]}...")
         
-        client = MongoClient(mongo_uri)
-        db = client['fithub']
+        client = get_client()
+        db = get_database()
         users_collection = db['users']
         
         # Test connection
@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+Ensure Indexes
+
+Diffs the live indexes of every collection against index_specs.INDEX_SPECS,
+builds the missing ones, and reports:
+  • indexes whose definition differs from the spec (never rebuilt automatically)
+  • indexes that exist but are not in the spec
+  • unused indexes ($indexStats: no accesses since the server started)
+  • redundant indexes (a prefix of another index with the same directions)
+  • index sizes per collection
+
+Builds go through one createIndexes command per collection. MongoDB 4.2+
+builds indexes without holding an exclusive lock for the whole build;
+`background: true` is also set so older servers do the same.
+
+Nothing is ever dropped: drops are printed as suggestions to review.
+
+The unique indexes listed in index_specs.REQUIRED_INDEXES are flagged as
+required in the report; the app's GET /ready (and CHECK_INDEXES=1 startup)
+uses missing_required_indexes() to refuse traffic without them.
+
+Usage:
+    python ensure_indexes.py                      # build missing indexes, then report
+    python ensure_indexes.py --check              # report only; exit 1 on missing/differing indexes
+    python ensure_indexes.py --collection queries --collection users
+"""
+
+from models import db
+from index_specs import INDEX_SPECS, REQUIRED_INDEXES
+from pymongo import IndexModel
+from pymongo.errors import OperationFailure
+import argparse
+import sys
+
+# Options that change what an index enforces or matches; anything else the
+# server reports (v, ns, background, textIndexVersion, ...) is ignored
+COMPARED_OPTIONS = ('unique', 'sparse', 'partialFilterExpression', 'expireAfterSeconds', 'weights', 'default_language')
+OPTION_DEFAULTS = {'unique': False, 'sparse': False}
+
+
+def _key(document):
+    """Index key as a list of (field, direction), numeric directions normalized to int"""
+    return [(field, int(direction) if isinstance(direction, (int, float)) else direction)
+            for field, direction in document['key'].items()]
+
+
+def _is_text(document):
+    return any(direction == 'text' for _, direction in _key(document))
+
+
+def _options(document):
+    return {option: document.get(option, OPTION_DEFAULTS.get(option)) for option in COMPARED_OPTIONS}
+
+
+def _same_key(spec, live):
+    if _is_text(spec):
+        # The server stores text indexes as {_fts: 'text', _ftsx: 1, ...}; the weights carry the fields
+        return 'weights' in live
+    return _key(spec) == _key(live)
+
+
+def diff_indexes(specs, live):
+    """Compare spec IndexModels with live index documents (list_indexes()).
+
+    Returns {'ok': [name], 'missing': [IndexModel], 'differs': [(name, reason)],
+    'extra': [live document]} where `extra` excludes _id_.
+    """
+    live_by_name = {index['name']: index for index in live}
+    matched = {'_id_'}
+    result = {'ok': [], 'missing': [], 'differs': [], 'extra': []}
+    for model in specs:
+        spec = model.document
+        index = live_by_name.get(spec['name'])
+        if index is None:
+            renamed = next((other for other in live if other['name'] not in matched and _same_key(spec, other)), None)
+            if renamed is None:
+                result['missing'].append(model)
+            else:
+                matched.add(renamed['name'])
+                result['differs'].append((spec['name'], f"exists as {renamed['name']}"))
+            continue
+        matched.add(index['name'])
+        if not _same_key(spec, index):
+            result['differs'].append((spec['name'], f"key {dict(_key(index))} != spec {dict(_key(spec))}"))
+            continue
+        # Text options only mean something on text indexes
+        compared = COMPARED_OPTIONS if _is_text(spec) else COMPARED_OPTIONS[:4]
+        spec_options, live_options = _options(spec), _options(index)
+        changed = [f"{option}={live_options[option]!r} (spec {spec_options[option]!r})"
+                   for option in compared if spec_options[option] != live_options[option]]
+        if changed:
+            result['differs'].append((spec['name'], ', '.join(changed)))
+        else:
+            result['ok'].append(spec['name'])
+    result['extra'] = [index for index in live if index['name'] not in matched]
+    return result
+
+
+def _required_models(name):
+    names = REQUIRED_INDEXES.get(name, [])
+    return [model for model in INDEX_SPECS[name] if model.document['name'] in names]
+
+
+def _enforces(spec, live):
+    """Whether a live index has the spec's key and options, under any name"""
+    return any(_same_key(spec, index) and _options(spec) == _options(index) for index in live)
+
+
+def missing_required_indexes(database=None):
+    """['collection.index'] for REQUIRED_INDEXES that no live index enforces"""
+    database = database if database is not None else db
+    missing = []
+    for name in REQUIRED_INDEXES:
+        live = list(database[name].list_indexes())
+        missing += [f"{name}.{model.document['name']}"
+                    for model in _required_models(name) if not _enforces(model.document, live)]
+    return missing
+
+
+async def missing_required_indexes_async(database):
+    """missing_required_indexes() for a Motor database"""
+    missing = []
+    for name in REQUIRED_INDEXES:
+        live = await database[name].list_indexes().to_list(length=None)
+        missing += [f"{name}.{model.document['name']}"
+                    for model in _required_models(name) if not _enforces(model.document, live)]
+    return missing
+
+
+def missing_indexes_error(missing):
+    return RuntimeError(
+        f"Required indexes are missing ({', '.join(missing)}), so duplicate users, applications "
+        "or likes could be written; run `python ensure_indexes.py` first"
+    )
+
+
+def redundant_indexes(live):
+    """[(name, covering index name)] for plain indexes that are a strict prefix of another index"""
+    def plain(index):
+        return not any(option in index for option in ('unique', 'sparse', 'partialFilterExpression', 'expireAfterSeconds')) \
+            and not _is_text(index) and all(isinstance(direction, int) for _, direction in _key(index))
+
+    redundant = []
+    for index in live:
+        if index['name'] == '_id_' or not plain(index):
+            continue
+        key = _key(index)
+        for other in live:
+            if other is not index and plain(other) and len(_key(other)) > len(key) and _key(other)[:len(key)] == key:
+                redundant.append((index['name'], other['name']))
+                break
+    return redundant
+
+
+def index_usage(collection):
+    """{index name: (ops, since)} from $indexStats (this mongod only), or None if unavailable"""
+    try:
+        return {row['name']: (row['accesses']['ops'], row['accesses']['since'])
+                for row in collection.aggregate([{'$indexStats': {}}])}
+    except OperationFailure as e:
+        print(f"⚠️  $indexStats unavailable for {collection.name}: {str(e)}")
+        return None
+
+
+def index_sizes(collection):
+    """{index name: bytes} from $collStats, summed across shards"""
+    sizes = {}
+    try:
+        for row in collection.aggregate([{'$collStats': {'storageStats': {}}}]):
+            for name, size in row['storageStats'].get('indexSizes', {}).items():
+                sizes[name] = sizes.get(name, 0) + size
+    except OperationFailure as e:
+        print(f"⚠️  $collStats unavailable for {collection.name}: {str(e)}")
+    return sizes
+
+
+def build_indexes(collection, models):
+    """Build `models` in one createIndexes command; returns the names built"""
+    background = []
+    for model in models:
+        options = {option: value for option, value in model.document.items() if option != 'key'}
+        background.append(IndexModel(_key(model.document), background=True, **options))
+    return collection.create_indexes(background)
+
+
+def ensure_indexes(collections=None, build=True, verbose=True):
+    """Diff (and, with build, create missing) indexes for the given collections.
+
+    Returns {collection name: diff_indexes() result plus 'built', 'redundant',
+    'unused' and 'sizes'}.
+    """
+    report = {}
+    for name in collections or INDEX_SPECS:
+        if name not in INDEX_SPECS:
+            raise ValueError(f"No index spec for collection '{name}'")
+        collection = db[name]
+        live = list(collection.list_indexes())
+        result = diff_indexes(INDEX_SPECS[name], live)
+        result['built'] = []
+        if build and result['missing']:
+            result['built'] = build_indexes(collection, result['missing'])
+            live = list(collection.list_indexes())
+        result['redundant'] = redundant_indexes(live)
+        usage = index_usage(collection) or {}
+        # Unique, partial and TTL indexes do their job without being read by queries
+        result['unused'] = [
+            (index['name'], usage[index['name']][1]) for index in live
+            if index['name'] in usage and usage[index['name']][0] == 0 and index['name'] != '_id_'
+            and not any(option in index for option in ('unique', 'partialFilterExpression', 'expireAfterSeconds'))
+        ]
+        result['sizes'] = index_sizes(collection)
+        report[name] = result
+        if verbose:
+            print_collection_report(name, result)
+    return report
+
+
+def _format_size(size):
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if size < 1024 or unit == 'GB':
+            return f"{size:.0f} {unit}" if unit == 'B' else f"{size:.1f} {unit}"
+        size /= 1024.0
+
+
+def print_collection_report(name, result):
+    sizes = result['sizes']
+    print(f"\n📁 {name}: {len(result['ok'])} ok, {len(result['missing'])} missing, "
+          f"{len(result['differs'])} differ, {len(result['extra'])} not in spec "
+          f"({_format_size(sum(sizes.values()))} of indexes)")
+    built = set(result['built'])
+    required = set(REQUIRED_INDEXES.get(name, []))
+    for model in result['missing']:
+        index_name = model.document['name']
+        print(f"   {'🔨 built' if index_name in built else '❌ missing'}: {index_name}"
+              f"{' (required)' if index_name in required else ''}")
+    for index_name, reason in result['differs']:
+        print(f"   ⚠️  differs: {index_name} — {reason} (drop and re-run to rebuild)")
+    for index in result['extra']:
+        print(f"   ➕ not in spec: {index['name']} {_format_size(sizes.get(index['name'], 0))}")
+    for index_name, covering in result['redundant']:
+        print(f"   ♻️  redundant: {index_name} is a prefix of {covering} "
+              f"-> db.{name}.dropIndex('{index_name}')")
+    for index_name, since in result['unused']:
+        print(f"   💤 unused since {since}: {index_name} {_format_size(sizes.get(index_name, 0))}")
+    for index_name, size in sorted(sizes.items(), key=lambda item: -item[1]):
+        print(f"      {index_name:<55}{_format_size(size):>12}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Diff live MongoDB indexes against index_specs.py and build missing ones')
+    parser.add_argument('--check', action='store_true', help='report only; exit 1 if indexes are missing or differ')
+    parser.add_argument('--collection', action='append', help='limit to this collection (repeatable)')
+    args = parser.parse_args()
+
+    print("🔧 ENSURE INDEXES" + (" (check only)" if args.check else ""))
+    print("=" * 72)
+    report = ensure_indexes(args.collection, build=not args.check)
+
+    missing = sum(len(result['missing']) - len(result['built']) for result in report.values())
+    differs = sum(len(result['differs']) for result in report.values())
+    built = sum(len(result['built']) for result in report.values())
+    print("\n" + "=" * 72)
+    print(f"Built {built}, missing {missing}, differing {differs}")
+    if missing or differs:
+        print("❌ Live indexes do not match index_specs.py")
+        return 1
+    print("✅ Live indexes match index_specs.py")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
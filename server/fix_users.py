@@ -8,6 +8,7 @@ import getpass
 from pymongo import MongoClient
 from flask_bcrypt import Bcrypt
 from dotenv import load_dotenv
+from admin_stats import rebuild_user_stats
 
 # Load environment variables
 load_dotenv()
@@ -93,6 +94,8 @@ def delete_broken_users():
         result = users_collection.delete_many({'password': {'$exists': False}})
         
         print(f"🗑️  Deleted {result.deleted_count} users without passwords")
+        # Deletes are not counted incrementally; recompute the admin user stats
+        rebuild_user_stats()
         print("✅ Database cleaned up!")
         print("\n💡 Now you can:")
         print("   1. Create a new admin: python create_admin.py")
@@ -0,0 +1,105 @@
+from pymongo import IndexModel, ASCENDING, DESCENDING, TEXT
+
+# Index keys and options that queries also refer to (hints, $text, TTL), so the
+# query code imports them from here. This module only depends on pymongo.
+
+# Trainer inbox (trainer.py): equality on trainer + status, (created_at, _id) order
+QUERY_INBOX_INDEX = [('assigned_trainer', 1), ('status', 1), ('created_at', -1), ('_id', -1)]
+# Claiming the next open queries (trainer.py): by priority, oldest first
+QUERY_CLAIM_INDEX = [('assigned_trainer', 1), ('status', 1), ('priority', 1), ('created_at', 1)]
+# Admin applications listing and status counts: status filter, newest first
+APPLICATIONS_INDEX = [('status', 1), ('applied_at', -1), ('_id', -1)]
+# One like per user per tutorial (tutorial_likes.py checks it exists at startup)
+LIKES_INDEX = [('user_email', 1), ('tutorial_id', 1)]
+# Weighted full-text search (tutorial_search.py)
+TEXT_INDEX_NAME = 'tutorial_text'
+TEXT_INDEX_WEIGHTS = {'title': 10, 'tags': 5, 'description': 3, 'content': 1}
+# Hourly activity buckets (rankings.py) are kept one day past the 7-day popular window
+ACTIVITY_RETENTION_DAYS = 8
+
+# The one declaration of every index the application relies on, per collection.
+# ensure_indexes.py diffs the live indexes against this and builds what is
+# missing; the setup scripts go through it too, so every environment ends up
+# with the same indexes under the same names. Index names are pymongo's
+# defaults unless given, so indexes created before this module match by name.
+#
+# A single-field index is left out when a compound index below starts with the
+# same field (e.g. queries.status -> (status, priority)): the compound index
+# serves the same equality/range queries, and the prefix would only cost writes
+# and memory. ensure_indexes.py reports such leftovers as redundant.
+INDEX_SPECS = {
+    'users': [
+        IndexModel([("email", ASCENDING)], unique=True),
+        # Admin user listing: prefix search on names, role/status filters sorted by
+        # (createdAt, _id); without _id in the key the tie-break is sorted in memory
+        IndexModel([("createdAt", DESCENDING), ("_id", DESCENDING)]),
+        IndexModel([("firstName", ASCENDING)]),
+        IndexModel([("lastName", ASCENDING)]),
+        IndexModel([("role", ASCENDING), ("createdAt", DESCENDING), ("_id", DESCENDING)]),
+        IndexModel([("status", ASCENDING), ("createdAt", DESCENDING), ("_id", DESCENDING)]),
+    ],
+    'trainer_applications': [
+        # Signup lookups by email; at most one pending application per email
+        IndexModel([("email", ASCENDING), ("status", ASCENDING)]),
+        IndexModel(
+            [("email", ASCENDING)],
+            unique=True,
+            partialFilterExpression={"status": "pending"},
+            name="email_pending_unique"
+        ),
+        # Admin listing: status filter, newest first, keyset pages; also covers the status counts
+        IndexModel(APPLICATIONS_INDEX),
+    ],
+    'tutorials': [
+        IndexModel([("category", ASCENDING)]),
+        IndexModel([("difficulty", ASCENDING)]),
+        IndexModel([("created_at", DESCENDING)]),
+        IndexModel([("views", DESCENDING)]),
+        IndexModel([("likes", DESCENDING)]),
+        IndexModel([("tags", ASCENDING)]),
+        IndexModel([("trainer_email", ASCENDING), ("status", ASCENDING)]),
+        # Keyset pagination for the public catalogue: status filter + (created_at, _id) order
+        IndexModel([("status", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)]),
+        # Catalogue filtered by category, tag, difficulty or trainer, same keyset order
+        IndexModel([("status", ASCENDING), ("category", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)]),
+        IndexModel([("status", ASCENDING), ("tags", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)]),
+        IndexModel([("status", ASCENDING), ("difficulty", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)]),
+        IndexModel([("status", ASCENDING), ("trainer_name", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)]),
+        # Full-text search (/trainer/public/tutorials/search), weighted towards titles
+        IndexModel(
+            [(field, TEXT) for field in TEXT_INDEX_WEIGHTS],
+            weights=TEXT_INDEX_WEIGHTS,
+            name=TEXT_INDEX_NAME,
+            default_language='english'
+        ),
+    ],
+    'tutorial_activity': [
+        # Hourly activity buckets for trending rankings: range scans by hour, expired by TTL
+        IndexModel([("hour", ASCENDING)], expireAfterSeconds=ACTIVITY_RETENTION_DAYS * 24 * 3600),
+    ],
+    'tutorial_likes': [
+        # One like per user per tutorial; the unique index makes like/unlike idempotent
+        IndexModel(LIKES_INDEX, unique=True),
+    ],
+    'queries': [
+        IndexModel([("user_email", ASCENDING)]),
+        IndexModel([("priority", ASCENDING)]),
+        IndexModel([("category", ASCENDING)]),
+        IndexModel([("created_at", DESCENDING)]),
+        IndexModel([("updated_at", DESCENDING)]),
+        # Trainer inbox (mine / unassigned views): equality on trainer + status, keyset order
+        IndexModel(QUERY_INBOX_INDEX),
+        # Claiming the next open queries by priority, oldest first
+        IndexModel(QUERY_CLAIM_INDEX),
+        IndexModel([("status", ASCENDING), ("priority", ASCENDING)]),
+    ],
+}
+
+# Indexes that enforce correctness rather than speed up reads: without them
+# duplicate accounts, pending applications or likes can be written. Checked by
+# `ensure_indexes.py --check`, GET /ready and (with CHECK_INDEXES=1) at startup.
+REQUIRED_INDEXES = {
+    'users': ['email_1'],
+    'trainer_applications': ['email_pending_unique'],
+    'tutorial_likes': ['user_email_1_tutorial_id_1'],
+}
@@ -1,4 +1,5 @@
 from models import db, tutorials_collection, queries_collection, users_collection
+from ensure_indexes import ensure_indexes
 from datetime import datetime, timedelta
 import random
 
@@ -6,35 +7,12 @@ def create_indexes():
     """Create database indexes for better performance"""
     print("🔧 Creating database indexes...")
     
-    # Users collection indexes
+    # Every collection's indexes are declared once in index_specs.py
     try:
-        users_collection.create_index("email", unique=True)
-        users_collection.create_index("role")
-        print("✅ Users collection indexes created")
+        ensure_indexes(verbose=False)
+        print("✅ Collection indexes created")
     except Exception as e:
-        print(f"⚠️  Users indexes already exist: {e}")
-    
-    # Tutorials collection indexes
-    try:
-        tutorials_collection.create_index("trainer_email")
-        tutorials_collection.create_index("category")
-        tutorials_collection.create_index("status")
-        tutorials_collection.create_index([("created_at", -1)])
-        tutorials_collection.create_index("tags")
-        print("✅ Tutorials collection indexes created")
-    except Exception as e:
-        print(f"⚠️  Tutorials indexes: {e}")
-    
-    # Queries collection indexes
-    try:
-        queries_collection.create_index("user_email")
-        queries_collection.create_index("assigned_trainer")
-        queries_collection.create_index("status")
-        queries_collection.create_index([("created_at", -1)])
-        queries_collection.create_index("category")
-        print("✅ Queries collection indexes created")
-    except Exception as e:
-        print(f"⚠️  Queries indexes: {e}")
+        print(f"⚠️  Indexes: {e}")
 
 def show_collection_stats():
     """Display current collection statistics"""
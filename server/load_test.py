@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Local Load Test
+
+Hammers one endpoint with concurrent clients and reports throughput and
+latency percentiles. With --compare it starts the debug server
+(`python app.py` style) and the production server (`serve.py`) on separate
+ports and runs the same load against both.
+
+Usage:
+    python load_test.py --url http://localhost:5000/trainer/public/tutorials
+    python load_test.py --compare --path /trainer/public/tutorials --concurrency 50
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+
+DEV_SERVER = "from app import create_app; create_app().run(port={port}, debug=True, use_reloader=False)"
+
+
+def run_load(url, concurrency, duration):
+    """Run `concurrency` clients for `duration` seconds and return a summary dict"""
+    latencies = []
+    errors = 0
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+
+    def client():
+        nonlocal errors
+        local_latencies, local_errors = [], 0
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            try:
+                with urllib.request.urlopen(url, timeout=10) as response:
+                    response.read()
+                local_latencies.append((time.perf_counter() - start) * 1000)
+            except (urllib.error.URLError, OSError):
+                local_errors += 1
+        with lock:
+            latencies.extend(local_latencies)
+            errors += local_errors
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for _ in range(concurrency):
+            pool.submit(client)
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+
+    def percentile(p):
+        return latencies[min(len(latencies) - 1, int(len(latencies) * p))] if latencies else 0
+
+    return {
+        'requests': len(latencies),
+        'errors': errors,
+        'rps': len(latencies) / elapsed,
+        'p50_ms': percentile(0.50),
+        'p95_ms': percentile(0.95),
+        'p99_ms': percentile(0.99),
+        'mean_ms': statistics.mean(latencies) if latencies else 0
+    }
+
+
+def print_summary(label, summary):
+    print(f"{label:<12}{summary['rps']:>10.1f} req/s   p50 {summary['p50_ms']:7.1f} ms   "
+          f"p95 {summary['p95_ms']:7.1f} ms   p99 {summary['p99_ms']:7.1f} ms   "
+          f"errors {summary['errors']}")
+
+
+def wait_until_ready(base_url, timeout=30):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            with urllib.request.urlopen(f"{base_url}/health", timeout=1):
+                return True
+        except (urllib.error.URLError, OSError):
+            time.sleep(0.2)
+    return False
+
+
+def start_server(kind, port):
+    env = dict(os.environ, PORT=str(port), HOST='127.0.0.1')
+    if kind == 'dev':
+        cmd = [sys.executable, '-c', DEV_SERVER.format(port=port)]
+    else:
+        cmd = [sys.executable, 'serve.py']
+    return subprocess.Popen(cmd, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def compare(path, concurrency, duration):
+    results = {}
+    for kind, port in (('dev', 5101), ('production', 5102)):
+        process = start_server(kind, port)
+        try:
+            base_url = f"http://127.0.0.1:{port}"
+            if not wait_until_ready(base_url):
+                print(f"❌ {kind} server did not start on port {port}")
+                continue
+            run_load(base_url + path, concurrency, 1)  # warm up
+            results[kind] = run_load(base_url + path, concurrency, duration)
+            print_summary(kind, results[kind])
+        finally:
+            process.terminate()
+            process.wait(timeout=30)
+
+    if 'dev' in results and 'production' in results and results['dev']['rps']:
+        print(f"\n📈 Production throughput: {results['production']['rps'] / results['dev']['rps']:.1f}x dev server")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Local load test for the Fit-Hub API')
+    parser.add_argument('--url', default='http://localhost:5000/trainer/public/tutorials')
+    parser.add_argument('--compare', action='store_true', help='run against dev and production servers')
+    parser.add_argument('--path', default='/trainer/public/tutorials', help='path used with --compare')
+    parser.add_argument('--concurrency', type=int, default=20)
+    parser.add_argument('--duration', type=float, default=10, help='seconds per run')
+    args = parser.parse_args()
+
+    print("🏋️ LOAD TEST")
+    print("=" * 90)
+    print(f"Concurrency: {args.concurrency}   Duration: {args.duration}s")
+    print("-" * 90)
+    if args.compare:
+        compare(args.path, args.concurrency, args.duration)
+    else:
+        print_summary('target', run_load(args.url, args.concurrency, args.duration))
+
+
+if __name__ == '__main__':
+    main()
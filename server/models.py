@@ -1,13 +1,38 @@
-from pymongo import MongoClient
-from dotenv import load_dotenv
-import os
+from mongo_connection import get_database
 
-load_dotenv()
 
-client = MongoClient(os.getenv('MONGO_URI'))
-db = client['fithub']
+class LazyCollection:
+    """Stand-in for a pymongo Collection that connects on first use.
 
-users_collection = db['users']  # ✅ This is what gets imported in auth.py
-tutorials_collection = db['tutorials']  # For trainer tutorials
-queries_collection = db['queries']  # For user queries to trainers
-trainer_applications_collection = db['trainer_applications']  # For pending trainer approvals
+    Importing models (and everything that imports it) therefore never opens a
+    connection, and each forked worker resolves collections against its own
+    MongoClient instead of one inherited from the parent process.
+    """
+
+    def __init__(self, name=None):
+        self._name = name
+
+    def _resolve(self):
+        database = get_database()
+        return database if self._name is None else database[self._name]
+
+    def __getattr__(self, attr):
+        return getattr(self._resolve(), attr)
+
+    def __getitem__(self, key):
+        return self._resolve()[key]
+
+    def __repr__(self):
+        return f"LazyCollection({self._name or 'db'!r})"
+
+
+db = LazyCollection()
+
+users_collection = LazyCollection('users')  # ✅ This is what gets imported in auth.py
+tutorials_collection = LazyCollection('tutorials')  # For trainer tutorials
+queries_collection = LazyCollection('queries')  # For user queries to trainers
+trainer_applications_collection = LazyCollection('trainer_applications')  # For pending trainer approvals
+stats_collection = LazyCollection('stats')  # Materialized dashboard counters (see admin_stats.py)
+tutorial_activity_collection = LazyCollection('tutorial_activity')  # Hourly view/like buckets (see rankings.py)
+tutorial_rankings_collection = LazyCollection('tutorial_rankings')  # Precomputed trending/popular rankings
+tutorial_likes_collection = LazyCollection('tutorial_likes')  # One record per (user, tutorial) like
@@ -0,0 +1,217 @@
+from pymongo import MongoClient, monitoring
+import config  # noqa: F401  (loads .env)
+import os
+import threading
+import time
+
+# Connection pool settings, all overridable from the environment / .env file
+MONGO_URI = os.getenv('MONGO_URI')
+MONGO_DB_NAME = os.getenv('MONGO_DB_NAME', 'fithub')
+MAX_POOL_SIZE = int(os.getenv('MONGO_MAX_POOL_SIZE', '100'))
+MIN_POOL_SIZE = int(os.getenv('MONGO_MIN_POOL_SIZE', '0'))
+WAIT_QUEUE_TIMEOUT_MS = int(os.getenv('MONGO_WAIT_QUEUE_TIMEOUT_MS', '2000'))
+SERVER_SELECTION_TIMEOUT_MS = int(os.getenv('MONGO_SERVER_SELECTION_TIMEOUT_MS', '5000'))
+CONNECT_TIMEOUT_MS = int(os.getenv('MONGO_CONNECT_TIMEOUT_MS', '5000'))
+SOCKET_TIMEOUT_MS = int(os.getenv('MONGO_SOCKET_TIMEOUT_MS', '30000'))
+READ_PREFERENCE = os.getenv('MONGO_READ_PREFERENCE', 'primary')
+
+# Upper bounds (ms) of the latency histogram buckets; the last bucket is open-ended
+LATENCY_BUCKETS_MS = [1, 5, 10, 25, 50, 100, 250, 500, 1000]
+
+
+def _new_latency_stats():
+    return {'count': 0, 'failures': 0, 'total_ms': 0.0, 'max_ms': 0.0,
+            'buckets': [0] * (len(LATENCY_BUCKETS_MS) + 1)}
+
+
+def _observe(stats, duration_ms):
+    stats['count'] += 1
+    stats['total_ms'] += duration_ms
+    stats['max_ms'] = max(stats['max_ms'], duration_ms)
+    for i, bound in enumerate(LATENCY_BUCKETS_MS):
+        if duration_ms <= bound:
+            stats['buckets'][i] += 1
+            return
+    stats['buckets'][-1] += 1
+
+
+class MongoMetrics:
+    """Thread-safe store for per-command latencies and pool checkout waits"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.commands = {}
+            self.checkout_wait = _new_latency_stats()
+            self.connections_open = 0
+            self.connections_checked_out = 0
+            self.pool_cleared = 0
+
+    def record_command(self, command_name, duration_ms, failed=False):
+        with self._lock:
+            stats = self.commands.setdefault(command_name, _new_latency_stats())
+            _observe(stats, duration_ms)
+            if failed:
+                stats['failures'] += 1
+
+    def record_checkout(self, wait_ms, failed=False):
+        with self._lock:
+            _observe(self.checkout_wait, wait_ms)
+            if failed:
+                self.checkout_wait['failures'] += 1
+            else:
+                self.connections_checked_out += 1
+
+    def adjust(self, attribute, delta):
+        with self._lock:
+            setattr(self, attribute, getattr(self, attribute) + delta)
+
+    def snapshot(self):
+        """Return a JSON-serializable copy of the current metrics"""
+        def summarize(stats):
+            summary = dict(stats)
+            summary['avg_ms'] = round(stats['total_ms'] / stats['count'], 3) if stats['count'] else 0
+            summary['total_ms'] = round(stats['total_ms'], 3)
+            summary['max_ms'] = round(stats['max_ms'], 3)
+            summary['buckets'] = dict(zip([f'le_{b}ms' for b in LATENCY_BUCKETS_MS] + ['gt_1000ms'],
+                                          stats['buckets']))
+            return summary
+
+        with self._lock:
+            return {
+                'pool': {
+                    'max_pool_size': MAX_POOL_SIZE,
+                    'min_pool_size': MIN_POOL_SIZE,
+                    'connections_open': self.connections_open,
+                    'connections_checked_out': self.connections_checked_out,
+                    'pool_cleared': self.pool_cleared,
+                    'checkout_wait': summarize(self.checkout_wait)
+                },
+                'commands': {name: summarize(stats) for name, stats in self.commands.items()}
+            }
+
+
+metrics = MongoMetrics()
+
+
+class CommandMetricsListener(monitoring.CommandListener):
+    """Records the server round-trip latency of every command"""
+
+    def started(self, event):
+        pass
+
+    def succeeded(self, event):
+        metrics.record_command(event.command_name, event.duration_micros / 1000.0)
+
+    def failed(self, event):
+        metrics.record_command(event.command_name, event.duration_micros / 1000.0, failed=True)
+
+
+class PoolMetricsListener(monitoring.ConnectionPoolListener):
+    """Tracks open/checked-out connections and how long checkouts wait"""
+
+    # Checkout events fire on the thread doing the checkout
+    _local = threading.local()
+
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        metrics.adjust('pool_cleared', 1)
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_created(self, event):
+        metrics.adjust('connections_open', 1)
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        metrics.adjust('connections_open', -1)
+
+    def connection_check_out_started(self, event):
+        self._local.started = time.perf_counter()
+
+    def connection_check_out_failed(self, event):
+        metrics.record_checkout(self._wait_ms(), failed=True)
+
+    def connection_checked_out(self, event):
+        metrics.record_checkout(self._wait_ms())
+
+    def connection_checked_in(self, event):
+        metrics.adjust('connections_checked_out', -1)
+
+    def _wait_ms(self):
+        started = getattr(self._local, 'started', None)
+        self._local.started = None
+        return (time.perf_counter() - started) * 1000.0 if started else 0.0
+
+
+_client = None
+_client_pid = None
+_client_lock = threading.Lock()
+
+
+def get_client():
+    """Return the process-wide MongoClient, creating it on first use"""
+    global _client, _client_pid
+    # MongoClient is not fork-safe, so a forked worker builds its own
+    if _client is None or _client_pid != os.getpid():
+        with _client_lock:
+            if _client is None or _client_pid != os.getpid():
+                _client = MongoClient(
+                    MONGO_URI,
+                    maxPoolSize=MAX_POOL_SIZE,
+                    minPoolSize=MIN_POOL_SIZE,
+                    waitQueueTimeoutMS=WAIT_QUEUE_TIMEOUT_MS,
+                    serverSelectionTimeoutMS=SERVER_SELECTION_TIMEOUT_MS,
+                    connectTimeoutMS=CONNECT_TIMEOUT_MS,
+                    socketTimeoutMS=SOCKET_TIMEOUT_MS,
+                    readPreference=READ_PREFERENCE,
+                    appname='fithub-server',
+                    event_listeners=[CommandMetricsListener(), PoolMetricsListener()]
+                )
+                _client_pid = os.getpid()
+    return _client
+
+
+def get_database(name=None):
+    """Return the application database from the shared client"""
+    return get_client()[name or MONGO_DB_NAME]
+
+
+def ping():
+    """Health check: round-trip a ping and return (ok, latency_ms)"""
+    start = time.perf_counter()
+    try:
+        get_client().admin.command('ping')
+        return True, round((time.perf_counter() - start) * 1000.0, 3)
+    except Exception as e:
+        print(f"❌ MongoDB ping failed: {str(e)}")
+        return False, None
+
+
+def get_metrics():
+    """Pool and per-command metrics, plus a live ping"""
+    ok, latency_ms = ping()
+    snapshot = metrics.snapshot()
+    snapshot['healthy'] = ok
+    snapshot['ping_ms'] = latency_ms
+    return snapshot
+
+
+def close_client():
+    """Close the shared client (e.g. on shutdown)"""
+    global _client
+    with _client_lock:
+        if _client is not None and _client_pid == os.getpid():
+            _client.close()
+        _client = None
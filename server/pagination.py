@@ -0,0 +1,118 @@
+from bson import ObjectId
+from bson.errors import InvalidId
+from datetime import datetime
+import base64
+import json
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+def parse_limit(value, default=DEFAULT_PAGE_SIZE, max_limit=MAX_PAGE_SIZE):
+    """Parse a ?limit= value, clamping it to the server-side page-size cap"""
+    if value in (None, ''):
+        return default
+    try:
+        limit = int(value)
+    except (TypeError, ValueError):
+        raise ValueError('limit must be an integer')
+    if limit < 1:
+        raise ValueError('limit must be positive')
+    return min(limit, max_limit)
+
+
+def parse_page(value):
+    """Parse a 1-based ?page= value"""
+    if value in (None, ''):
+        return 1
+    try:
+        page = int(value)
+    except (TypeError, ValueError):
+        raise ValueError('page must be an integer')
+    if page < 1:
+        raise ValueError('page must be positive')
+    return page
+
+
+def encode_cursor(sort_value, doc_id):
+    """Build an opaque cursor token from the last document of a page"""
+    if isinstance(sort_value, datetime):
+        payload = {'t': sort_value.isoformat()}
+    else:
+        payload = {'v': sort_value}
+    payload['id'] = str(doc_id)
+    raw = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(token):
+    """Decode a cursor token back into (sort_value, ObjectId)"""
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        if 't' in payload:
+            sort_value = datetime.fromisoformat(payload['t'])
+        else:
+            sort_value = payload['v']
+        return sort_value, ObjectId(payload['id'])
+    except (ValueError, TypeError, KeyError, InvalidId):
+        raise ValueError('Invalid cursor')
+
+
+def keyset_query(query, cursor, sort_field='created_at', direction=-1):
+    """Extend a Mongo filter so it only matches documents after the cursor.
+
+    Pages are ordered by (sort_field, _id) in the given direction; the _id
+    tie-breaker keeps pages stable when several documents share a timestamp.
+    The inclusive range on sort_field is redundant with the $or, but gives the
+    planner index bounds, so the page is read from the index in order.
+    """
+    if not cursor:
+        return query
+    sort_value, last_id = decode_cursor(cursor)
+    op = '$lt' if direction < 0 else '$gt'
+    after = {
+        sort_field: {op + 'e': sort_value},
+        '$or': [
+            {sort_field: {op: sort_value}},
+            {'_id': {op: last_id}}
+        ]
+    }
+    if sort_field in query or '$or' in query:
+        return {'$and': [query, after]}
+    return dict(query, **after)
+
+
+def _find_page(collection, query, cursor, limit, sort_field, direction, projection, hint):
+    find_query = keyset_query(query, cursor, sort_field, direction)
+    documents = (
+        collection.find(find_query, projection)
+        .sort([(sort_field, direction), ('_id', direction)])
+        .limit(limit + 1)
+    )
+    return documents.hint(hint) if hint else documents
+
+
+def _split_page(documents, limit, sort_field):
+    # One extra document was fetched to learn whether another page exists
+    next_cursor = None
+    if len(documents) > limit:
+        documents = documents[:limit]
+        last = documents[-1]
+        next_cursor = encode_cursor(last.get(sort_field), last['_id'])
+    return documents, next_cursor
+
+
+def paginate(collection, query, cursor=None, limit=DEFAULT_PAGE_SIZE,
+             sort_field='created_at', direction=-1, projection=None, hint=None):
+    """Run a keyset-paginated find and return (documents, next_cursor)"""
+    documents = list(_find_page(collection, query, cursor, limit, sort_field, direction, projection, hint))
+    return _split_page(documents, limit, sort_field)
+
+
+async def paginate_async(collection, query, cursor=None, limit=DEFAULT_PAGE_SIZE,
+                         sort_field='created_at', direction=-1, projection=None, hint=None):
+    """paginate() for Motor collections"""
+    documents = await _find_page(collection, query, cursor, limit, sort_field, direction,
+                                 projection, hint).to_list(length=limit + 1)
+    return _split_page(documents, limit, sort_field)
@@ -0,0 +1,222 @@
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from werkzeug.security import check_password_hash as werkzeug_check_password_hash
+import asyncio
+import atexit
+import bcrypt
+import multiprocessing
+import os
+import re
+import threading
+
+try:
+    from argon2 import PasswordHasher
+    from argon2.exceptions import VerificationError, InvalidHashError
+except ImportError:  # argon2-cffi is optional
+    PasswordHasher = None
+
+# bcrypt burns ~250 ms of CPU per call at the default cost. Running it on a
+# dedicated process pool keeps request threads free and lets hashing use every
+# core instead of contending on the GIL. The number of hashes in flight is
+# bounded; once the queue is full callers get HashingPoolSaturated (mapped to a
+# 503 by the auth routes) instead of piling up behind a login storm.
+POOL_WORKERS = int(os.getenv('HASH_POOL_WORKERS', '0')) or (os.cpu_count() or 1)
+QUEUE_SIZE = int(os.getenv('HASH_QUEUE_SIZE', '0')) or POOL_WORKERS * 4
+QUEUE_TIMEOUT = float(os.getenv('HASH_QUEUE_TIMEOUT', '0.5'))
+# The pool is created inside threaded servers (gunicorn gthread, Flask
+# threaded, the Quart loop's helper threads). Forking such a process can copy
+# a lock held by another thread into the child and deadlock it, so workers
+# are started from a clean forkserver process (spawn where that is missing).
+POOL_START_METHOD = os.getenv('HASH_POOL_START_METHOD') or (
+    'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn')
+
+# Hashing policy. New hashes use this scheme and cost; stored hashes below it
+# are upgraded on the next successful login (see needs_rehash).
+PASSWORD_SCHEME = os.getenv('PASSWORD_SCHEME', 'bcrypt')  # "bcrypt" or "argon2id"
+BCRYPT_ROUNDS = int(os.getenv('BCRYPT_ROUNDS', '12'))
+ARGON2_TIME_COST = int(os.getenv('ARGON2_TIME_COST', '3'))
+ARGON2_MEMORY_COST = int(os.getenv('ARGON2_MEMORY_COST', '65536'))  # KiB
+ARGON2_PARALLELISM = int(os.getenv('ARGON2_PARALLELISM', '1'))
+
+BCRYPT_COST_PATTERN = re.compile(r'^\$2[abxy]?\$(\d{2})\$')
+
+_pool = None
+_pool_pid = None
+_pool_lock = threading.Lock()
+_slots = threading.BoundedSemaphore(QUEUE_SIZE)
+
+
+def make_policy(scheme=PASSWORD_SCHEME, rounds=BCRYPT_ROUNDS, time_cost=ARGON2_TIME_COST,
+                memory_cost=ARGON2_MEMORY_COST, parallelism=ARGON2_PARALLELISM):
+    """Build a picklable hashing policy dict"""
+    if scheme == 'argon2id':
+        if PasswordHasher is None:
+            print("⚠️  PASSWORD_SCHEME=argon2id but argon2-cffi is not installed, using bcrypt")
+        else:
+            return {'scheme': 'argon2id', 'time_cost': time_cost,
+                    'memory_cost': memory_cost, 'parallelism': parallelism}
+    return {'scheme': 'bcrypt', 'rounds': rounds}
+
+
+CURRENT_POLICY = make_policy()
+
+
+def _argon2_hasher(policy):
+    return PasswordHasher(time_cost=policy['time_cost'], memory_cost=policy['memory_cost'],
+                          parallelism=policy['parallelism'])
+
+
+def needs_rehash(hashed, policy=None):
+    """Return True when a stored hash is weaker than (or differs from) the policy"""
+    policy = policy or CURRENT_POLICY
+    if not hashed:
+        return False
+    if policy['scheme'] == 'bcrypt':
+        match = BCRYPT_COST_PATTERN.match(hashed)
+        return not match or int(match.group(1)) < policy['rounds']
+    if not hashed.startswith('$argon2id$'):
+        return True
+    return _argon2_hasher(policy).check_needs_rehash(hashed)
+
+
+class HashingPoolSaturated(Exception):
+    """Raised when too many password hashes are already queued"""
+
+
+def _hash_password(password, policy):
+    if policy['scheme'] == 'argon2id':
+        return _argon2_hasher(policy).hash(password)
+    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(policy['rounds'])).decode('utf-8')
+
+
+def _check_password(hashed, password):
+    if hashed.startswith('$argon2'):
+        if PasswordHasher is None:
+            return False
+        try:
+            return PasswordHasher().verify(hashed, password)
+        except (VerificationError, InvalidHashError):
+            return False
+    try:
+        if hashed.startswith('$2'):
+            return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
+        # Legacy werkzeug hashes written by trainer_application.py
+        return werkzeug_check_password_hash(hashed, password)
+    except ValueError:
+        # Not a recognised hash (e.g. a missing or foreign password)
+        return False
+
+
+def _get_pool():
+    global _pool, _pool_pid
+    # Created lazily, and again after fork, so workers never share a parent's pool
+    if _pool is None or _pool_pid != os.getpid():
+        with _pool_lock:
+            if _pool is None or _pool_pid != os.getpid():
+                _pool = ProcessPoolExecutor(
+                    max_workers=POOL_WORKERS, mp_context=multiprocessing.get_context(POOL_START_METHOD))
+                _pool_pid = os.getpid()
+    return _pool
+
+
+def _ready():
+    return True
+
+
+def warm_up():
+    """Start the pool and all of its worker processes now, outside the request path.
+
+    forkserver/spawn workers take a moment to boot and import this module;
+    the servers call this once per worker before taking traffic so the first
+    logins do not pay for it.
+    """
+    pool = _get_pool()
+    for future in [pool.submit(_ready) for _ in range(POOL_WORKERS)]:
+        future.result()
+
+
+def _discard_pool(pool):
+    """Forget a broken pool so the next submit starts a fresh one"""
+    global _pool
+    # A worker that died abruptly (OOM kill, segfault) breaks the whole
+    # executor: every pending and future submit fails with BrokenProcessPool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+
+
+def _submit(fn, *args, blocking=True):
+    acquired = _slots.acquire(timeout=QUEUE_TIMEOUT) if blocking else _slots.acquire(blocking=False)
+    if not acquired:
+        raise HashingPoolSaturated('Password hashing queue is full')
+    try:
+        pool = _get_pool()
+        try:
+            future = pool.submit(fn, *args)
+        except BrokenProcessPool:
+            _discard_pool(pool)
+            pool = _get_pool()
+            future = pool.submit(fn, *args)
+    except Exception:
+        _slots.release()
+        raise
+
+    def done(future):
+        _slots.release()
+        if not future.cancelled() and isinstance(future.exception(), BrokenProcessPool):
+            _discard_pool(pool)
+
+    future.add_done_callback(done)
+    return future
+
+
+def _run(fn, *args):
+    try:
+        return _submit(fn, *args).result()
+    except BrokenProcessPool:
+        # The pool was replaced when the worker died; hashing is safe to retry once
+        return _submit(fn, *args).result()
+
+
+async def _run_async(fn, *args):
+    try:
+        return await asyncio.wrap_future(_submit(fn, *args, blocking=False))
+    except BrokenProcessPool:
+        return await asyncio.wrap_future(_submit(fn, *args, blocking=False))
+
+
+def hash_password(password, policy=None):
+    """Hash a password on the hashing pool using the current policy"""
+    return _run(_hash_password, password, policy or CURRENT_POLICY)
+
+
+def check_password(hashed, password):
+    """Verify a password against a stored hash on the hashing pool"""
+    if not hashed or not password:
+        return False
+    return _run(_check_password, hashed, password)
+
+
+# asyncio variants: never block the event loop waiting for a queue slot
+
+async def hash_password_async(password, policy=None):
+    """Awaitable hash_password for the asyncio serving path"""
+    return await _run_async(_hash_password, password, policy or CURRENT_POLICY)
+
+
+async def check_password_async(hashed, password):
+    """Awaitable check_password for the asyncio serving path"""
+    if not hashed or not password:
+        return False
+    return await _run_async(_check_password, hashed, password)
+
+
+def shutdown():
+    """Stop the hashing pool (called at interpreter exit)"""
+    global _pool
+    if _pool is not None and _pool_pid == os.getpid():
+        _pool.shutdown(wait=True)
+        _pool = None
+
+
+atexit.register(shutdown)
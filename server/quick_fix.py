@@ -8,6 +8,7 @@ import sys
 from pymongo import MongoClient
 from flask_bcrypt import Bcrypt
 from dotenv import load_dotenv
+from admin_stats import rebuild_user_stats
 
 # Load environment variables
 load_dotenv()
@@ -128,6 +129,8 @@ def fix_broken_users():
             # Delete broken users
             result = users_collection.delete_many({'password': {'$exists': False}})
             print(f"✅ Deleted {result.deleted_count} broken users")
+            # Deletes are not counted incrementally; recompute the admin user stats
+            rebuild_user_stats()
         else:
             print("✅ No broken users found")
         
@@ -185,6 +188,8 @@ def create_test_accounts():
         if result.inserted_id:
             print(f"✅ Created user: {user_email} / {user_password}")
         
+        # Accounts were replaced (delete + insert); recompute the admin user stats
+        rebuild_user_stats()
         client.close()
         
         print("\n🎯 TEST CREDENTIALS:")
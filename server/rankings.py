@@ -0,0 +1,198 @@
+from models import tutorials_collection, tutorial_activity_collection, tutorial_rankings_collection
+from counter_buffer import CounterBuffer
+from index_specs import ACTIVITY_RETENTION_DAYS
+from pymongo.errors import DuplicateKeyError
+from bson import ObjectId
+from datetime import datetime, timedelta
+import math
+import os
+import threading
+
+# Trending / popular tutorial rankings.
+#
+# Views and likes are also counted into hourly buckets (batched through a
+# CounterBuffer, one upsert per tutorial-hour per flush):
+# {
+#   _id: '<tutorial id>:2024011513',
+#   tutorial_id: ObjectId(...),
+#   hour: ISODate('2024-01-15T13:00:00Z'),   # TTL-expired after ACTIVITY_RETENTION_DAYS
+#   views: 42,
+#   likes: 3
+# }
+# Every RANKING_INTERVAL seconds one worker (whoever holds the refresh lease)
+# folds the buckets into two precomputed, sorted rankings, each stored as one
+# document so a page is a single $slice read:
+# {
+#   _id: 'trending' | 'popular_week',
+#   items: [{id: ObjectId(...), score: 12.5}, ...],   # best first, at most RANKING_SIZE
+#   size: 500,
+#   computed_at: ISODate(...)
+# }
+RANKING_INTERVAL = float(os.getenv('RANKING_INTERVAL', '300'))
+TRENDING_HALF_LIFE_HOURS = float(os.getenv('TRENDING_HALF_LIFE_HOURS', '24'))
+LIKE_WEIGHT = float(os.getenv('RANKING_LIKE_WEIGHT', '5'))
+RANKING_SIZE = int(os.getenv('RANKING_SIZE', '500'))
+POPULAR_WINDOW_DAYS = ACTIVITY_RETENTION_DAYS - 1  # buckets are kept one day past the window
+RANKINGS = ('trending', 'popular_week')
+LEASE_ID = 'refresh_lease'
+
+
+def bucket_id(tutorial_id, when=None):
+    """Hourly activity bucket id for a tutorial"""
+    return f"{tutorial_id}:{(when or datetime.utcnow()).strftime('%Y%m%d%H')}"
+
+
+def bucket_fields(bucket):
+    """Fields set when an activity bucket is first inserted"""
+    tutorial_id, hour = bucket.split(':')
+    return {'tutorial_id': ObjectId(tutorial_id), 'hour': datetime.strptime(hour, '%Y%m%d%H')}
+
+
+activity_counters = CounterBuffer(
+    tutorial_activity_collection,
+    flush_interval=float(os.getenv('COUNTER_FLUSH_INTERVAL', '5')),
+    flush_size=int(os.getenv('COUNTER_FLUSH_SIZE', '1000')),
+    insert_fields=bucket_fields
+)
+
+
+def record_activity(tutorial_id, field, amount=1):
+    """Count a view or like towards the current hour's bucket"""
+    _ensure_refresher()
+    activity_counters.increment(bucket_id(tutorial_id), field, amount)
+
+
+def activity_pipeline(now):
+    """Per-tutorial decayed (trending) and 7-day (popular_week) scores from the buckets"""
+    decay_per_hour = math.log(2) / TRENDING_HALF_LIFE_HOURS
+    return [
+        {'$match': {'hour': {'$gte': now - timedelta(days=POPULAR_WINDOW_DAYS)}}},
+        {'$project': {
+            'tutorial_id': 1,
+            'activity': {'$add': [
+                {'$ifNull': ['$views', 0]},
+                {'$multiply': [{'$ifNull': ['$likes', 0]}, LIKE_WEIGHT]}
+            ]},
+            'age_hours': {'$divide': [{'$subtract': [now, '$hour']}, 3600 * 1000]}
+        }},
+        {'$group': {
+            '_id': '$tutorial_id',
+            'popular_week': {'$sum': '$activity'},
+            'trending': {'$sum': {'$multiply': [
+                '$activity', {'$exp': {'$multiply': ['$age_hours', -decay_per_hour]}}
+            ]}}
+        }}
+    ]
+
+
+def published_filter(tutorial_ids):
+    """The published tutorials among `tutorial_ids` (drafts and deleted ones are never ranked)"""
+    return {'_id': {'$in': tutorial_ids}, 'status': 'published'}
+
+
+def compute_rankings(now=None):
+    """Rebuild both ranking documents from the activity buckets"""
+    now = now or datetime.utcnow()
+    rows = list(tutorial_activity_collection.aggregate(activity_pipeline(now)))
+    published = {
+        doc['_id'] for doc in tutorials_collection.find(published_filter([row['_id'] for row in rows]), {'_id': 1})
+    }
+    rows = [row for row in rows if row['_id'] in published]
+
+    rankings = {}
+    for name in RANKINGS:
+        ranked = sorted(rows, key=lambda row: (row[name], row['_id']), reverse=True)[:RANKING_SIZE]
+        items = [{'id': row['_id'], 'score': round(row[name], 4)} for row in ranked]
+        tutorial_rankings_collection.replace_one(
+            {'_id': name},
+            {'items': items, 'size': len(items), 'computed_at': now},
+            upsert=True
+        )
+        rankings[name] = items
+    return rankings
+
+
+def claim_refresh(now=None):
+    """Take the fleet-wide refresh lease; False while another worker holds it"""
+    now = now or datetime.utcnow()
+    try:
+        tutorial_rankings_collection.update_one(
+            {'_id': LEASE_ID, 'expires_at': {'$lte': now}},
+            {'$set': {'expires_at': now + timedelta(seconds=RANKING_INTERVAL), 'pid': os.getpid()}},
+            upsert=True
+        )
+        return True
+    except DuplicateKeyError:
+        # The lease document exists and has not expired
+        return False
+
+
+def refresh_rankings(force=False):
+    """Recompute the rankings if this worker wins the lease (or force); returns True if it ran"""
+    if not force and not claim_refresh():
+        return False
+    compute_rankings()
+    return True
+
+
+def get_ranking_page(name, page=1, limit=20):
+    """Return (items, size, computed_at) for one page of a precomputed ranking"""
+    if name not in RANKINGS:
+        raise ValueError(f"ranking must be one of: {', '.join(RANKINGS)}")
+    _ensure_refresher()
+    projection = {'items': {'$slice': [(page - 1) * limit, limit]}, 'size': 1, 'computed_at': 1}
+    ranking = tutorial_rankings_collection.find_one({'_id': name}, projection)
+    if ranking is None and refresh_rankings():
+        # First use: build the rankings instead of answering empty
+        ranking = tutorial_rankings_collection.find_one({'_id': name}, projection)
+    if ranking is None:
+        return [], 0, None
+    return ranking['items'], ranking['size'], ranking['computed_at']
+
+
+_refresher = None
+_refresher_pid = None
+_refresher_lock = threading.Lock()
+_stop = threading.Event()
+
+
+def _ensure_refresher():
+    global _refresher, _refresher_pid
+    # Started lazily (and again after fork) in the process serving requests
+    if _refresher is not None and _refresher_pid == os.getpid():
+        return
+    with _refresher_lock:
+        if _refresher is not None and _refresher_pid == os.getpid():
+            return
+        _refresher_pid = os.getpid()
+        _stop.clear()
+        _refresher = threading.Thread(target=_run, name='ranking-refresh', daemon=True)
+        _refresher.start()
+
+
+def _run():
+    while not _stop.wait(RANKING_INTERVAL):
+        try:
+            refresh_rankings()
+        except Exception as e:
+            print(f"❌ Error refreshing tutorial rankings: {str(e)}")
+
+
+def stop():
+    """Stop the refresher and flush buffered activity"""
+    _stop.set()
+    activity_counters.stop()
+
+
+if __name__ == '__main__':
+    import sys
+
+    if len(sys.argv) > 1 and sys.argv[1] == '--rebuild':
+        rankings = compute_rankings()
+        print(f"✅ Rankings rebuilt: {', '.join(f'{name} ({len(items)})' for name, items in rankings.items())}")
+    else:
+        for name in RANKINGS:
+            items, size, computed_at = get_ranking_page(name, limit=10)
+            print(f"📈 {name}: {size} tutorials, computed {computed_at}")
+            for item in items:
+                print(f"   {item['id']}  {item['score']}")
@@ -1,4 +1,5 @@
 from models import users_collection
+from admin_stats import record_user_created
 from flask_bcrypt import Bcrypt
 from datetime import datetime
 import sys
@@ -44,6 +45,7 @@ def register_trainer():
     
     try:
         users_collection.insert_one(trainer_data)
+        record_user_created('trainer', trainer_data['createdAt'])
         print("\n✅ Trainer registered successfully!")
         print(f"📧 Email: {email}")
         print(f"👤 Name: {first_name} {last_name}")
@@ -102,6 +104,7 @@ def register_multiple_trainers():
         
         try:
             users_collection.insert_one(trainer_data)
+            record_user_created('trainer', trainer_data['createdAt'])
             print(f"✅ Registered: {trainer['firstName']} {trainer['lastName']} ({trainer['email']})")
         except Exception as e:
             print(f"❌ Error registering {trainer['email']}: {str(e)}")
@@ -0,0 +1,141 @@
+from flask import Response, request, jsonify
+from ttl_cache import TTLCache
+from serializers import dumps, loads
+import hashlib
+import os
+import threading
+
+# Response cache for read-heavy public endpoints.
+#
+# Entries live in an in-process LRU+TTL cache, or in Redis when REDIS_URL is
+# set (and redis-py is installed) so every worker shares them. Each entry keeps
+# the payload together with its ETag, so repeat clients get a 304 without the
+# body being rebuilt. Keys are grouped; bumping a group's generation number
+# invalidates every key in it at once (e.g. all catalogue pages), while single
+# keys (e.g. one tutorial) can be dropped precisely.
+RESPONSE_CACHE_TTL = float(os.getenv('RESPONSE_CACHE_TTL', '60'))
+RESPONSE_CACHE_SIZE = int(os.getenv('RESPONSE_CACHE_SIZE', '2048'))
+RESPONSE_CACHE_MAX_AGE = int(os.getenv('RESPONSE_CACHE_MAX_AGE', '0'))
+REDIS_URL = os.getenv('REDIS_URL')
+
+
+class MemoryBackend:
+    """Per-process backend (invalidations are only seen by this worker)"""
+
+    def __init__(self, ttl, maxsize):
+        self._cache = TTLCache(ttl=ttl, maxsize=maxsize)
+        self._generations = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        return self._cache.get(key)
+
+    def set(self, key, value, ttl):
+        self._cache.set(key, value, ttl)
+
+    def delete(self, key):
+        self._cache.delete(key)
+
+    def generation(self, group):
+        return self._generations.get(group, 0)
+
+    def bump(self, group):
+        with self._lock:
+            self._generations[group] = self._generations.get(group, 0) + 1
+
+
+class RedisBackend:
+    """Shared backend: all workers see the same entries and invalidations"""
+
+    def __init__(self, url, prefix='fithub:cache:'):
+        import redis
+        self._redis = redis.Redis.from_url(url)
+        self._prefix = prefix
+
+    def get(self, key):
+        raw = self._redis.get(self._prefix + key)
+        return loads(raw) if raw else None
+
+    def set(self, key, value, ttl):
+        self._redis.set(self._prefix + key, dumps(value), ex=max(1, int(ttl)))
+
+    def delete(self, key):
+        self._redis.delete(self._prefix + key)
+
+    def generation(self, group):
+        return int(self._redis.get(self._prefix + 'gen:' + group) or 0)
+
+    def bump(self, group):
+        self._redis.incr(self._prefix + 'gen:' + group)
+
+
+def make_backend():
+    """Redis when REDIS_URL is configured and usable, otherwise in-process"""
+    if REDIS_URL:
+        try:
+            return RedisBackend(REDIS_URL)
+        except ImportError:
+            print("⚠️  REDIS_URL is set but redis is not installed, using in-process response cache")
+    return MemoryBackend(RESPONSE_CACHE_TTL, RESPONSE_CACHE_SIZE)
+
+
+def compute_etag(payload):
+    """Strong (unquoted) ETag over the canonical JSON encoding of a payload"""
+    return hashlib.sha1(dumps(payload, sort_keys=True)).hexdigest()
+
+
+class ResponseCache:
+    """Cache of JSON payloads + ETags keyed by (group generation, key)"""
+
+    def __init__(self, backend=None, ttl=RESPONSE_CACHE_TTL):
+        self.backend = backend or make_backend()
+        self.ttl = ttl
+
+    def _key(self, group, key):
+        return f'{group}:{self.backend.generation(group)}:{key}'
+
+    def get(self, group, key):
+        """Return (etag, payload) or None"""
+        try:
+            entry = self.backend.get(self._key(group, key))
+        except Exception as e:
+            print(f"⚠️  Response cache read failed: {str(e)}")
+            return None
+        return tuple(entry) if entry else None
+
+    def set(self, group, key, payload, ttl=None):
+        """Store a payload and return its ETag"""
+        etag = compute_etag(payload)
+        try:
+            self.backend.set(self._key(group, key), [etag, payload], self.ttl if ttl is None else ttl)
+        except Exception as e:
+            print(f"⚠️  Response cache write failed: {str(e)}")
+        return etag
+
+    def invalidate(self, group, key=None):
+        """Drop one key, or every key in the group when key is None"""
+        try:
+            if key is None:
+                self.backend.bump(group)
+            else:
+                self.backend.delete(self._key(group, key))
+        except Exception as e:
+            print(f"⚠️  Response cache invalidation failed: {str(e)}")
+
+
+def request_cache_key(args=None):
+    """Cache key for a query string (order-insensitive); defaults to the current request's"""
+    args = request.args if args is None else args
+    return '&'.join(f'{k}={v}' for k, v in sorted(args.items(multi=True))) or '-'
+
+
+def etag_response(payload, etag, status=200):
+    """jsonify a payload with its ETag, or answer 304 if the client already has it"""
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+    else:
+        response = jsonify(payload)
+        response.status_code = status
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = f'public, max-age={RESPONSE_CACHE_MAX_AGE}, must-revalidate'
+    return response
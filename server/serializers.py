@@ -0,0 +1,231 @@
+from bson import ObjectId
+from datetime import date, datetime
+from functools import lru_cache
+from werkzeug.http import http_date
+import json
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib encoder produces the same output
+    orjson = None
+
+# Document -> wire serialization shared by the Flask and Quart apps.
+#
+# Formatters are compiled once from a declarative field list into a single
+# dict comprehension over per-field getters, and leave datetimes as they are:
+# the encoder writes them as ISO 8601 itself (orjson does this natively, in C),
+# instead of every handler calling isoformat() per field per document.
+# Routes that echo a just-written document back unformatted (create_tutorial,
+# submit_query) have always sent its datetimes in Flask's default RFC 822
+# format; http_dates() keeps them that way.
+
+
+def _default(obj):
+    if isinstance(obj, ObjectId):
+        return str(obj)
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+
+def http_dates(doc):
+    """Copy of a raw document with its top-level datetimes as RFC 822 strings
+    (e.g. 'Mon, 15 Jan 2024 10:30:00 GMT'), as Flask's default encoder wrote them"""
+    return {key: http_date(value) if isinstance(value, datetime) else value for key, value in doc.items()}
+
+
+def dumps(obj, sort_keys=False):
+    """Encode obj as JSON bytes, handling ObjectId and datetime"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        return orjson.dumps(obj, default=_default, option=option)
+    return json.dumps(obj, default=_default, sort_keys=sort_keys,
+                      ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def loads(data):
+    """Decode JSON bytes or str"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class FastJSONMixin:
+    """Mix into a Flask/Quart DefaultJSONProvider to encode responses with dumps()"""
+
+    def dumps(self, obj, **kwargs):
+        return dumps(obj, sort_keys=kwargs.get('sort_keys', False)).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return loads(s)
+
+    def response(self, *args, **kwargs):
+        if args and kwargs:
+            raise TypeError('jsonify() behavior undefined when passed both args and kwargs')
+        obj = (args[0] if len(args) == 1 else list(args)) if args else kwargs
+        return self._app.response_class(dumps(obj), mimetype='application/json')
+
+
+# Field specs: (output name, getter(doc)) pairs
+
+def field(name, default='', source=None):
+    """Copy a value, falling back to a default when it is missing"""
+    source = source or name
+    return name, lambda doc: doc.get(source, default)
+
+
+def timestamp(name, default='', source=None):
+    """A datetime, left for the encoder to write as ISO 8601"""
+    source = source or name
+    return name, lambda doc: doc.get(source) or default
+
+
+def object_id(name='id', source='_id'):
+    """An ObjectId as its hex string"""
+    return name, lambda doc: str(doc[source])
+
+
+def computed(name, fn):
+    """A value derived from the whole document"""
+    return name, fn
+
+
+class Formatter:
+    """A compiled document formatter; call it on one document or use many()"""
+
+    def __init__(self, fields):
+        getters = tuple(fields)
+        self.fields = [name for name, _ in getters]
+        self.one = lambda doc: {name: get(doc) for name, get in getters}
+
+    def __call__(self, doc):
+        return self.one(doc)
+
+    def many(self, docs):
+        """Format an iterable of documents (e.g. a cursor) into a list"""
+        return list(map(self.one, docs))
+
+
+def display_name(user):
+    return f"{user.get('firstName', '')} {user.get('lastName', '')}".strip() or user['email'].split('@')[0]
+
+
+TUTORIAL_FIELDS = dict([
+    object_id(),
+    field('title'),
+    field('description'),
+    field('content'),
+    field('category'),
+    field('difficulty', 'beginner'),
+    field('duration'),
+    field('tags', ()),
+    field('videoUrl'),
+    field('imageUrl'),
+    field('trainer_name', 'Anonymous'),
+    timestamp('created_at'),
+    timestamp('updated_at'),
+    field('status', 'published'),
+    field('views', 0),
+    field('likes', 0),
+])
+
+TUTORIAL_DETAIL_FIELDS = ['id', 'title', 'description', 'content', 'category', 'difficulty',
+                          'duration', 'tags', 'videoUrl', 'imageUrl', 'trainer_name',
+                          'created_at', 'views', 'likes']
+
+
+@lru_cache(maxsize=64)
+def tutorial_formatter(fields):
+    """Compiled formatter for a tuple of tutorial output fields"""
+    return Formatter((name, TUTORIAL_FIELDS[name]) for name in fields)
+
+
+def format_tutorial_fields(tutorial, fields):
+    """Format a projected tutorial document, emitting only the requested fields"""
+    return tutorial_formatter(tuple(fields))(tutorial)
+
+
+def format_tutorial_details(tutorial, views):
+    """Format a full tutorial document for the detail page"""
+    formatted = tutorial_formatter(tuple(TUTORIAL_DETAIL_FIELDS))(tutorial)
+    formatted['views'] = views
+    return formatted
+
+
+format_query = Formatter([
+    object_id(),
+    field('title'),
+    field('description'),
+    field('category', 'general'),
+    field('priority', 'medium'),
+    field('status', 'open'),
+    field('user_email'),
+    computed('user_name', lambda query: query.get('user_name', query['user_email'].split('@')[0])),
+    field('assigned_trainer', None),
+    field('response'),
+    timestamp('created_at'),
+    timestamp('updated_at'),
+    timestamp('responded_at', None),
+])
+
+# Trainer application (never includes the password) for the admin dashboard
+format_application = Formatter([
+    object_id(),
+    field('firstName'),
+    field('lastName'),
+    field('email'),
+    field('phone'),
+    field('dateOfBirth'),
+    field('gender'),
+    field('experience'),
+    field('certifications'),
+    field('specializations'),
+    field('bio'),
+    field('motivation'),
+    field('status'),
+    timestamp('applied_at'),
+    timestamp('reviewed_at', None),
+    field('reviewed_by'),
+    field('admin_notes'),
+    field('rejection_reason'),
+])
+
+# User payload returned alongside a login token
+format_login_user = Formatter([
+    field('email'),
+    field('role', 'user'),
+    computed('name', display_name),
+    field('firstName'),
+    field('lastName'),
+    field('phone'),
+    object_id(),
+])
+
+# User payload returned alongside a Google login token
+format_google_user = Formatter([
+    field('email'),
+    field('role', 'user'),
+    computed('name', display_name),
+    field('firstName'),
+    field('lastName'),
+    field('photoURL'),
+    object_id(),
+])
+
+# Row in the admin user listing
+format_admin_user = Formatter([
+    object_id(),
+    computed('name', display_name),
+    field('email'),
+    field('role', 'user'),
+    field('firstName'),
+    field('lastName'),
+    field('phone'),
+    field('dateOfBirth'),
+    field('gender'),
+    field('joinDate', '2024-01-01', source='createdAt'),
+    field('status', 'active'),
+    computed('workouts', lambda user: 0),  # You can add logic to count workouts
+])
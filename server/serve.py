@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Production Server
+
+Serves create_app() with multiple worker processes and threads instead of the
+single-process debug server started by `python app.py`.
+
+    gunicorn (Linux/macOS):  pip install gunicorn
+    waitress (Windows):      pip install waitress
+
+Configuration (environment / .env):
+    HOST=0.0.0.0              WEB_SERVER=auto|gunicorn|waitress
+    PORT=5000                 WEB_WORKERS=<cpu count * 2 + 1> (or WEB_CONCURRENCY)
+    WEB_THREADS=4             WEB_TIMEOUT=30
+    WEB_GRACEFUL_TIMEOUT=30   WEB_MAX_REQUESTS=0 (recycle workers after N requests)
+
+The public response cache lives in each worker unless REDIS_URL is set, and
+tutorial edits only invalidate the worker that handled them, so other workers
+would keep serving deleted or edited tutorials. gunicorn therefore refuses to
+start more than one worker without a usable REDIS_URL (redis installed);
+set WEB_WORKERS=1 to run without Redis.
+
+Usage:
+    python serve.py
+"""
+
+import config  # noqa: F401  (loads .env)
+import importlib.util
+import os
+import signal
+import sys
+
+HOST = os.getenv('HOST', '0.0.0.0')
+PORT = int(os.getenv('PORT', '5000'))
+WEB_SERVER = os.getenv('WEB_SERVER', 'auto')
+WEB_WORKERS = int(os.getenv('WEB_WORKERS') or os.getenv('WEB_CONCURRENCY') or '0') or (os.cpu_count() or 1) * 2 + 1
+WEB_THREADS = int(os.getenv('WEB_THREADS', '4'))
+WEB_TIMEOUT = int(os.getenv('WEB_TIMEOUT', '30'))
+WEB_GRACEFUL_TIMEOUT = int(os.getenv('WEB_GRACEFUL_TIMEOUT', '30'))
+WEB_MAX_REQUESTS = int(os.getenv('WEB_MAX_REQUESTS', '0'))
+
+
+def run_gunicorn():
+    from gunicorn.app.base import BaseApplication
+
+    class FitHubApplication(BaseApplication):
+        def load_config(self):
+            settings = {
+                'bind': f'{HOST}:{PORT}',
+                'workers': WEB_WORKERS,
+                'threads': WEB_THREADS,
+                'worker_class': 'gthread',
+                'timeout': WEB_TIMEOUT,
+                'graceful_timeout': WEB_GRACEFUL_TIMEOUT,
+                'max_requests': WEB_MAX_REQUESTS,
+                'max_requests_jitter': WEB_MAX_REQUESTS // 10,
+                # The app is built in each worker after fork, so nothing
+                # (MongoClient, hashing pool, flusher threads) crosses a fork
+                'preload_app': False,
+                'post_worker_init': lambda worker: _warm_up_worker(),
+                'worker_exit': lambda server, worker: _shutdown_worker(),
+            }
+            for key, value in settings.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            from app import create_app
+            return create_app()
+
+    if WEB_WORKERS > 1 and not _shared_cache_available():
+        print(f"❌ {WEB_WORKERS} workers need a shared response cache, or a deleted or edited "
+              "tutorial keeps being served by the workers that did not handle the change. "
+              "Set REDIS_URL (pip install redis) or WEB_WORKERS=1")
+        sys.exit(1)
+    print(f"🚀 gunicorn on {HOST}:{PORT} ({WEB_WORKERS} workers x {WEB_THREADS} threads)")
+    FitHubApplication().run()
+
+
+def _shared_cache_available():
+    return bool(os.getenv('REDIS_URL')) and importlib.util.find_spec('redis') is not None
+
+
+def run_waitress():
+    from waitress import serve
+    from app import create_app
+
+    def handle_signal(signum, frame):
+        _shutdown_worker()
+        sys.exit(0)
+
+    signal.signal(signal.SIGINT, handle_signal)
+    signal.signal(signal.SIGTERM, handle_signal)
+
+    # waitress is single-process, so all concurrency comes from its thread pool
+    threads = WEB_WORKERS * WEB_THREADS
+    print(f"🚀 waitress on {HOST}:{PORT} ({threads} threads)")
+    app = create_app()
+    _warm_up_worker()
+    serve(app, host=HOST, port=PORT, threads=threads)
+
+
+def _warm_up_worker():
+    # Boot the password hashing processes before the first request needs them
+    import password_hashing
+    password_hashing.warm_up()
+
+
+def _shutdown_worker():
+    from app import shutdown
+    print(f"🛑 Worker {os.getpid()} shutting down, flushing buffered work")
+    shutdown()
+
+
+def main():
+    server = WEB_SERVER
+    if server == 'auto':
+        server = 'waitress' if os.name == 'nt' else 'gunicorn'
+    try:
+        __import__(server)
+    except ImportError:
+        print(f"❌ {server} is not installed. Try: pip install {server}")
+        sys.exit(1)
+
+    if server == 'gunicorn':
+        run_gunicorn()
+    else:
+        run_waitress()
+
+
+if __name__ == '__main__':
+    main()
@@ -4,6 +4,7 @@ Creates indexes and sample data for the trainer functionality
 """
 
 from models import db, users_collection, tutorials_collection, queries_collection
+from ensure_indexes import ensure_indexes
 from flask_bcrypt import Bcrypt
 from datetime import datetime, timedelta
 import random
@@ -14,36 +15,12 @@ def create_indexes():
     """Create database indexes for better performance"""
     print("🔧 Creating database indexes...")
     
-    # Users collection indexes
+    # Every collection's indexes are declared once in index_specs.py
     try:
-        users_collection.create_index([("email", 1)], unique=True)
-        users_collection.create_index([("role", 1)])
-        print("✅ Users collection indexes created")
+        ensure_indexes(verbose=False)
+        print("✅ Collection indexes created")
     except Exception as e:
-        print(f"⚠️  Users indexes may already exist: {e}")
-    
-    # Tutorials collection indexes
-    try:
-        tutorials_collection.create_index([("trainer_email", 1)])
-        tutorials_collection.create_index([("category", 1)])
-        tutorials_collection.create_index([("status", 1)])
-        tutorials_collection.create_index([("created_at", -1)])
-        tutorials_collection.create_index([("views", -1)])
-        tutorials_collection.create_index([("tags", 1)])
-        print("✅ Tutorials collection indexes created")
-    except Exception as e:
-        print(f"⚠️  Tutorials indexes may already exist: {e}")
-    
-    # Queries collection indexes
-    try:
-        queries_collection.create_index([("user_email", 1)])
-        queries_collection.create_index([("assigned_trainer", 1)])
-        queries_collection.create_index([("status", 1)])
-        queries_collection.create_index([("created_at", -1)])
-        queries_collection.create_index([("category", 1)])
-        print("✅ Queries collection indexes created")
-    except Exception as e:
-        print(f"⚠️  Queries indexes may already exist: {e}")
+        print(f"⚠️  Indexes may already exist: {e}")
 
 def create_sample_tutorials():
     """Create sample tutorials for testing"""
@@ -1,5 +1,5 @@
 from models import db, users_collection, tutorials_collection, queries_collection
-from pymongo import ASCENDING, DESCENDING
+from ensure_indexes import ensure_indexes
 
 def setup_database_indexes():
     """Create indexes for optimal database performance"""
@@ -7,44 +7,13 @@ def setup_database_indexes():
     print("🔧 Setting up MongoDB indexes for Fit-Hub Portal...")
     
     try:
-        # Users Collection Indexes
-        print("📊 Creating indexes for users collection...")
-        users_collection.create_index([("email", ASCENDING)], unique=True)
-        users_collection.create_index([("role", ASCENDING)])
-        users_collection.create_index([("status", ASCENDING)])
-        users_collection.create_index([("createdAt", DESCENDING)])
-        print("✅ Users collection indexes created")
-        
-        # Tutorials Collection Indexes
-        print("📚 Creating indexes for tutorials collection...")
-        tutorials_collection.create_index([("trainer_email", ASCENDING)])
-        tutorials_collection.create_index([("category", ASCENDING)])
-        tutorials_collection.create_index([("status", ASCENDING)])
-        tutorials_collection.create_index([("difficulty", ASCENDING)])
-        tutorials_collection.create_index([("created_at", DESCENDING)])
-        tutorials_collection.create_index([("views", DESCENDING)])
-        tutorials_collection.create_index([("likes", DESCENDING)])
-        tutorials_collection.create_index([("tags", ASCENDING)])
-        # Compound index for filtering
-        tutorials_collection.create_index([("status", ASCENDING), ("category", ASCENDING)])
-        tutorials_collection.create_index([("trainer_email", ASCENDING), ("status", ASCENDING)])
-        print("✅ Tutorials collection indexes created")
-        
-        # Queries Collection Indexes
-        print("❓ Creating indexes for queries collection...")
-        queries_collection.create_index([("user_email", ASCENDING)])
-        queries_collection.create_index([("assigned_trainer", ASCENDING)])
-        queries_collection.create_index([("status", ASCENDING)])
-        queries_collection.create_index([("priority", ASCENDING)])
-        queries_collection.create_index([("category", ASCENDING)])
-        queries_collection.create_index([("created_at", DESCENDING)])
-        queries_collection.create_index([("updated_at", DESCENDING)])
-        # Compound indexes for common queries
-        queries_collection.create_index([("assigned_trainer", ASCENDING), ("status", ASCENDING)])
-        queries_collection.create_index([("status", ASCENDING), ("priority", ASCENDING)])
-        print("✅ Queries collection indexes created")
-        
-        print("\n🎉 All indexes created successfully!")
+        # Every index is declared once in index_specs.py; this builds whatever is missing
+        report = ensure_indexes()
+        differing = sum(len(result['differs']) for result in report.values())
+        if differing:
+            print(f"\n⚠️  {differing} indexes differ from index_specs.py; see above")
+        else:
+            print("\n🎉 All indexes created successfully!")
         print("\n📈 Database Performance Optimizations:")
         print("   • Fast user lookups by email and role")
         print("   • Efficient tutorial filtering by category, trainer, and status")
@@ -1,4 +1,5 @@
 from models import queries_collection
+from ensure_indexes import ensure_indexes
 from datetime import datetime, timedelta
 
 def setup_queries_collection():
@@ -8,11 +9,7 @@ def setup_queries_collection():
     
     # Create indexes
     try:
-        queries_collection.create_index("user_email")
-        queries_collection.create_index("assigned_trainer")
-        queries_collection.create_index("status")
-        queries_collection.create_index([("created_at", -1)])
-        queries_collection.create_index("category")
+        ensure_indexes(['queries'], verbose=False)  # declared in index_specs.py
         print("✅ Database indexes created")
     except Exception as e:
         print(f"⚠️  Indexes already exist")
@@ -1,5 +1,6 @@
 from trainer_application import submit_trainer_application
 from models import trainer_applications_collection
+from admin_stats import rebuild_application_stats
 
 def setup_sample_applications():
     """Create sample trainer applications for testing"""
@@ -100,6 +101,9 @@ def setup_sample_applications():
     print(f"✅ Successfully created {created_count} applications")
     print(f"❌ Failed: {len(sample_applications) - created_count}")
     
+    # The applications were replaced wholesale; recompute the admin counters
+    rebuild_application_stats()
+    
     # Show final statistics
     total = trainer_applications_collection.count_documents({})
     pending = trainer_applications_collection.count_documents({'status': 'pending'})
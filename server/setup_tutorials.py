@@ -1,4 +1,5 @@
 from models import tutorials_collection
+from ensure_indexes import ensure_indexes
 from datetime import datetime, timedelta
 import random
 
@@ -9,12 +10,7 @@ def setup_tutorials_collection():
     
     # Create indexes for better performance
     try:
-        tutorials_collection.create_index("trainer_email")
-        tutorials_collection.create_index("category") 
-        tutorials_collection.create_index("status")
-        tutorials_collection.create_index([("created_at", -1)])
-        tutorials_collection.create_index("tags")
-        tutorials_collection.create_index([("views", -1)])
+        ensure_indexes(['tutorials'], verbose=False)  # declared in index_specs.py
         print("✅ Database indexes created")
     except Exception as e:
         print(f"⚠️  Indexes already exist")
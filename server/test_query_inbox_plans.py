@@ -0,0 +1,101 @@
+from models import db
+from pagination import _find_page, encode_cursor
+from trainer import QUERY_INBOX_INDEX, QUERY_STATUSES, inbox_query
+from pymongo.errors import ServerSelectionTimeoutError
+from datetime import datetime, timedelta
+import random
+import sys
+
+# Explain-based regression test for the trainer inbox: every view / status
+# filter / page must be answered from the (assigned_trainer, status, created_at)
+# index, with no collection scan and no in-memory sort. Runs against a scratch
+# collection so real data is untouched.
+SCRATCH_COLLECTION = 'queries_plan_test'
+TRAINERS = [f'trainer{i}@example.com' for i in range(5)]
+
+
+def seed(collection, count=2000):
+    """Insert sample queries spread over trainers, statuses and time"""
+    now = datetime.utcnow()
+    docs = []
+    for i in range(count):
+        assigned = random.choice(TRAINERS + [None, None])
+        docs.append({
+            'title': f'Query {i}',
+            'description': 'Sample query for plan testing',
+            'user_email': f'user{i % 50}@example.com',
+            'assigned_trainer': assigned,
+            'status': 'open' if assigned is None else random.choice(QUERY_STATUSES[1:]),
+            'created_at': now - timedelta(minutes=i),
+            'updated_at': now
+        })
+    collection.insert_many(docs)
+    collection.create_index(QUERY_INBOX_INDEX)
+
+
+def require_server(database):
+    """Skip the calling test under pytest when no MongoDB server answers (run as a script, fail)"""
+    try:
+        database.client.admin.command('ping')
+    except ServerSelectionTimeoutError as e:
+        if 'pytest' in sys.modules:
+            import pytest
+            pytest.skip(f'MongoDB is not reachable: {e}')
+        raise
+
+
+def plan_stages(plan):
+    """All stage names in an explain plan tree (classic and slot-based formats, joins and $or branches)"""
+    stages = []
+    if 'stage' in plan:
+        stages.append(plan['stage'])
+    for key in ('inputStage', 'queryPlan', 'outerStage', 'innerStage'):
+        if key in plan:
+            stages += plan_stages(plan[key])
+    for child in plan.get('inputStages', []):
+        stages += plan_stages(child)
+    return stages
+
+
+def explain_inbox(collection, view, statuses, cursor=None, limit=20):
+    query = inbox_query(view, TRAINERS[0], statuses)
+    explanation = _find_page(collection, query, cursor, limit, 'created_at', -1, None, QUERY_INBOX_INDEX).explain()
+    return plan_stages(explanation['queryPlanner']['winningPlan'])
+
+
+def test_inbox_plans_use_index():
+    """No COLLSCAN and no blocking SORT for any inbox view, filter or page"""
+    print("🧪 Testing trainer inbox query plans")
+    print("=" * 40)
+
+    require_server(db)
+    collection = db[SCRATCH_COLLECTION]
+    collection.drop()
+    try:
+        seed(collection)
+        middle = collection.find_one({'assigned_trainer': TRAINERS[0]}, sort=[('created_at', -1)], skip=10)
+        cursor = encode_cursor(middle['created_at'], middle['_id'])
+
+        cases = []
+        for view in ('mine', 'unassigned'):
+            for statuses in (list(QUERY_STATUSES), ['open'], ['assigned', 'resolved']):
+                cases.append((view, statuses, None))
+                cases.append((view, statuses, cursor))
+
+        failures = 0
+        for view, statuses, page_cursor in cases:
+            stages = explain_inbox(collection, view, statuses, page_cursor)
+            ok = 'COLLSCAN' not in stages and 'SORT' not in stages
+            failures += not ok
+            label = f"{view:<11}status={','.join(statuses):<30}{'page 2' if page_cursor else 'page 1'}"
+            print(f"{'✅' if ok else '❌'} {label} {' <- '.join(stages)}")
+
+        assert failures == 0, f'{failures} inbox plans scan the collection or sort in memory'
+        print("\n🎉 All inbox plans are index-ordered")
+        return True
+    finally:
+        collection.drop()
+
+
+if __name__ == '__main__':
+    test_inbox_plans_use_index()
@@ -0,0 +1,450 @@
+#!/usr/bin/env python3
+"""
+Query Plan Regression Suite
+
+Runs the Mongo query shape behind every route in trainer.py and auth.py
+against a seeded scratch database (indexes from index_specs.py) and checks
+each with explain('executionStats'):
+  • no COLLSCAN (unless the case documents why and is listed in COLLSCAN_ALLOWED)
+  • no blocking in-memory SORT (unless the case documents why it is allowed)
+  • docsExamined / nReturned at most MAX_EXAMINED_RATIO, for finds and for
+    pipelines that return the documents they read (not $group, $count, $facet
+    and the like, which fold many documents into a few rows by design)
+
+It also times every query at growing collection sizes, so a plan that is fine
+at 10k documents but degrades at 1M shows up before it ships. Filters,
+pipelines, projections and hints come from the same helpers the routes use.
+Updates and deletes are checked through a find on the same filter, which is
+planned the same way.
+
+Usage:
+    python test_query_plans.py                                  # 10k, 100k, 1M documents
+    python test_query_plans.py --sizes 10000 --repeat 20
+    python test_query_plans.py --output plans.json              # save latencies
+    python test_query_plans.py --baseline plans.json            # fail on >1.5x slowdowns
+    pytest test_query_plans.py                                  # plan checks at 10k only
+"""
+
+from mongo_connection import get_database, MONGO_DB_NAME
+from index_specs import INDEX_SPECS, QUERY_INBOX_INDEX, QUERY_CLAIM_INDEX, APPLICATIONS_INDEX
+from pagination import keyset_query, encode_cursor
+from auth import build_user_filter, users_page_pipeline, existing_account_pipeline
+from trainer import (
+    QUERY_PRIORITIES,
+    PUBLIC_TUTORIAL_SUMMARY_FIELDS, TRAINER_TUTORIAL_SUMMARY_FIELDS, CLAIM_SPREAD,
+    inbox_query, applications_query, claim_filter, build_catalogue_filter, catalogue_facets_pipeline,
+    tutorial_projection, tutorial_stats_pipeline, query_stats_pipeline, ranked_tutorials_filter
+)
+from admin_stats import APPLICATION_COUNTS_PIPELINE, USER_STATS_ID, user_stats_pipeline
+from tutorial_search import text_search_pipeline
+from test_query_inbox_plans import plan_stages, require_server
+from rankings import activity_pipeline, bucket_id, published_filter
+from bson import ObjectId
+from datetime import datetime, timedelta
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+
+SCRATCH_DATABASE = f'{MONGO_DB_NAME}_plan_test'
+DEFAULT_SIZES = [10000, 100000, 1000000]
+TEST_SIZE = 10000
+MAX_EXAMINED_RATIO = 5
+# Stages whose output row count says nothing about how many documents they had to read
+REDUCING_STAGES = {'$group', '$count', '$facet', '$bucket', '$bucketAuto', '$sortByCount'}
+# The only cases allowed to scan a whole collection; each also gives its reason
+# (allow_collscan) in route_cases(), and an exemption not listed here fails
+COLLSCAN_ALLOWED = {'GET /stats [user stats rebuild]'}
+PAGE_SIZE = 20
+SEED_BATCH = 10000
+
+TRAINER_COUNT = 100
+USER_POOL = 5000
+CATEGORIES = ['strength', 'cardio', 'yoga', 'nutrition', 'hiit', 'mobility']
+DIFFICULTIES = ['beginner', 'intermediate', 'advanced']
+TAGS = [f'tag{i}' for i in range(30)]
+WORDS = ['squat', 'deadlift', 'bench', 'press', 'stretch', 'core', 'mobility', 'interval',
+         'recovery', 'protein', 'tempo', 'balance', 'endurance', 'sprint', 'plank', 'lunge']
+FIRST_NAMES = ['Alex', 'Sam', 'Jordan', 'Taylor', 'Morgan', 'Casey', 'Riley', 'Jamie']
+ACTIVITY_HOURS = 7 * 24
+
+
+def trainer_email(i):
+    return f'trainer{i % TRAINER_COUNT}@example.com'
+
+
+def tutorial_id(i):
+    # Deterministic ids so likes and activity can reference tutorials by position
+    return ObjectId(f'{i + 1:024x}')
+
+
+def seed_batch(db, start, stop, now):
+    """Insert documents start..stop-1 into every collection"""
+    rng = random.Random(start)
+    hour = now.replace(minute=0, second=0, microsecond=0)
+    users, tutorials, queries, applications, likes, activity = [], [], [], [], [], []
+    for i in range(start, stop):
+        users.append({
+            'email': f'user{i}@example.com',
+            'role': 'trainer' if i % 20 == 0 else 'admin' if i % 997 == 0 else 'user',
+            'status': 'inactive' if i % 10 == 0 else 'active' if i % 3 == 0 else None,
+            'firstName': FIRST_NAMES[i % len(FIRST_NAMES)],
+            'lastName': f'Lastname{i}',
+            'createdAt': (now - timedelta(seconds=i)).isoformat()
+        })
+        words = rng.sample(WORDS, 4)
+        tutorials.append({
+            '_id': tutorial_id(i),
+            'title': f'{words[0].title()} {words[1]} workout {i}',
+            'description': f'A {words[2]} and {words[3]} session',
+            'content': ' '.join(rng.choices(WORDS, k=30)),
+            'category': CATEGORIES[i % len(CATEGORIES)],
+            'difficulty': DIFFICULTIES[i % len(DIFFICULTIES)],
+            'tags': rng.sample(TAGS, 3),
+            'trainer_email': trainer_email(i),
+            'trainer_name': f'Coach {i % TRAINER_COUNT}',
+            'status': 'draft' if i % 5 == 0 else 'published',
+            'created_at': now - timedelta(minutes=i),
+            'views': rng.randint(0, 5000),
+            'likes': rng.randint(0, 500)
+        })
+        assigned = None if i % 3 == 0 else trainer_email(i)
+        queries.append({
+            'title': f'Question {i}',
+            'description': 'How should I structure my week?',
+            'category': CATEGORIES[i % len(CATEGORIES)],
+            'priority': QUERY_PRIORITIES[i % len(QUERY_PRIORITIES)],
+            'status': 'open' if assigned is None else rng.choice(['assigned', 'resolved', 'closed']),
+            'user_email': f'user{i % USER_POOL}@example.com',
+            'assigned_trainer': assigned,
+            'created_at': now - timedelta(minutes=i),
+            'updated_at': now
+        })
+        applications.append({
+            'email': f'applicant{i}@example.com',
+            'firstName': FIRST_NAMES[i % len(FIRST_NAMES)],
+            'lastName': f'Applicant{i}',
+            'status': 'pending' if i % 10 == 0 else 'approved' if i % 2 else 'rejected',
+            'applied_at': now - timedelta(minutes=i)
+        })
+        # 20 likes per user, on 20 different tutorials
+        likes.append({
+            'user_email': f'user{i // 20}@example.com',
+            'tutorial_id': tutorial_id((i * 7 + i // 20) % max(stop, 1000)),
+            'created_at': now
+        })
+        tutorial = tutorial_id(i // ACTIVITY_HOURS)
+        bucket_hour = hour - timedelta(hours=i % ACTIVITY_HOURS)
+        activity.append({
+            '_id': bucket_id(tutorial, bucket_hour),
+            'tutorial_id': tutorial,
+            'hour': bucket_hour,
+            'views': rng.randint(1, 50),
+            'likes': rng.randint(0, 5)
+        })
+    for name, docs in (('users', users), ('tutorials', tutorials), ('queries', queries),
+                       ('trainer_applications', applications), ('tutorial_likes', likes),
+                       ('tutorial_activity', activity)):
+        db[name].insert_many(docs, ordered=False)
+
+
+def seed(db, current, size, now):
+    """Grow every collection from `current` to `size` documents"""
+    for start in range(current, size, SEED_BATCH):
+        seed_batch(db, start, min(start + SEED_BATCH, size), now)
+
+
+def create_indexes(db):
+    for name, models in INDEX_SPECS.items():
+        db[name].create_indexes(models)
+
+
+def find_case(route, name, collection, filter, projection=None, sort=None, limit=None, hint=None, allow_sort=None):
+    return {'route': route, 'name': name, 'collection': collection, 'filter': filter, 'projection': projection,
+            'sort': sort, 'limit': limit, 'hint': hint, 'allow_sort': allow_sort, 'allow_collscan': None}
+
+
+def aggregate_case(route, name, collection, pipeline, hint=None, allow_sort=None, allow_collscan=None):
+    return {'route': route, 'name': name, 'collection': collection, 'pipeline': pipeline, 'hint': hint,
+            'allow_sort': allow_sort, 'allow_collscan': allow_collscan}
+
+
+def page_case(route, name, collection, query, cursor=None, sort_field='created_at', projection=None, hint=None):
+    """The find paginate() runs for one page"""
+    return find_case(route, name, collection, keyset_query(query, cursor, sort_field, -1), projection,
+                     [(sort_field, -1), ('_id', -1)], PAGE_SIZE + 1, hint)
+
+
+def page_cursor(db, collection, query, sort_field='created_at'):
+    """Cursor for the second page of `query` (None if there is only one page)"""
+    last = db[collection].find_one(query, sort=[(sort_field, -1), ('_id', -1)], skip=PAGE_SIZE - 1)
+    return encode_cursor(last[sort_field], last['_id']) if last else None
+
+
+def route_cases(db, now):
+    """Every route's Mongo access pattern, parameterized from the seeded data"""
+    trainer = trainer_email(1)
+    tutorial = db.tutorials.find_one({'status': 'published'}, {'_id': 1})['_id']
+    query_id = db.queries.find_one({'assigned_trainer': trainer}, {'_id': 1})['_id']
+    applications = [doc['_id'] for doc in db.trainer_applications.find({'status': 'pending'}, {'_id': 1}).limit(50)]
+    public_fields = tutorial_projection(PUBLIC_TUTORIAL_SUMMARY_FIELDS)
+    cases = [
+        # auth.py
+        aggregate_case('POST /signup', 'account + application lookup', 'users', existing_account_pipeline('user7@example.com')),
+        find_case('POST /login', 'user by email and role', 'users', {'email': 'user7@example.com', 'role': 'user'}),
+        find_case('POST /google-login', 'user by email', 'users', {'email': 'user7@example.com'}),
+    ]
+    for label, args in (('all users', {}), ('role=trainer', {'role': 'trainer'}), ('status=active', {'status': 'active'}),
+                        ('search=Lastname12', {'search': 'Lastname12'})):
+        # The search $or spans email/firstName/lastName indexes, so its (small) match set is sorted in memory
+        allow_sort = 'prefix search merges three indexes; only matches are sorted' if 'search' in args else None
+        cases.append(aggregate_case('GET /users', label, 'users', users_page_pipeline(build_user_filter(args), 2, PAGE_SIZE),
+                                    allow_sort=allow_sort))
+    cases += [
+        find_case('GET /stats', 'stats document', 'stats', {'_id': USER_STATS_ID}),
+        # admin_stats.rebuild_user_stats: only once the document is stale, on a background thread
+        aggregate_case('GET /stats', 'user stats rebuild', 'users', user_stats_pipeline(now),
+                       allow_collscan='counts every user by role; one worker runs it per USER_STATS_MAX_AGE, under a lease'),
+    ]
+
+    # trainer.py: trainer tutorials, queries and stats
+    cases += [
+        find_case('GET /trainer/tutorials', 'by trainer', 'tutorials', {'trainer_email': trainer},
+                  tutorial_projection(TRAINER_TUTORIAL_SUMMARY_FIELDS)),
+        find_case('PUT|DELETE /trainer/tutorials/<id>', 'owned tutorial', 'tutorials', {'_id': tutorial, 'trainer_email': trainer}),
+    ]
+    for view in ('mine', 'unassigned'):
+        for statuses in (['open', 'assigned', 'resolved', 'closed'], ['open']):
+            query = inbox_query(view, trainer, statuses)
+            label = f"{view} status={','.join(statuses)}"
+            cases.append(page_case('GET /trainer/queries', label, 'queries', query, hint=QUERY_INBOX_INDEX))
+            cases.append(page_case('GET /trainer/queries', label + ' page 2', 'queries', query,
+                                   page_cursor(db, 'queries', query), hint=QUERY_INBOX_INDEX))
+    cases += [
+        find_case('POST /trainer/queries/<id>/assign', 'compare-and-set claim', 'queries', claim_filter(query_id)),
+        find_case('POST /trainer/queries/claim', 'next candidates', 'queries',
+                  {'assigned_trainer': None, 'status': 'open', 'priority': 'high'}, {'_id': 1},
+                  [('created_at', 1)], 5 * CLAIM_SPREAD, QUERY_CLAIM_INDEX),
+        find_case('POST /trainer/queries/<id>/respond', 'assigned query', 'queries', {'_id': query_id, 'assigned_trainer': trainer}),
+        aggregate_case('GET /trainer/stats', 'tutorial stats', 'tutorials', tutorial_stats_pipeline(trainer)),
+        aggregate_case('GET /trainer/stats', 'query stats', 'queries', query_stats_pipeline(trainer)),
+    ]
+
+    # trainer.py: public catalogue
+    for label, args in (('all', {}), ('category', {'category': 'yoga'}), ('tag', {'tag': 'tag3'}),
+                        ('difficulty', {'difficulty': 'advanced'}), ('trainer', {'trainer': 'Coach 7'})):
+        query = build_catalogue_filter(args)
+        cases.append(page_case('GET /trainer/public/tutorials', label, 'tutorials', query, projection=public_fields))
+        cases.append(page_case('GET /trainer/public/tutorials', label + ' page 2', 'tutorials', query,
+                               page_cursor(db, 'tutorials', query), projection=public_fields))
+    cases += [
+        aggregate_case('GET /trainer/public/tutorials/facets', 'catalogue facets', 'tutorials', catalogue_facets_pipeline()),
+        aggregate_case('GET /trainer/public/tutorials/search', 'text search', 'tutorials',
+                       text_search_pipeline('squat tempo', projection=public_fields)),
+        aggregate_case('GET /trainer/public/tutorials/search', 'text search + category', 'tutorials',
+                       text_search_pipeline('plank', category='strength', projection=public_fields)),
+        aggregate_case('GET /trainer/public/tutorials/trending', 'ranking refresh', 'tutorial_activity', activity_pipeline(now)),
+        find_case('GET /trainer/public/tutorials/trending', 'ranking refresh published ids', 'tutorials',
+                  published_filter([row['_id'] for row in db.tutorial_activity.aggregate(activity_pipeline(now))]),
+                  {'_id': 1}),
+        # Rankings only ever hold published tutorials (seeded drafts are i % 5 == 0)
+        find_case('GET /trainer/public/tutorials/trending', 'page tutorials', 'tutorials',
+                  ranked_tutorials_filter([{'id': tutorial_id(i)} for i in range(1, 200, 10)]), public_fields),
+        find_case('GET /trainer/public/tutorials/<id>', 'published tutorial', 'tutorials', {'_id': tutorial, 'status': 'published'}),
+        find_case('GET|DELETE /trainer/public/tutorials/<id>/like', 'like record', 'tutorial_likes',
+                  {'user_email': 'user3@example.com', 'tutorial_id': tutorial}, limit=1),
+    ]
+
+    # trainer.py: trainer applications
+    for statuses in (['pending'], ['pending', 'approved', 'rejected']):
+        query = applications_query(statuses)
+        label = f"status={','.join(statuses)}"
+        cases.append(page_case('GET /trainer/applications', label, 'trainer_applications', query,
+                               sort_field='applied_at', projection={'password': 0}, hint=APPLICATIONS_INDEX))
+        cases.append(page_case('GET /trainer/applications', label + ' page 2', 'trainer_applications', query,
+                               page_cursor(db, 'trainer_applications', query, 'applied_at'), sort_field='applied_at',
+                               projection={'password': 0}, hint=APPLICATIONS_INDEX))
+    cases += [
+        # Only when the counters document is stale (admin_stats.rebuild_application_stats)
+        aggregate_case('GET /trainer/applications', 'status counts rebuild', 'trainer_applications',
+                       APPLICATION_COUNTS_PIPELINE, hint=APPLICATIONS_INDEX),
+        find_case('POST /trainer/applications/review', 'applications by id', 'trainer_applications',
+                  {'_id': {'$in': applications}}),
+        find_case('POST /trainer/applications/review', 'registered emails', 'users',
+                  {'email': {'$in': [f'applicant{i}@example.com' for i in range(50)]}}, {'email': 1}),
+    ]
+    return cases
+
+
+def _command(case):
+    if 'pipeline' in case:
+        command = {'aggregate': case['collection'], 'pipeline': case['pipeline'], 'cursor': {}}
+    else:
+        command = {'find': case['collection'], 'filter': case['filter']}
+        if case['projection']:
+            command['projection'] = case['projection']
+        if case['sort']:
+            command['sort'] = dict(case['sort'])
+        if case['limit']:
+            command['limit'] = case['limit']
+    if case['hint']:
+        command['hint'] = dict(case['hint'])
+    return command
+
+
+def run_case(db, case):
+    if 'pipeline' in case:
+        # aggregate() sends hint as given, so it has to be a key document
+        options = {'hint': dict(case['hint'])} if case['hint'] else {}
+        return list(db[case['collection']].aggregate(case['pipeline'], **options))
+    return list(db[case['collection']].find(
+        case['filter'], case['projection'], sort=case['sort'], limit=case['limit'] or 0, hint=case['hint']))
+
+
+def _collect(node, key, found):
+    """Every value stored under `key` anywhere in an explain document, skipping rejected plans"""
+    if isinstance(node, dict):
+        for name, value in node.items():
+            if name == key:
+                found.append(value)
+            elif name != 'rejectedPlans':
+                _collect(value, key, found)
+    elif isinstance(node, list):
+        for value in node:
+            _collect(value, key, found)
+    return found
+
+
+def check_case(db, case):
+    """Explain one case; returns (problems, stages, docs examined, returned)"""
+    explanation = db.command('explain', _command(case), verbosity='executionStats')
+    stages = [stage for plan in _collect(explanation, 'winningPlan', []) for stage in plan_stages(plan)]
+    # A $sort the planner could not push into the query layer runs as a blocking pipeline stage
+    stages += ['SORT' for stage in explanation.get('stages', []) if '$sort' in stage]
+    stats = _collect(explanation, 'executionStats', [])
+    examined = sum(stat.get('totalDocsExamined', 0) for stat in stats)
+    returned = sum(stat.get('nReturned', 0) for stat in stats)
+
+    problems = []
+    if case['allow_collscan'] and case_label(case) not in COLLSCAN_ALLOWED:
+        problems.append('COLLSCAN exemption not listed in COLLSCAN_ALLOWED')
+    if 'COLLSCAN' in stages and not case['allow_collscan']:
+        problems.append('COLLSCAN')
+    if 'SORT' in stages and not case['allow_sort']:
+        problems.append('in-memory SORT')
+    reduces = any(stage in REDUCING_STAGES for step in case.get('pipeline', []) for stage in step)
+    if not reduces and examined > MAX_EXAMINED_RATIO * max(returned, 1):
+        problems.append(f'examined {examined} docs for {returned} returned')
+    return problems, stages, examined, returned
+
+
+def time_case(db, case, repeat):
+    """(median ms, p95 ms) over `repeat` runs after one warm-up"""
+    run_case(db, case)
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run_case(db, case)
+        timings.append((time.perf_counter() - start) * 1000.0)
+    timings.sort()
+    return statistics.median(timings), timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+
+
+def case_label(case):
+    return f"{case['route']} [{case['name']}]"
+
+
+def run_suite(sizes, repeat=10, keep=False, verbose=True):
+    """Seed, explain and time every case at each size; returns (failures, {size: {label: latency}})"""
+    db = get_database(SCRATCH_DATABASE)
+    db.client.drop_database(SCRATCH_DATABASE)
+    now = datetime.utcnow()
+    failures = []
+    latencies = {}
+    try:
+        create_indexes(db)
+        current = 0
+        for size in sorted(sizes):
+            seed_start = time.perf_counter()
+            seed(db, current, size, now)
+            current = size
+            if verbose:
+                print(f"\n📦 {size:,} documents per collection (seeded in {time.perf_counter() - seed_start:.1f}s)")
+                print("-" * 96)
+            latencies[size] = {}
+            for case in route_cases(db, now):
+                label = case_label(case)
+                problems, stages, examined, returned = check_case(db, case)
+                median, p95 = time_case(db, case, repeat)
+                latencies[size][label] = {'median_ms': round(median, 3), 'p95_ms': round(p95, 3)}
+                if problems:
+                    failures.append((size, label, problems))
+                if verbose:
+                    print(f"{'✅' if not problems else '❌'} {label:<72}{median:>8.2f}ms p95 {p95:>8.2f}ms")
+                    if problems:
+                        print(f"      {'; '.join(problems)}: {' <- '.join(stages)}")
+        return failures, latencies
+    finally:
+        if not keep:
+            db.client.drop_database(SCRATCH_DATABASE)
+
+
+def compare_to_baseline(latencies, baseline, max_slowdown, slack_ms=1.0):
+    """[(size, label, before, after)] for queries slower than max_slowdown x baseline (+ slack)"""
+    regressions = []
+    for size, cases in latencies.items():
+        for label, timing in cases.items():
+            before = baseline.get(str(size), {}).get(label)
+            if before and timing['median_ms'] > before['median_ms'] * max_slowdown + slack_ms:
+                regressions.append((size, label, before['median_ms'], timing['median_ms']))
+    return regressions
+
+
+def test_route_query_plans():
+    """No COLLSCAN, no unexpected in-memory SORT and bounded docsExamined for every route query"""
+    print("🧪 Testing route query plans")
+    print("=" * 40)
+    require_server(get_database(SCRATCH_DATABASE))
+    failures, _ = run_suite([TEST_SIZE], repeat=1)
+    assert not failures, f'{len(failures)} route queries have bad plans: ' + \
+        ', '.join(f'{label} ({"; ".join(problems)})' for _, label, problems in failures)
+    print("\n🎉 All route queries are index-backed")
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Explain and time every route query at growing collection sizes')
+    parser.add_argument('--sizes', default=','.join(str(size) for size in DEFAULT_SIZES),
+                        help='comma-separated documents per collection')
+    parser.add_argument('--repeat', type=int, default=10, help='timed runs per query and size')
+    parser.add_argument('--output', help='write latencies to this JSON file')
+    parser.add_argument('--baseline', help='compare latencies with a previous --output file')
+    parser.add_argument('--max-slowdown', type=float, default=1.5, help='allowed median slowdown vs the baseline')
+    parser.add_argument('--keep', action='store_true', help=f'keep the {SCRATCH_DATABASE} database afterwards')
+    args = parser.parse_args()
+
+    print("🔍 QUERY PLAN REGRESSION SUITE")
+    print("=" * 96)
+    failures, latencies = run_suite([int(size) for size in args.sizes.split(',')], args.repeat, args.keep)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({str(size): cases for size, cases in latencies.items()}, f, indent=2, sort_keys=True)
+        print(f"\n💾 Latencies written to {args.output}")
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare_to_baseline(latencies, json.load(f), args.max_slowdown)
+        for size, label, before, after in regressions:
+            print(f"🐢 {size:,} docs {label}: {before:.2f}ms -> {after:.2f}ms")
+
+    print("\n" + "=" * 96)
+    print(f"{len(failures)} plan problems, {len(regressions)} latency regressions")
+    return 1 if failures or regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,12 +1,55 @@
 from flask import Blueprint, request, jsonify
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from models import tutorials_collection, queries_collection, users_collection, trainer_applications_collection
+from pagination import paginate, parse_limit, parse_page
+from counter_buffer import CounterBuffer
+from ttl_cache import TTLCache
+from tutorial_search import TutorialSearch, facets_from_rows
+from rankings import record_activity, get_ranking_page
+from tutorial_likes import add_like, remove_like, has_liked
+from admin_stats import APPLICATION_STATUSES, get_application_counts
+from index_specs import QUERY_INBOX_INDEX, QUERY_CLAIM_INDEX, APPLICATIONS_INDEX
+from response_cache import ResponseCache, request_cache_key, etag_response, compute_etag
+from serializers import (
+    tutorial_formatter, format_tutorial_details, format_query, format_application, http_dates
+)
 from datetime import datetime
 from bson import ObjectId
+from pymongo import ReturnDocument
 import os
+import random
 
 trainer_bp = Blueprint('trainer', __name__)
 
+# Public catalogue responses; invalidated by the tutorial write handlers below
+public_cache = ResponseCache()
+TUTORIAL_LIST_GROUP = 'tutorials:list'
+TUTORIAL_DETAIL_GROUP = 'tutorials:detail'
+
+def invalidate_public_tutorials(tutorial_id=None):
+    """Drop cached catalogue pages, plus one tutorial's detail page if given"""
+    public_cache.invalidate(TUTORIAL_LIST_GROUP)
+    tutorial_search.invalidate()
+    if tutorial_id is not None:
+        public_cache.invalidate(TUTORIAL_DETAIL_GROUP, str(tutorial_id))
+
+def _counters_flushed(tutorial_ids):
+    # Cached detail pages carry the stored view/like counts; refresh them once they move
+    for tutorial_id in tutorial_ids:
+        public_cache.invalidate(TUTORIAL_DETAIL_GROUP, str(tutorial_id))
+
+# View and like counts are buffered in-process and flushed in batches instead
+# of issuing one update per tutorial page view or like
+tutorial_counters = CounterBuffer(
+    tutorials_collection,
+    flush_interval=float(os.getenv('COUNTER_FLUSH_INTERVAL', '5')),
+    flush_size=int(os.getenv('COUNTER_FLUSH_SIZE', '1000')),
+    on_flush=_counters_flushed
+)
+
+# Dashboard stats are recomputed at most once per TTL for each trainer
+trainer_stats_cache = TTLCache(ttl=float(os.getenv('TRAINER_STATS_TTL', '30')))
+
 # Helper function to verify trainer role
 def verify_trainer():
     current_user = get_jwt_identity()
@@ -14,6 +57,186 @@ def verify_trainer():
         return False
     return current_user
 
+# Tutorial list views only ever return these fields, so the projection is pushed
+# down into Mongo and large fields like `content` never leave the database.
+PUBLIC_TUTORIAL_SUMMARY_FIELDS = [
+    'id', 'title', 'description', 'category', 'difficulty', 'duration', 'tags',
+    'videoUrl', 'imageUrl', 'trainer_name', 'created_at', 'views', 'likes'
+]
+TRAINER_TUTORIAL_SUMMARY_FIELDS = [
+    'id', 'title', 'description', 'category', 'difficulty', 'duration', 'tags',
+    'videoUrl', 'imageUrl', 'created_at', 'updated_at', 'status', 'views', 'likes'
+]
+
+# Catalogue filters: query parameter -> tutorial field
+CATALOGUE_FILTERS = {'category': 'category', 'difficulty': 'difficulty', 'tag': 'tags', 'trainer': 'trainer_name'}
+TAG_FACET_LIMIT = 50
+
+def build_catalogue_filter(args):
+    """Published tutorials narrowed by any category/difficulty/tag/trainer parameters"""
+    query = {'status': 'published'}
+    for param, field in CATALOGUE_FILTERS.items():
+        if args.get(param):
+            query[field] = args.get(param)
+    return query
+
+def catalogue_facets_pipeline():
+    """One aggregation counting published tutorials per category, difficulty, tag and trainer"""
+    return [
+        {'$match': {'status': 'published'}},
+        {'$project': {'category': 1, 'difficulty': 1, 'tags': 1, 'trainer_name': 1}},
+        {'$facet': {
+            'total': [{'$count': 'count'}],
+            'category': [{'$group': {'_id': '$category', 'count': {'$sum': 1}}}],
+            'difficulty': [{'$group': {'_id': {'$ifNull': ['$difficulty', 'beginner']}, 'count': {'$sum': 1}}}],
+            'tag': [
+                {'$unwind': '$tags'},
+                {'$group': {'_id': '$tags', 'count': {'$sum': 1}}},
+                {'$sort': {'count': -1, '_id': 1}},
+                {'$limit': TAG_FACET_LIMIT}
+            ],
+            'trainer': [{'$group': {'_id': {'$ifNull': ['$trainer_name', 'Anonymous']}, 'count': {'$sum': 1}}}]
+        }}
+    ]
+
+def build_catalogue_facets(result):
+    """Facets payload from the catalogue_facets_pipeline() result document"""
+    return {
+        'total': result['total'][0]['count'] if result['total'] else 0,
+        'facets': {name: facets_from_rows(result[name]) for name in CATALOGUE_FILTERS}
+    }
+
+def get_catalogue_facets():
+    """Facet counts for the public catalogue, cached until the next tutorial write"""
+    cached = public_cache.get(TUTORIAL_LIST_GROUP, 'facets')
+    if cached:
+        return cached
+    payload = build_catalogue_facets(list(tutorials_collection.aggregate(catalogue_facets_pipeline()))[0])
+    return public_cache.set(TUTORIAL_LIST_GROUP, 'facets', payload), payload
+
+tutorial_search = TutorialSearch(
+    tutorials_collection,
+    stored_fields=[field for field in PUBLIC_TUTORIAL_SUMMARY_FIELDS if field != 'id']
+)
+
+def parse_fields(value, allowed_fields):
+    """Parse a ?fields= value into a list of allowed fields (summary view if empty)"""
+    if not value:
+        return list(allowed_fields)
+    fields = ['id']
+    for field in value.split(','):
+        field = field.strip()
+        if not field or field in fields:
+            continue
+        if field not in allowed_fields:
+            raise ValueError(f'Unknown field: {field}')
+        fields.append(field)
+    return fields
+
+def tutorial_projection(fields):
+    """Build the Mongo projection for a list of output fields"""
+    projection = {field: 1 for field in fields if field != 'id'}
+    projection['created_at'] = 1  # always needed for the pagination cursor
+    return projection
+
+# Document builders below, and the formatters imported from serializers.py, are
+# shared with the asyncio serving path (async_trainer.py), so both expose
+# exactly the same API.
+
+TUTORIAL_UPDATABLE_FIELDS = ['title', 'description', 'category', 'content', 'difficulty',
+                             'duration', 'tags', 'videoUrl', 'imageUrl', 'status']
+
+def build_tutorial(data, current_user):
+    """Build a new tutorial document from request data"""
+    return {
+        'title': data['title'],
+        'description': data['description'],
+        'category': data['category'],
+        'content': data['content'],
+        'difficulty': data.get('difficulty', 'beginner'),
+        'duration': data.get('duration', ''),
+        'tags': data.get('tags', []),
+        'videoUrl': data.get('videoUrl', ''),
+        'imageUrl': data.get('imageUrl', ''),
+        'trainer_email': current_user['email'],
+        'trainer_name': data.get('trainer_name', current_user['email'].split('@')[0]),
+        'created_at': datetime.utcnow(),
+        'updated_at': datetime.utcnow(),
+        'status': 'published',
+        'views': 0,
+        'likes': 0
+    }
+
+def build_tutorial_update(data):
+    """Build the $set document for a tutorial update"""
+    update_data = {
+        'updated_at': datetime.utcnow()
+    }
+    for field in TUTORIAL_UPDATABLE_FIELDS:
+        if field in data:
+            update_data[field] = data[field]
+    return update_data
+
+def build_query(data, current_user):
+    """Build a new user query document from request data"""
+    return {
+        'title': data['title'],
+        'description': data['description'],
+        'category': data.get('category', 'general'),
+        'priority': data.get('priority', 'medium'),
+        'user_email': current_user['email'],
+        'user_name': data.get('user_name', current_user['email'].split('@')[0]),
+        'assigned_trainer': None,
+        'status': 'open',
+        'response': '',
+        'created_at': datetime.utcnow(),
+        'updated_at': datetime.utcnow(),
+        'responded_at': None
+    }
+
+def tutorial_stats_pipeline(trainer_email):
+    """One pass over a trainer's tutorials for counts, views and likes"""
+    return [
+        {'$match': {'trainer_email': trainer_email}},
+        {'$group': {
+            '_id': None,
+            'total_tutorials': {'$sum': 1},
+            'published_tutorials': {'$sum': {'$cond': [{'$eq': ['$status', 'published']}, 1, 0]}},
+            'total_views': {'$sum': '$views'},
+            'total_likes': {'$sum': '$likes'}
+        }}
+    ]
+
+def query_stats_pipeline(trainer_email):
+    """One pass over a trainer's assigned queries for all query counts"""
+    return [
+        {'$match': {'assigned_trainer': trainer_email}},
+        {'$group': {
+            '_id': None,
+            'total_queries': {'$sum': 1},
+            'resolved_queries': {'$sum': {'$cond': [{'$eq': ['$status', 'resolved']}, 1, 0]}},
+            'pending_queries': {'$sum': {'$cond': [{'$in': ['$status', ['assigned', 'open']]}, 1, 0]}}
+        }}
+    ]
+
+def build_trainer_stats(tutorial_stats, query_stats):
+    """Combine the two stats aggregation results into the dashboard payload"""
+    tutorial_stats = tutorial_stats[0] if tutorial_stats else {}
+    query_stats = query_stats[0] if query_stats else {}
+    total_queries = query_stats.get('total_queries', 0)
+    resolved_queries = query_stats.get('resolved_queries', 0)
+    
+    return {
+        'totalTutorials': tutorial_stats.get('total_tutorials', 0),
+        'publishedTutorials': tutorial_stats.get('published_tutorials', 0),
+        'totalViews': tutorial_stats.get('total_views', 0),
+        'totalLikes': tutorial_stats.get('total_likes', 0),
+        'totalQueries': total_queries,
+        'resolvedQueries': resolved_queries,
+        'pendingQueries': query_stats.get('pending_queries', 0),
+        'responseRate': round((resolved_queries / total_queries * 100) if total_queries > 0 else 0, 1)
+    }
+
 # TUTORIAL MANAGEMENT ROUTES
 
 @trainer_bp.route('/tutorials', methods=['POST'])
@@ -33,31 +256,16 @@ def create_tutorial():
             if not data.get(field):
                 return jsonify({'msg': f'{field} is required'}), 400
         
-        tutorial = {
-            'title': data['title'],
-            'description': data['description'],
-            'category': data['category'],
-            'content': data['content'],
-            'difficulty': data.get('difficulty', 'beginner'),
-            'duration': data.get('duration', ''),
-            'tags': data.get('tags', []),
-            'videoUrl': data.get('videoUrl', ''),
-            'imageUrl': data.get('imageUrl', ''),
-            'trainer_email': current_user['email'],
-            'trainer_name': data.get('trainer_name', current_user['email'].split('@')[0]),
-            'created_at': datetime.utcnow(),
-            'updated_at': datetime.utcnow(),
-            'status': 'published',
-            'views': 0,
-            'likes': 0
-        }
+        tutorial = build_tutorial(data, current_user)
         
         result = tutorials_collection.insert_one(tutorial)
         tutorial['_id'] = str(result.inserted_id)
+        trainer_stats_cache.delete(current_user['email'])
+        invalidate_public_tutorials()
         
         return jsonify({
             'msg': 'Tutorial created successfully',
-            'tutorial': tutorial
+            'tutorial': http_dates(tutorial)
         }), 201
         
     except Exception as e:
@@ -73,30 +281,18 @@ def get_trainer_tutorials():
         return jsonify({'msg': 'Access denied. Trainer role required.'}), 403
     
     try:
-        tutorials = list(tutorials_collection.find({'trainer_email': current_user['email']}))
-        
-        # Format tutorials
-        formatted_tutorials = []
-        for tutorial in tutorials:
-            formatted_tutorials.append({
-                'id': str(tutorial['_id']),
-                'title': tutorial['title'],
-                'description': tutorial['description'],
-                'category': tutorial['category'],
-                'difficulty': tutorial.get('difficulty', 'beginner'),
-                'duration': tutorial.get('duration', ''),
-                'tags': tutorial.get('tags', []),
-                'videoUrl': tutorial.get('videoUrl', ''),
-                'imageUrl': tutorial.get('imageUrl', ''),
-                'created_at': tutorial['created_at'].isoformat() if tutorial.get('created_at') else '',
-                'updated_at': tutorial['updated_at'].isoformat() if tutorial.get('updated_at') else '',
-                'status': tutorial.get('status', 'published'),
-                'views': tutorial.get('views', 0),
-                'likes': tutorial.get('likes', 0)
-            })
+        fields = parse_fields(request.args.get('fields'), TRAINER_TUTORIAL_SUMMARY_FIELDS)
+        tutorials = tutorials_collection.find(
+            {'trainer_email': current_user['email']},
+            tutorial_projection(fields)
+        )
+        
+        formatted_tutorials = tutorial_formatter(tuple(fields)).many(tutorials)
         
         return jsonify({'tutorials': formatted_tutorials}), 200
         
+    except ValueError as e:
+        return jsonify({'msg': str(e)}), 400
     except Exception as e:
         print(f"❌ Error fetching tutorials: {str(e)}")
         return jsonify({'msg': 'Error fetching tutorials'}), 500
@@ -119,23 +315,15 @@ def update_tutorial(tutorial_id):
         if not tutorial:
             return jsonify({'msg': 'Tutorial not found or access denied'}), 404
         
-        data = request.json
-        update_data = {
-            'updated_at': datetime.utcnow()
-        }
-        
-        # Update allowed fields
-        allowed_fields = ['title', 'description', 'category', 'content', 'difficulty', 
-                         'duration', 'tags', 'videoUrl', 'imageUrl', 'status']
-        for field in allowed_fields:
-            if field in data:
-                update_data[field] = data[field]
+        update_data = build_tutorial_update(request.json)
         
         tutorials_collection.update_one(
             {'_id': ObjectId(tutorial_id)},
             {'$set': update_data}
         )
         
+        trainer_stats_cache.delete(current_user['email'])
+        invalidate_public_tutorials(tutorial_id)
         return jsonify({'msg': 'Tutorial updated successfully'}), 200
         
     except Exception as e:
@@ -160,6 +348,8 @@ def delete_tutorial(tutorial_id):
         if result.deleted_count == 0:
             return jsonify({'msg': 'Tutorial not found or access denied'}), 404
         
+        trainer_stats_cache.delete(current_user['email'])
+        invalidate_public_tutorials(tutorial_id)
         return jsonify({'msg': 'Tutorial deleted successfully'}), 200
         
     except Exception as e:
@@ -168,43 +358,131 @@ def delete_tutorial(tutorial_id):
 
 # USER QUERY MANAGEMENT ROUTES
 
+# Trainer inbox. Each view is an equality on assigned_trainer plus a status
+# filter, read in (created_at, _id) order from one compound index. Statuses are
+# always given explicitly (all of them by default) so the planner merges the
+# per-status index ranges in order instead of sorting in memory.
+QUERY_STATUSES = ['open', 'assigned', 'resolved', 'closed']
+INBOX_VIEWS = ['mine', 'unassigned']
+
+def parse_statuses(value, allowed=QUERY_STATUSES):
+    """Parse a ?status=open,assigned value (all `allowed` statuses if empty)"""
+    if not value:
+        return list(allowed)
+    statuses = [status.strip() for status in value.split(',') if status.strip()]
+    for status in statuses:
+        if status not in allowed:
+            raise ValueError(f'Unknown status: {status}')
+    return statuses
+
+def inbox_query(view, trainer_email, statuses):
+    """Mongo filter for one inbox view"""
+    if view not in INBOX_VIEWS:
+        raise ValueError(f"view must be one of: {', '.join(INBOX_VIEWS)}")
+    return {
+        'assigned_trainer': trainer_email if view == 'mine' else None,
+        'status': statuses[0] if len(statuses) == 1 else {'$in': statuses}
+    }
+
+def inbox_page(view, trainer_email, args):
+    """paginate() arguments for one page of an inbox view, from the request args"""
+    return {
+        'query': inbox_query(view, trainer_email, parse_statuses(args.get('status'))),
+        'cursor': args.get('cursor'),
+        'limit': parse_limit(args.get('limit')),
+        'hint': QUERY_INBOX_INDEX
+    }
+
+# Claiming is compare-and-set: the update only matches while the query is
+# still open and unassigned, so exactly one trainer wins each query.
+QUERY_PRIORITIES = ['high', 'medium', 'low']  # claim order
+MAX_CLAIM_COUNT = 20
+CLAIM_SPREAD = 4  # candidates considered per query wanted, so concurrent claimers fan out
+CLAIM_ROUNDS = 3
+
+def parse_claim_count(data):
+    """Number of queries to claim from a request body (1 by default, capped at MAX_CLAIM_COUNT)"""
+    count = data.get('count', 1)
+    # bool is an int subclass; reject true/false rather than claim one query
+    if isinstance(count, bool) or not isinstance(count, int) or count < 1:
+        raise ValueError('count must be a positive integer')
+    return min(count, MAX_CLAIM_COUNT)
+
+def claim_filter(query_id):
+    """Matches a query only while it can still be claimed"""
+    return {'_id': query_id, 'assigned_trainer': None, 'status': 'open'}
+
+def claim_candidates_filter(priority):
+    """Open, unassigned queries of one priority (read oldest first from QUERY_CLAIM_INDEX)"""
+    return {'assigned_trainer': None, 'status': 'open', 'priority': priority}
+
+def claim_update(trainer_email):
+    now = datetime.utcnow()
+    return {'$set': {'assigned_trainer': trainer_email, 'status': 'assigned', 'claimed_at': now, 'updated_at': now}}
+
+def claim_query(query_id, trainer_email):
+    """Claim one query; returns the updated document, or None if it was not claimable"""
+    return queries_collection.find_one_and_update(
+        claim_filter(query_id),
+        claim_update(trainer_email),
+        return_document=ReturnDocument.AFTER
+    )
+
+def claim_next_queries(trainer_email, count):
+    """Claim up to `count` open queries, highest priority first.
+
+    Within a priority the order is only roughly oldest-first: candidates are
+    the oldest count * CLAIM_SPREAD queries, tried in random order, so
+    trainers claiming at the same time mostly try different documents
+    instead of all racing for the oldest one. A claim may therefore skip
+    older queries that are still inside that window; nothing outside the
+    window is claimed before it. Lost races are simply skipped.
+    """
+    claimed = []
+    for priority in QUERY_PRIORITIES:
+        for _ in range(CLAIM_ROUNDS):
+            wanted = count - len(claimed)
+            if wanted <= 0:
+                return claimed
+            candidates = [query['_id'] for query in queries_collection.find(
+                claim_candidates_filter(priority), {'_id': 1}
+            ).sort('created_at', 1).limit(wanted * CLAIM_SPREAD).hint(QUERY_CLAIM_INDEX)]
+            if not candidates:
+                break
+            random.shuffle(candidates)
+            for query_id in candidates:
+                query = claim_query(query_id, trainer_email)
+                if query:
+                    claimed.append(query)
+                    if len(claimed) == count:
+                        return claimed
+    return claimed
+
 @trainer_bp.route('/queries', methods=['GET'])
 @jwt_required()
 def get_trainer_queries():
-    """Get all queries assigned to current trainer"""
+    """Trainer inbox: queries assigned to me (view=mine) or the unassigned pool
+    (view=unassigned), newest first, one page at a time"""
     current_user = verify_trainer()
     if not current_user:
         return jsonify({'msg': 'Access denied. Trainer role required.'}), 403
     
     try:
-        queries = list(queries_collection.find({
-            '$or': [
-                {'assigned_trainer': current_user['email']},
-                {'assigned_trainer': None}  # Unassigned queries
-            ]
-        }).sort('created_at', -1))
-        
-        # Format queries
-        formatted_queries = []
-        for query in queries:
-            formatted_queries.append({
-                'id': str(query['_id']),
-                'title': query['title'],
-                'description': query['description'],
-                'category': query.get('category', 'general'),
-                'priority': query.get('priority', 'medium'),
-                'status': query.get('status', 'open'),
-                'user_email': query['user_email'],
-                'user_name': query.get('user_name', query['user_email'].split('@')[0]),
-                'assigned_trainer': query.get('assigned_trainer'),
-                'response': query.get('response', ''),
-                'created_at': query['created_at'].isoformat() if query.get('created_at') else '',
-                'updated_at': query['updated_at'].isoformat() if query.get('updated_at') else '',
-                'responded_at': query['responded_at'].isoformat() if query.get('responded_at') else None
-            })
-        
-        return jsonify({'queries': formatted_queries}), 200
+        view = request.args.get('view', 'mine')
+        page = inbox_page(view, current_user['email'], request.args)
+        queries, next_cursor = paginate(queries_collection, **page)
+        
+        formatted_queries = format_query.many(queries)
         
+        return jsonify({
+            'queries': formatted_queries,
+            'view': view,
+            'next_cursor': next_cursor,
+            'limit': page['limit']
+        }), 200
+        
+    except ValueError as e:
+        return jsonify({'msg': str(e)}), 400
     except Exception as e:
         print(f"❌ Error fetching queries: {str(e)}")
         return jsonify({'msg': 'Error fetching queries'}), 500
@@ -218,26 +496,49 @@ def assign_query(query_id):
         return jsonify({'msg': 'Access denied. Trainer role required.'}), 403
     
     try:
-        result = queries_collection.update_one(
-            {'_id': ObjectId(query_id)},
-            {
-                '$set': {
-                    'assigned_trainer': current_user['email'],
-                    'status': 'assigned',
-                    'updated_at': datetime.utcnow()
-                }
-            }
-        )
+        query = claim_query(ObjectId(query_id), current_user['email'])
         
-        if result.matched_count == 0:
-            return jsonify({'msg': 'Query not found'}), 404
+        if not query:
+            # Not claimable: missing, already ours (a retried request), or someone else's
+            query = queries_collection.find_one({'_id': ObjectId(query_id)})
+            if not query:
+                return jsonify({'msg': 'Query not found'}), 404
+            if query.get('assigned_trainer') != current_user['email']:
+                return jsonify({'msg': 'Query already claimed by another trainer'}), 409
         
-        return jsonify({'msg': 'Query assigned successfully'}), 200
+        trainer_stats_cache.delete(current_user['email'])
+        return jsonify({'msg': 'Query assigned successfully', 'query': format_query(query)}), 200
         
     except Exception as e:
         print(f"❌ Error assigning query: {str(e)}")
         return jsonify({'msg': 'Error assigning query'}), 500
 
+@trainer_bp.route('/queries/claim', methods=['POST'])
+@jwt_required()
+def claim_queries():
+    """Claim the next N open queries (highest priority first, roughly oldest first)"""
+    current_user = verify_trainer()
+    if not current_user:
+        return jsonify({'msg': 'Access denied. Trainer role required.'}), 403
+    
+    try:
+        count = parse_claim_count(request.get_json(silent=True) or {})
+        
+        claimed = claim_next_queries(current_user['email'], count)
+        
+        if claimed:
+            trainer_stats_cache.delete(current_user['email'])
+        return jsonify({
+            'msg': f'Claimed {len(claimed)} queries',
+            'queries': format_query.many(claimed)
+        }), 200
+        
+    except ValueError as e:
+        return jsonify({'msg': str(e)}), 400
+    except Exception as e:
+        print(f"❌ Error claiming queries: {str(e)}")
+        return jsonify({'msg': 'Error claiming queries'}), 500
+
 @trainer_bp.route('/queries/<query_id>/respond', methods=['POST'])
 @jwt_required()
 def respond_to_query(query_id):
@@ -274,6 +575,7 @@ def respond_to_query(query_id):
             }
         )
         
+        trainer_stats_cache.delete(current_user['email'])
         return jsonify({'msg': 'Response submitted successfully'}), 200
         
     except Exception as e:
@@ -291,49 +593,15 @@ def get_trainer_stats():
         return jsonify({'msg': 'Access denied. Trainer role required.'}), 403
     
     try:
-        # Get tutorial stats
-        total_tutorials = tutorials_collection.count_documents({'trainer_email': current_user['email']})
-        published_tutorials = tutorials_collection.count_documents({
-            'trainer_email': current_user['email'],
-            'status': 'published'
-        })
+        cached_stats = trainer_stats_cache.get(current_user['email'])
+        if cached_stats is not None:
+            return jsonify({'stats': cached_stats}), 200
         
-        # Get total views and likes
-        pipeline = [
-            {'$match': {'trainer_email': current_user['email']}},
-            {'$group': {
-                '_id': None,
-                'total_views': {'$sum': '$views'},
-                'total_likes': {'$sum': '$likes'}
-            }}
-        ]
-        
-        tutorial_stats = list(tutorials_collection.aggregate(pipeline))
-        total_views = tutorial_stats[0]['total_views'] if tutorial_stats else 0
-        total_likes = tutorial_stats[0]['total_likes'] if tutorial_stats else 0
-        
-        # Get query stats
-        total_queries = queries_collection.count_documents({'assigned_trainer': current_user['email']})
-        resolved_queries = queries_collection.count_documents({
-            'assigned_trainer': current_user['email'],
-            'status': 'resolved'
-        })
-        pending_queries = queries_collection.count_documents({
-            'assigned_trainer': current_user['email'],
-            'status': {'$in': ['assigned', 'open']}
-        })
-        
-        stats = {
-            'totalTutorials': total_tutorials,
-            'publishedTutorials': published_tutorials,
-            'totalViews': total_views,
-            'totalLikes': total_likes,
-            'totalQueries': total_queries,
-            'resolvedQueries': resolved_queries,
-            'pendingQueries': pending_queries,
-            'responseRate': round((resolved_queries / total_queries * 100) if total_queries > 0 else 0, 1)
-        }
+        tutorial_stats = list(tutorials_collection.aggregate(tutorial_stats_pipeline(current_user['email'])))
+        query_stats = list(queries_collection.aggregate(query_stats_pipeline(current_user['email'])))
+        stats = build_trainer_stats(tutorial_stats, query_stats)
         
+        trainer_stats_cache.set(current_user['email'], stats)
         return jsonify({'stats': stats}), 200
         
     except Exception as e:
@@ -344,72 +612,248 @@ def get_trainer_stats():
 
 @trainer_bp.route('/public/tutorials', methods=['GET'])
 def get_public_tutorials():
-    """Get all published tutorials (public access)"""
+    """Get published tutorials (public access), newest first, one page at a time,
+    optionally filtered by category, difficulty, tag or trainer"""
     try:
-        tutorials = list(tutorials_collection.find({'status': 'published'}))
-        
-        # Format tutorials
-        formatted_tutorials = []
-        for tutorial in tutorials:
-            formatted_tutorials.append({
-                'id': str(tutorial['_id']),
-                'title': tutorial['title'],
-                'description': tutorial['description'],
-                'category': tutorial['category'],
-                'difficulty': tutorial.get('difficulty', 'beginner'),
-                'duration': tutorial.get('duration', ''),
-                'tags': tutorial.get('tags', []),
-                'videoUrl': tutorial.get('videoUrl', ''),
-                'imageUrl': tutorial.get('imageUrl', ''),
-                'trainer_name': tutorial.get('trainer_name', 'Anonymous'),
-                'created_at': tutorial['created_at'].isoformat() if tutorial.get('created_at') else '',
-                'views': tutorial.get('views', 0),
-                'likes': tutorial.get('likes', 0)
-            })
+        cache_key = request_cache_key()
+        cached = public_cache.get(TUTORIAL_LIST_GROUP, cache_key)
+        if cached:
+            etag, payload = cached
+            return etag_response(payload, etag)
+        
+        limit = parse_limit(request.args.get('limit'))
+        fields = parse_fields(request.args.get('fields'), PUBLIC_TUTORIAL_SUMMARY_FIELDS)
+        cursor = request.args.get('cursor')
+        tutorials, next_cursor = paginate(
+            tutorials_collection,
+            build_catalogue_filter(request.args),
+            cursor=cursor,
+            limit=limit,
+            projection=tutorial_projection(fields)
+        )
         
-        return jsonify({'tutorials': formatted_tutorials}), 200
+        formatted_tutorials = tutorial_formatter(tuple(fields)).many(tutorials)
         
+        payload = {
+            'tutorials': formatted_tutorials,
+            'next_cursor': next_cursor,
+            'limit': limit
+        }
+        # ?include=facets: filter sidebar counts with the first page, no extra request
+        if request.args.get('include') == 'facets' and not cursor:
+            payload['facets'] = get_catalogue_facets()[1]['facets']
+        etag = public_cache.set(TUTORIAL_LIST_GROUP, cache_key, payload)
+        return etag_response(payload, etag)
+        
+    except ValueError as e:
+        return jsonify({'msg': str(e)}), 400
     except Exception as e:
         print(f"❌ Error fetching public tutorials: {str(e)}")
         return jsonify({'msg': 'Error fetching tutorials'}), 500
 
+@trainer_bp.route('/public/tutorials/facets', methods=['GET'])
+def get_public_tutorial_facets():
+    """Counts of published tutorials per category, difficulty, tag and trainer"""
+    try:
+        etag, payload = get_catalogue_facets()
+        return etag_response(payload, etag)
+        
+    except Exception as e:
+        print(f"❌ Error fetching tutorial facets: {str(e)}")
+        return jsonify({'msg': 'Error fetching tutorial facets'}), 500
+
+def ranked_tutorials_filter(items):
+    """One indexed _id lookup for a page of ranking items"""
+    return {'_id': {'$in': [item['id'] for item in items]}, 'status': 'published'}
+
+def format_ranked_tutorials(items, tutorials, fields):
+    """Format the looked-up tutorials in ranking order, with their scores"""
+    tutorials = {tutorial['_id']: tutorial for tutorial in tutorials}
+    formatter = tutorial_formatter(tuple(fields))
+    return [dict(formatter(tutorials[item['id']]), score=item['score']) for item in items if item['id'] in tutorials]
+
+@trainer_bp.route('/public/tutorials/trending', methods=['GET'])
+def get_trending_tutorials():
+    """Trending (time-decayed) or most popular this week, read from the precomputed rankings"""
+    try:
+        cache_key = 'trending:' + request_cache_key()
+        cached = public_cache.get(TUTORIAL_LIST_GROUP, cache_key)
+        if cached:
+            etag, payload = cached
+            return etag_response(payload, etag)
+        
+        ranking = request.args.get('ranking', 'trending')
+        limit = parse_limit(request.args.get('limit'))
+        page = parse_page(request.args.get('page'))
+        fields = parse_fields(request.args.get('fields'), PUBLIC_TUTORIAL_SUMMARY_FIELDS)
+        items, total, computed_at = get_ranking_page(ranking, page, limit)
+        
+        tutorials = tutorials_collection.find(ranked_tutorials_filter(items), tutorial_projection(fields))
+        
+        payload = {
+            'tutorials': format_ranked_tutorials(items, tutorials, fields),
+            'ranking': ranking,
+            'total': total,
+            'page': page,
+            'limit': limit,
+            'pages': (total + limit - 1) // limit,
+            'computed_at': computed_at
+        }
+        etag = public_cache.set(TUTORIAL_LIST_GROUP, cache_key, payload)
+        return etag_response(payload, etag)
+        
+    except ValueError as e:
+        return jsonify({'msg': str(e)}), 400
+    except Exception as e:
+        print(f"❌ Error fetching trending tutorials: {str(e)}")
+        return jsonify({'msg': 'Error fetching trending tutorials'}), 500
+
+def format_search_results(tutorials, fields):
+    """Format search hits with their relevance scores"""
+    formatter = tutorial_formatter(tuple(fields))
+    return [dict(formatter(tutorial), score=round(tutorial['score'], 3)) for tutorial in tutorials]
+
+@trainer_bp.route('/public/tutorials/search', methods=['GET'])
+def search_public_tutorials():
+    """Full-text search over published tutorials, ranked by relevance, with facets"""
+    try:
+        text = (request.args.get('q') or '').strip()
+        if not text:
+            return jsonify({'msg': 'q is required'}), 400
+        
+        cache_key = 'search:' + request_cache_key()
+        cached = public_cache.get(TUTORIAL_LIST_GROUP, cache_key)
+        if cached:
+            etag, payload = cached
+            return etag_response(payload, etag)
+        
+        limit = parse_limit(request.args.get('limit'))
+        page = parse_page(request.args.get('page'))
+        fields = parse_fields(request.args.get('fields'), PUBLIC_TUTORIAL_SUMMARY_FIELDS)
+        tutorials, total, facets = tutorial_search.search(
+            text,
+            category=request.args.get('category'),
+            difficulty=request.args.get('difficulty'),
+            page=page,
+            limit=limit,
+            projection=tutorial_projection(fields)
+        )
+        
+        payload = {
+            'tutorials': format_search_results(tutorials, fields),
+            'total': total,
+            'page': page,
+            'limit': limit,
+            'pages': (total + limit - 1) // limit,
+            'facets': facets
+        }
+        etag = public_cache.set(TUTORIAL_LIST_GROUP, cache_key, payload)
+        return etag_response(payload, etag)
+        
+    except ValueError as e:
+        return jsonify({'msg': str(e)}), 400
+    except Exception as e:
+        print(f"❌ Error searching tutorials: {str(e)}")
+        return jsonify({'msg': 'Error searching tutorials'}), 500
+
+def count_view(tutorial_id, payload):
+    """Count a view (written back in batches by tutorial_counters) and return the
+    detail payload with the stored counts plus the increments still buffered"""
+    tutorial_counters.increment(tutorial_id, 'views')
+    record_activity(tutorial_id, 'views')
+    return dict(payload, tutorial=dict(
+        payload['tutorial'],
+        views=payload['tutorial']['views'] + tutorial_counters.pending(tutorial_id, 'views'),
+        likes=payload['tutorial']['likes'] + tutorial_counters.pending(tutorial_id, 'likes')
+    ))
+
+def count_like(tutorial_id, amount=1):
+    """Count a like (or, with -1, an unlike) towards the stored count and the rankings"""
+    tutorial_counters.increment(tutorial_id, 'likes', amount)
+    record_activity(tutorial_id, 'likes', amount)
+
 @trainer_bp.route('/public/tutorials/<tutorial_id>', methods=['GET'])
 def get_tutorial_details(tutorial_id):
     """Get tutorial details and increment view count"""
     try:
-        tutorial = tutorials_collection.find_one({'_id': ObjectId(tutorial_id), 'status': 'published'})
+        object_id = ObjectId(tutorial_id)
+        cached = public_cache.get(TUTORIAL_DETAIL_GROUP, tutorial_id)
+        if cached:
+            payload = cached[1]
+        else:
+            tutorial = tutorials_collection.find_one({'_id': object_id, 'status': 'published'})
+            
+            if not tutorial:
+                return jsonify({'msg': 'Tutorial not found'}), 404
+            
+            # Cached with the stored counts; pending views/likes are added per request
+            payload = {'tutorial': format_tutorial_details(tutorial, tutorial.get('views', 0))}
+            public_cache.set(TUTORIAL_DETAIL_GROUP, tutorial_id, payload)
         
+        payload = count_view(object_id, payload)
+        # The ETag must cover the live counts actually sent, not the cached body
+        return etag_response(payload, compute_etag(payload))
+        
+    except Exception as e:
+        print(f"❌ Error fetching tutorial details: {str(e)}")
+        return jsonify({'msg': 'Error fetching tutorial'}), 500
+
+def live_likes(tutorial):
+    """Stored like count plus increments still waiting in the buffer"""
+    return tutorial.get('likes', 0) + tutorial_counters.pending(tutorial['_id'], 'likes')
+
+@trainer_bp.route('/public/tutorials/<tutorial_id>/like', methods=['GET'])
+@jwt_required()
+def get_tutorial_like(tutorial_id):
+    """Whether the current user likes a tutorial"""
+    try:
+        tutorial = tutorials_collection.find_one({'_id': ObjectId(tutorial_id), 'status': 'published'}, {'likes': 1})
         if not tutorial:
             return jsonify({'msg': 'Tutorial not found'}), 404
         
-        # Increment view count
-        tutorials_collection.update_one(
-            {'_id': ObjectId(tutorial_id)},
-            {'$inc': {'views': 1}}
-        )
+        liked = has_liked(get_jwt_identity()['email'], tutorial['_id'])
+        return jsonify({'liked': liked, 'likes': live_likes(tutorial)}), 200
         
-        formatted_tutorial = {
-            'id': str(tutorial['_id']),
-            'title': tutorial['title'],
-            'description': tutorial['description'],
-            'content': tutorial['content'],
-            'category': tutorial['category'],
-            'difficulty': tutorial.get('difficulty', 'beginner'),
-            'duration': tutorial.get('duration', ''),
-            'tags': tutorial.get('tags', []),
-            'videoUrl': tutorial.get('videoUrl', ''),
-            'imageUrl': tutorial.get('imageUrl', ''),
-            'trainer_name': tutorial.get('trainer_name', 'Anonymous'),
-            'created_at': tutorial['created_at'].isoformat() if tutorial.get('created_at') else '',
-            'views': tutorial.get('views', 0) + 1,
-            'likes': tutorial.get('likes', 0)
-        }
+    except Exception as e:
+        print(f"❌ Error fetching like: {str(e)}")
+        return jsonify({'msg': 'Error fetching like'}), 500
+
+@trainer_bp.route('/public/tutorials/<tutorial_id>/like', methods=['POST'])
+@jwt_required()
+def like_tutorial(tutorial_id):
+    """Like a tutorial (idempotent: liking twice counts once)"""
+    try:
+        tutorial = tutorials_collection.find_one({'_id': ObjectId(tutorial_id), 'status': 'published'}, {'likes': 1})
+        if not tutorial:
+            return jsonify({'msg': 'Tutorial not found'}), 404
         
-        return jsonify({'tutorial': formatted_tutorial}), 200
+        # Only the request whose insert wins the unique index changes the count
+        if add_like(get_jwt_identity()['email'], tutorial['_id']):
+            count_like(tutorial['_id'])
+        
+        return jsonify({'liked': True, 'likes': live_likes(tutorial)}), 200
         
     except Exception as e:
-        print(f"❌ Error fetching tutorial details: {str(e)}")
-        return jsonify({'msg': 'Error fetching tutorial'}), 500
+        print(f"❌ Error liking tutorial: {str(e)}")
+        return jsonify({'msg': 'Error liking tutorial'}), 500
+
+@trainer_bp.route('/public/tutorials/<tutorial_id>/like', methods=['DELETE'])
+@jwt_required()
+def unlike_tutorial(tutorial_id):
+    """Remove the current user's like (idempotent)"""
+    try:
+        tutorial = tutorials_collection.find_one({'_id': ObjectId(tutorial_id), 'status': 'published'}, {'likes': 1})
+        if not tutorial:
+            return jsonify({'msg': 'Tutorial not found'}), 404
+        
+        if remove_like(get_jwt_identity()['email'], tutorial['_id']):
+            count_like(tutorial['_id'], -1)
+        
+        return jsonify({'liked': False, 'likes': live_likes(tutorial)}), 200
+        
+    except Exception as e:
+        print(f"❌ Error unliking tutorial: {str(e)}")
+        return jsonify({'msg': 'Error unliking tutorial'}), 500
 
 @trainer_bp.route('/public/queries', methods=['POST'])
 @jwt_required()
@@ -423,27 +867,14 @@ def submit_query():
         if not data.get('title') or not data.get('description'):
             return jsonify({'msg': 'Title and description are required'}), 400
         
-        query = {
-            'title': data['title'],
-            'description': data['description'],
-            'category': data.get('category', 'general'),
-            'priority': data.get('priority', 'medium'),
-            'user_email': current_user['email'],
-            'user_name': data.get('user_name', current_user['email'].split('@')[0]),
-            'assigned_trainer': None,
-            'status': 'open',
-            'response': '',
-            'created_at': datetime.utcnow(),
-            'updated_at': datetime.utcnow(),
-            'responded_at': None
-        }
+        query = build_query(data, current_user)
         
         result = queries_collection.insert_one(query)
         query['_id'] = str(result.inserted_id)
         
         return jsonify({
             'msg': 'Query submitted successfully',
-            'query': query
+            'query': http_dates(query)
         }), 201
         
     except Exception as e:
@@ -452,44 +883,49 @@ def submit_query():
 
 # TRAINER APPLICATION MANAGEMENT ROUTES (Admin only)
 
+# Applications are listed per status, newest first, from one compound index.
+# The summary counts come from the counters document kept by admin_stats.py
+# (updated on submit and review) instead of a scan on every page load.
+
+def applications_query(statuses):
+    """Mongo filter for the selected application statuses"""
+    return {'status': statuses[0] if len(statuses) == 1 else {'$in': statuses}}
+
+def applications_page(statuses, args):
+    """paginate() arguments for one page of applications, from the request args"""
+    return {
+        'query': applications_query(statuses),
+        'cursor': args.get('cursor'),
+        'limit': parse_limit(args.get('limit')),
+        'sort_field': 'applied_at',
+        'projection': {'password': 0},
+        'hint': APPLICATIONS_INDEX
+    }
+
 @trainer_bp.route('/applications', methods=['GET'])
 def get_trainer_applications():
-    """Get all trainer applications for admin dashboard"""
+    """Trainer applications for the admin dashboard, filtered by ?status=,
+    newest first, one page at a time, with per-status counts"""
     try:
-        # Get all applications, excluding password field
-        applications = list(trainer_applications_collection.find({}, {'password': 0}))
+        statuses = parse_statuses(request.args.get('status'), APPLICATION_STATUSES)
+        page = applications_page(statuses, request.args)
+        applications, next_cursor = paginate(trainer_applications_collection, **page)
+        counts = get_application_counts()
         
         # Format applications for frontend
-        formatted_applications = []
-        for app in applications:
-            formatted_app = {
-                'id': str(app['_id']),
-                'firstName': app.get('firstName', ''),
-                'lastName': app.get('lastName', ''),
-                'email': app['email'],
-                'phone': app.get('phone', ''),
-                'dateOfBirth': app.get('dateOfBirth', ''),
-                'gender': app.get('gender', ''),
-                'experience': app.get('experience', ''),
-                'certifications': app.get('certifications', ''),
-                'specializations': app.get('specializations', ''),
-                'bio': app.get('bio', ''),
-                'motivation': app.get('motivation', ''),
-                'status': app['status'],
-                'applied_at': app['applied_at'].isoformat() if app.get('applied_at') else '',
-                'reviewed_at': app['reviewed_at'].isoformat() if app.get('reviewed_at') else None,
-                'reviewed_by': app.get('reviewed_by', ''),
-                'admin_notes': app.get('admin_notes', ''),
-                'rejection_reason': app.get('rejection_reason', '')
-            }
-            formatted_applications.append(formatted_app)
+        formatted_applications = format_application.many(applications)
         
         return jsonify({
             'success': True,
             'applications': formatted_applications,
-            'total': len(formatted_applications)
+            'next_cursor': next_cursor,
+            'limit': page['limit'],
+            'counts': counts,
+            'total': sum(counts[status] for status in statuses)
         }), 200
         
+    except ValueError as e:
+        return jsonify({'success': False, 'message': str(e)}), 400
     except Exception as e:
         print(f"❌ Error fetching trainer applications: {str(e)}")
         return jsonify({
@@ -497,6 +933,38 @@ def get_trainer_applications():
             'message': 'Error fetching applications'
         }), 500
 
+@trainer_bp.route('/applications/review', methods=['POST'])
+def review_trainer_applications():
+    """Approve or reject a batch of trainer applications in one transaction"""
+    from trainer_application import review_trainer_applications as review_func, review_request_error
+    
+    data = request.json or {}
+    error = review_request_error(data)
+    if error:
+        return jsonify({'success': False, 'message': error}), 400
+    
+    try:
+        result = review_func(
+            data['application_ids'],
+            data['action'],
+            data.get('admin_email', 'admin@fithub.com'),
+            admin_notes=data.get('admin_notes', ''),
+            rejection_reason=data.get('rejection_reason', 'No reason provided')
+        )
+        
+        if result['success']:
+            return jsonify(result), 200
+        else:
+            print(f"❌ Error reviewing applications: {result['message']}")
+            return jsonify(result), 500
+            
+    except Exception as e:
+        print(f"❌ Error reviewing applications: {str(e)}")
+        return jsonify({
+            'success': False,
+            'message': 'Error reviewing applications'
+        }), 500
+
 @trainer_bp.route('/applications/<application_id>/approve', methods=['POST'])
 def approve_trainer_application(application_id):
     """Approve a trainer application"""
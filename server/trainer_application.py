@@ -1,13 +1,36 @@
 from models import trainer_applications_collection, users_collection
+from admin_stats import record_user_created, record_application_submitted, record_applications_reviewed
+from mongo_connection import get_client
 from werkzeug.security import generate_password_hash
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError, OperationFailure
+from bson import ObjectId
+from bson.errors import InvalidId
 from datetime import datetime
 import re
 
+REVIEW_ACTIONS = ('approve', 'reject')
+MAX_REVIEW_BATCH = 500
+# Server error code for a transaction started on a standalone mongod
+ILLEGAL_OPERATION = 20
+
 def validate_email(email):
     """Validate email format"""
     pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
     return re.match(pattern, email) is not None
 
+def review_request_error(data):
+    """Validation message for a batch review request body, or None if it is valid"""
+    application_ids = data.get('application_ids')
+    if data.get('action') not in REVIEW_ACTIONS:
+        return f"action must be one of: {', '.join(REVIEW_ACTIONS)}"
+    if (not isinstance(application_ids, list) or not application_ids
+            or not all(isinstance(application_id, str) for application_id in application_ids)):
+        return 'application_ids must be a non-empty list of ids'
+    if len(application_ids) > MAX_REVIEW_BATCH:
+        return f'At most {MAX_REVIEW_BATCH} applications per review'
+    return None
+
 def validate_phone(phone):
     """Validate phone number format"""
     # Remove all non-digit characters
@@ -70,6 +93,7 @@ def submit_trainer_application(application_data):
         result = trainer_applications_collection.insert_one(application)
         
         if result.inserted_id:
+            record_application_submitted()
             return {
                 'success': True, 
                 'message': 'Trainer application submitted successfully! You will be notified once an admin reviews your application.',
@@ -105,6 +129,31 @@ def get_all_applications():
     except Exception as e:
         return {'success': False, 'message': f'Error fetching applications: {str(e)}'}
 
+def build_trainer_user(application, admin_email, now=None):
+    """Trainer account document for an approved application"""
+    now = now or datetime.utcnow()
+    return {
+        'email': application['email'],
+        'password': application['password'],  # Already hashed
+        'firstName': application['firstName'],
+        'lastName': application['lastName'],
+        'phone': application['phone'],
+        'dateOfBirth': application.get('dateOfBirth', ''),
+        'gender': application.get('gender', ''),
+        'role': 'trainer',
+        'status': 'active',
+        'createdAt': now,
+        
+        # Trainer-specific fields
+        'experience': application['experience'],
+        'certifications': application['certifications'],
+        'specializations': application.get('specializations', ''),
+        'bio': application.get('bio', ''),
+        'trainer_status': 'professional',  # Professional vs basic trainers
+        'approved_at': now,
+        'approved_by': admin_email
+    }
+
 def approve_trainer_application(application_id, admin_email, admin_notes=''):
     """Approve a trainer application and create trainer account"""
     try:
@@ -119,32 +168,14 @@ def approve_trainer_application(application_id, admin_email, admin_notes=''):
             return {'success': False, 'message': f'Application is already {application["status"]}'}
         
         # Create trainer user account
-        trainer_data = {
-            'email': application['email'],
-            'password': application['password'],  # Already hashed
-            'firstName': application['firstName'],
-            'lastName': application['lastName'],
-            'phone': application['phone'],
-            'dateOfBirth': application.get('dateOfBirth', ''),
-            'gender': application.get('gender', ''),
-            'role': 'trainer',
-            'status': 'active',
-            'createdAt': datetime.utcnow(),
-            
-            # Trainer-specific fields
-            'experience': application['experience'],
-            'certifications': application['certifications'],
-            'specializations': application.get('specializations', ''),
-            'bio': application.get('bio', ''),
-            'trainer_status': 'professional',  # Professional vs basic trainers
-            'approved_at': datetime.utcnow(),
-            'approved_by': admin_email
-        }
+        trainer_data = build_trainer_user(application, admin_email)
         
         # Insert trainer into users collection
         result = users_collection.insert_one(trainer_data)
         
         if result.inserted_id:
+            record_user_created('trainer', trainer_data['createdAt'])
+            
             # Update application status
             trainer_applications_collection.update_one(
                 {'_id': ObjectId(application_id)},
@@ -158,6 +189,7 @@ def approve_trainer_application(application_id, admin_email, admin_notes=''):
                     }
                 }
             )
+            record_applications_reviewed('approved')
             
             return {
                 'success': True, 
@@ -198,6 +230,7 @@ def reject_trainer_application(application_id, admin_email, rejection_reason, ad
         )
         
         if result.modified_count > 0:
+            record_applications_reviewed('rejected')
             return {
                 'success': True, 
                 'message': f'Application rejected. Reason: {rejection_reason}'
@@ -208,6 +241,157 @@ def reject_trainer_application(application_id, admin_email, rejection_reason, ad
     except Exception as e:
         return {'success': False, 'message': f'Error rejecting application: {str(e)}'}
 
+def review_trainer_applications(application_ids, action, admin_email, admin_notes='', rejection_reason=''):
+    """Approve or reject many applications in one transaction, with a result per id.
+    
+    Reads every application in one query, marks the pending ones reviewed with
+    one bulk_write and creates the trainer accounts of the approved ones with
+    one insert_many, so either the whole batch is applied or none of it is.
+    Ids that are invalid, missing, already reviewed (including by a concurrent
+    review) or (for approvals) whose email already has an account are reported
+    as failed and left untouched.
+    
+    Multi-document transactions need a replica set or sharded cluster. On a
+    standalone mongod the same steps run without one: each application is
+    still only reviewed once, but a crash mid-batch can leave part of it
+    applied.
+    """
+    if action not in REVIEW_ACTIONS:
+        raise ValueError(f"action must be one of: {', '.join(REVIEW_ACTIONS)}")
+    
+    results = {}
+    object_ids = {}
+    for application_id in application_ids:
+        if application_id in results or application_id in object_ids:
+            continue
+        try:
+            object_ids[application_id] = ObjectId(application_id)
+        except (InvalidId, TypeError):
+            results[application_id] = {'success': False, 'message': 'Invalid application id'}
+    
+    def review(session):
+        now = datetime.utcnow()
+        outcome = {}
+        applications = {
+            doc['_id']: doc for doc in trainer_applications_collection.find(
+                {'_id': {'$in': list(object_ids.values())}}, session=session)
+        }
+        pending = []
+        for application_id, object_id in object_ids.items():
+            application = applications.get(object_id)
+            if not application:
+                outcome[application_id] = {'success': False, 'message': 'Application not found'}
+            elif application['status'] != 'pending':
+                outcome[application_id] = {'success': False, 'message': f'Application is already {application["status"]}'}
+            else:
+                pending.append((application_id, application))
+        
+        trainers = {}
+        if action == 'approve' and pending:
+            registered = {
+                doc['email'] for doc in users_collection.find(
+                    {'email': {'$in': [application['email'] for _, application in pending]}},
+                    {'email': 1}, session=session)
+            }
+            approvable = []
+            for application_id, application in pending:
+                if application['email'] in registered:
+                    outcome[application_id] = {'success': False, 'message': 'Email already registered'}
+                else:
+                    registered.add(application['email'])  # One account per email within the batch too
+                    approvable.append((application_id, application))
+            pending = approvable
+            # Ids are assigned up front so the applications can point at their accounts
+            trainers = {
+                application_id: dict(build_trainer_user(application, admin_email, now), _id=ObjectId())
+                for application_id, application in pending
+            }
+        
+        if pending:
+            status = 'approved' if action == 'approve' else 'rejected'
+            operations = []
+            for application_id, application in pending:
+                fields = {'status': status, 'reviewed_at': now, 'reviewed_by': admin_email, 'admin_notes': admin_notes}
+                if action == 'approve':
+                    fields['trainer_user_id'] = trainers[application_id]['_id']
+                else:
+                    fields['rejection_reason'] = rejection_reason
+                operations.append(UpdateOne({'_id': application['_id'], 'status': 'pending'}, {'$set': fields}))
+            result = trainer_applications_collection.bulk_write(operations, session=session)
+            if result.modified_count != len(operations):
+                # Some were reviewed concurrently: keep only the updates that matched
+                reviewed = {
+                    doc['_id'] for doc in trainer_applications_collection.find(
+                        {'_id': {'$in': [application['_id'] for _, application in pending]},
+                         'status': status, 'reviewed_at': now, 'reviewed_by': admin_email},
+                        {'_id': 1}, session=session)
+                }
+                for application_id, application in pending:
+                    if application['_id'] not in reviewed:
+                        outcome[application_id] = {'success': False, 'message': 'Application was reviewed concurrently'}
+                pending = [(application_id, application) for application_id, application in pending
+                           if application['_id'] in reviewed]
+            
+            if action == 'approve' and pending:
+                pending = _insert_trainers(pending, trainers, outcome, session)
+            for application_id, _ in pending:
+                outcome[application_id] = {'success': True, 'status': status}
+                if application_id in trainers:
+                    outcome[application_id]['trainer_id'] = str(trainers[application_id]['_id'])
+        return outcome, now
+    
+    try:
+        approved_at = None
+        if object_ids:
+            try:
+                with get_client().start_session() as session:
+                    outcome, approved_at = session.with_transaction(review)
+            except OperationFailure as e:
+                if e.code != ILLEGAL_OPERATION:
+                    raise
+                # Standalone mongod: transactions are unavailable, review without one
+                outcome, approved_at = review(None)
+            results.update(outcome)
+    except Exception as e:
+        return {'success': False, 'message': f'Error reviewing applications: {str(e)}'}
+    
+    ordered = [dict({'id': application_id}, **results[application_id]) for application_id in dict.fromkeys(application_ids)]
+    succeeded = sum(1 for result in ordered if result['success'])
+    if succeeded:
+        record_applications_reviewed('approved' if action == 'approve' else 'rejected', count=succeeded)
+    if action == 'approve' and succeeded:
+        record_user_created('trainer', approved_at, count=succeeded)
+    return {
+        'success': True,
+        'action': action,
+        'results': ordered,
+        'succeeded': succeeded,
+        'failed': len(ordered) - succeeded
+    }
+
+def _insert_trainers(approved, trainers, outcome, session):
+    """Create the accounts of the `approved` (application_id, application) pairs;
+    returns the pairs whose account was created"""
+    try:
+        users_collection.insert_many([trainers[application_id] for application_id, _ in approved],
+                                     ordered=False, session=session)
+        return approved
+    except BulkWriteError as e:
+        if session is not None:
+            raise  # The transaction is aborted; nothing of the batch is applied
+        # No transaction: an account was registered since the check, so put
+        # those applications back to pending instead of approving them
+        failed = {error['index'] for error in e.details.get('writeErrors', [])}
+        for index in failed:
+            application_id, application = approved[index]
+            trainer_applications_collection.update_one(
+                {'_id': application['_id'], 'trainer_user_id': trainers[application_id]['_id']},
+                {'$set': {'status': 'pending'},
+                 '$unset': {'reviewed_at': '', 'reviewed_by': '', 'admin_notes': '', 'trainer_user_id': ''}}
+            )
+            outcome[application_id] = {'success': False, 'message': 'Email already registered'}
+        return [pair for index, pair in enumerate(approved) if index not in failed]
+
 def get_application_status(email):
     """Check the status of a trainer application by email"""
     try:
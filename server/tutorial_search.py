@@ -0,0 +1,198 @@
+from index_specs import TEXT_INDEX_WEIGHTS
+from pymongo.errors import OperationFailure
+from collections import defaultdict
+import math
+import os
+import re
+import threading
+import time
+
+# Full-text search over published tutorials.
+#
+# The primary engine is a weighted Mongo text index (see index_specs.py),
+# queried with one aggregation that returns the requested page, the total and
+# the category/difficulty facet counts. Deployments without text index support
+# (or before the index is created) fall back to an in-process inverted index
+# built from the published catalogue and rebuilt every SEARCH_INDEX_TTL seconds
+# or after a tutorial write in this process.
+SEARCH_INDEX_TTL = float(os.getenv('SEARCH_INDEX_TTL', '300'))
+MAX_QUERY_LENGTH = 200
+
+# IndexNotFound ("text index required for $text query") and CommandNotSupported
+TEXT_SEARCH_UNAVAILABLE_CODES = {27, 115}
+
+STOPWORDS = {
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'how', 'in', 'is',
+    'it', 'of', 'on', 'or', 'the', 'to', 'with', 'your', 'you', 'my', 'i', 'do', 'what'
+}
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+
+
+def tokenize(value):
+    """Lowercase word tokens without stopwords, with plural 's' stripped"""
+    if not value:
+        return []
+    if isinstance(value, (list, tuple)):
+        value = ' '.join(str(item) for item in value)
+    tokens = []
+    for token in TOKEN_PATTERN.findall(str(value).lower()):
+        if token in STOPWORDS:
+            continue
+        if len(token) > 3 and token.endswith('s') and not token.endswith('ss'):
+            token = token[:-1]
+        tokens.append(token)
+    return tokens
+
+
+def facet_filters(category=None, difficulty=None):
+    """Filters for the results and for each facet (a facet ignores its own filter)"""
+    category_filter = {'category': category} if category else {}
+    difficulty_filter = {'difficulty': difficulty} if difficulty else {}
+    return dict(category_filter, **difficulty_filter), category_filter, difficulty_filter
+
+
+def text_search_pipeline(text, category=None, difficulty=None, page=1, limit=20, projection=None):
+    """One aggregation: ranked page, total and facet counts for a $text search"""
+    results_filter, category_filter, difficulty_filter = facet_filters(category, difficulty)
+    project = dict(projection or {}, category=1, difficulty=1, score={'$meta': 'textScore'})
+    return [
+        {'$match': {'$text': {'$search': text}, 'status': 'published'}},
+        {'$project': project},
+        {'$facet': {
+            'tutorials': [
+                {'$match': results_filter},
+                {'$sort': {'score': -1, '_id': -1}},
+                {'$skip': (page - 1) * limit},
+                {'$limit': limit}
+            ],
+            'total': [{'$match': results_filter}, {'$count': 'count'}],
+            'category': [
+                {'$match': difficulty_filter},
+                {'$group': {'_id': '$category', 'count': {'$sum': 1}}}
+            ],
+            'difficulty': [
+                {'$match': category_filter},
+                {'$group': {'_id': {'$ifNull': ['$difficulty', 'beginner']}, 'count': {'$sum': 1}}}
+            ]
+        }}
+    ]
+
+
+def facets_from_rows(rows):
+    """[{_id, count}] -> {value: count}, most common first"""
+    rows = sorted((row for row in rows if row['_id']), key=lambda row: -row['count'])
+    return {row['_id']: row['count'] for row in rows}
+
+
+class InvertedIndex:
+    """Weighted term -> document postings, scored with tf * idf"""
+
+    def __init__(self, weights=TEXT_INDEX_WEIGHTS):
+        self.weights = weights
+        self.docs = []
+        self.postings = defaultdict(dict)
+
+    def add(self, doc, stored):
+        """Index `doc`'s weighted fields and keep `stored` as the result document"""
+        position = len(self.docs)
+        self.docs.append(stored)
+        term_scores = defaultdict(float)
+        for field, weight in self.weights.items():
+            for term in tokenize(doc.get(field)):
+                term_scores[term] += weight
+        for term, score in term_scores.items():
+            self.postings[term][position] = score
+
+    def search(self, text):
+        """Return [(stored doc, score)] matching any query term, best first"""
+        scores = defaultdict(float)
+        for term in set(tokenize(text)):
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + len(self.docs) / len(postings))
+            for position, score in postings.items():
+                scores[position] += score * idf
+        matches = sorted(scores.items(), key=lambda item: self.docs[item[0]]['_id'], reverse=True)
+        matches.sort(key=lambda item: item[1], reverse=True)
+        return [(self.docs[position], score) for position, score in matches]
+
+
+class TutorialSearch:
+    """Search published tutorials via the text index, or the in-process fallback"""
+
+    def __init__(self, collection, stored_fields, rebuild_interval=SEARCH_INDEX_TTL):
+        self.collection = collection
+        self.stored_fields = stored_fields
+        self.rebuild_interval = rebuild_interval
+        self._index = None
+        self._built_at = 0.0
+        self._lock = threading.Lock()
+        self._text_unavailable_until = 0.0
+
+    def search(self, text, category=None, difficulty=None, page=1, limit=20, projection=None):
+        """Return (tutorials with a `score`, total, {'category': {...}, 'difficulty': {...}})"""
+        if len(text) > MAX_QUERY_LENGTH:
+            raise ValueError(f'q must be at most {MAX_QUERY_LENGTH} characters')
+        if time.monotonic() >= self._text_unavailable_until:
+            try:
+                return self._text_search(text, category, difficulty, page, limit, projection)
+            except OperationFailure as e:
+                if e.code not in TEXT_SEARCH_UNAVAILABLE_CODES:
+                    raise
+                print(f"⚠️  Text search unavailable ({e.code}), using in-process search index")
+                self._text_unavailable_until = time.monotonic() + self.rebuild_interval
+        return self._fallback_search(text, category, difficulty, page, limit)
+
+    def invalidate(self):
+        """Drop the fallback index so the next search rebuilds it"""
+        self._index = None
+
+    def _text_search(self, text, category, difficulty, page, limit, projection):
+        pipeline = text_search_pipeline(text, category, difficulty, page, limit, projection)
+        result = list(self.collection.aggregate(pipeline))[0]
+        total = result['total'][0]['count'] if result['total'] else 0
+        facets = {
+            'category': facets_from_rows(result['category']),
+            'difficulty': facets_from_rows(result['difficulty'])
+        }
+        return result['tutorials'], total, facets
+
+    def _fallback_search(self, text, category, difficulty, page, limit):
+        matches = self._get_index().search(text)
+        category_counts = defaultdict(int)
+        difficulty_counts = defaultdict(int)
+        results = []
+        for doc, score in matches:
+            doc_difficulty = doc.get('difficulty') or 'beginner'
+            in_category = not category or doc.get('category') == category
+            in_difficulty = not difficulty or doc_difficulty == difficulty
+            if in_difficulty and doc.get('category'):
+                category_counts[doc['category']] += 1
+            if in_category:
+                difficulty_counts[doc_difficulty] += 1
+            if in_category and in_difficulty:
+                results.append(dict(doc, score=score))
+        facets = {
+            'category': facets_from_rows({'_id': k, 'count': v} for k, v in category_counts.items()),
+            'difficulty': facets_from_rows({'_id': k, 'count': v} for k, v in difficulty_counts.items())
+        }
+        start = (page - 1) * limit
+        return results[start:start + limit], len(results), facets
+
+    def _get_index(self):
+        index = self._index
+        if index is not None and time.monotonic() - self._built_at < self.rebuild_interval:
+            return index
+        with self._lock:
+            if self._index is None or time.monotonic() - self._built_at >= self.rebuild_interval:
+                self._index = self._build_index()
+                self._built_at = time.monotonic()
+            return self._index
+
+    def _build_index(self):
+        projection = {field: 1 for field in list(TEXT_INDEX_WEIGHTS) + list(self.stored_fields)}
+        index = InvertedIndex()
+        for doc in self.collection.find({'status': 'published'}, projection):
+            index.add(doc, {field: doc[field] for field in doc if field in self.stored_fields or field == '_id'})
+        return index